@@ -3,8 +3,8 @@ from __future__ import annotations
 from typing import Literal
 
 from pytest import raises
-from typc import (Array, Struct, UInt8, UInt16, clone_type, sizeof, type_name,
-                  typeof)
+from typc import (Array, Padding, Struct, UInt8, UInt16, clone_type, sizeof,
+                  type_name, typeof)
 
 
 def test_array_init() -> None:
@@ -310,7 +310,7 @@ def test_typechecks_type_equal() -> None:
     arr2_v = Array(UInt16, 5)
     arr2_t = typeof(arr2_v)
 
-    assert arr1_t is not arr2_t
+    assert arr1_t is arr2_t
 
     assert not isinstance(arr2_t, arr1_t)
     assert issubclass(arr2_t, arr1_t)
@@ -318,3 +318,171 @@ def test_typechecks_type_equal() -> None:
     assert isinstance(arr2_v, arr1_t)
     with raises(TypeError):
         issubclass(arr2_v, arr1_t)  # type: ignore
+
+
+def test_array_atom_items_native() -> None:
+    array = Array(UInt16, 3, b'\x01\x00\x02\x00\x03\x00')
+    assert array[0] == 1
+    assert isinstance(array[1], int)
+    assert array[-1] == 3
+    assert list(array) == [1, 2, 3]
+
+    array[-1] = UInt16(0x1234)
+    assert bytes(array) == b'\x01\x00\x02\x00\x34\x12'
+
+    with raises(IndexError):
+        _ = array[3]
+    with raises(ValueError):
+        Array(UInt16, 3, b'\x01\x00')
+
+
+def test_array_large() -> None:
+    arr_t = Array[UInt8, Literal[65536]]
+    array = arr_t(bytes(range(256)) * 256)
+    assert array[65535] == 255
+    array[65535] = 0
+    assert bytes(array)[-2:] == b'\xfe\x00'
+    assert bytes(arr_t()) == bytes(65536)
+
+
+def test_array_complex_items_lazy() -> None:
+    class Pos(Struct):
+        x: UInt8
+        y: UInt8
+
+    class Holder(Struct):
+        items: Array[Pos, Literal[3]]
+
+    holder = Holder(b'\x01\x02\x03\x04\x05\x06')
+    array = holder.items
+    assert array[-1].y == 6
+    array[1].x = 7
+    assert bytes(array) == b'\x01\x02\x07\x04\x05\x06'
+    holder.items = ((8, 9), b'\x0a\x0b', Pos((12, 13)))
+    assert bytes(array) == b'\x08\x09\x0a\x0b\x0c\x0d'
+    assert (array[1].x, array[2].y) == (10, 13)
+    with raises(IndexError):
+        _ = array[3]
+
+
+def test_array_padding_cleared() -> None:
+    class Item(Struct):
+        value: UInt8
+        _pad: Padding[Literal[1]]
+
+    raw = b'\x01\xff\x02\xff'
+    assert bytes(Array(Item, 2, raw)) == b'\x01\x00\x02\x00'
+    array = Array(Item, 2, raw)
+    assert array[1].value == 2
+    assert bytes(array) == b'\x01\x00\x02\x00'
+
+    class Holder(Struct):
+        flag: UInt8
+        items: Array[Item, Literal[2]]
+
+    assert bytes(Holder(b'\x05' + raw)) == b'\x05\x01\x00\x02\x00'
+    holder = Holder(b'\x05' + raw)
+    assert holder.items[0].value == 1
+    assert bytes(holder) == b'\x05\x01\x00\x02\x00'
+
+
+def test_array_short_tuple_set() -> None:
+    class Pos(Struct):
+        x: UInt8
+        y: UInt8
+
+    class Holder(Struct):
+        head: UInt8
+        arr: Array(UInt16, 4)  # type: ignore
+        points: Array(Pos, 2)  # type: ignore
+
+    holder = Holder((1, (1, 2, 3, 4), ((5, 6), (7, 8))))
+    holder.arr = (7, )
+    assert [int(x) for x in holder.arr] == [7, 2, 3, 4]
+    holder.points = ((9, ), )
+    assert bytes(holder.points) == b'\x09\x06\x07\x08'
+
+    points = holder.points
+    holder.points = ((9, ), (10, ))
+    assert bytes(points) == b'\x09\x06\x0a\x08'
+
+    points = Array(Pos, 2, b'\x09\x02\x0a\x04')
+    points[0] = (11, )
+    assert bytes(points) == b'\x0b\x02\x0a\x04'
+    points = Array(Pos, 2, b'\x01\x02\x03\x04')
+    points[1] = (12, )
+    assert bytes(points) == b'\x01\x02\x0c\x04'
+
+
+def test_array_unpack_many() -> None:
+    array_t = Array[UInt16, Literal[2]]
+    data = b'\x01\x00\x02\x00\x03\x00\x04\x00'
+    arrays = array_t.unpack_many(data)
+    assert [list(item) for item in arrays] == [[1, 2], [3, 4]]
+    arrays[0][1] = 5
+    assert bytes(arrays[0]) == b'\x01\x00\x05\x00'
+    assert bytes(arrays[1]) == b'\x03\x00\x04\x00'
+
+    class Pos(Struct):
+        x: UInt8
+        y: UInt8
+
+    pos_array_t = Array[Pos, Literal[2]]
+    items = list(pos_array_t.iter_unpack(b'\x01\x02\x03\x04\x05\x06\x07\x08'))
+    assert items[1][0].x == 5
+    assert bytes(items[0]) == b'\x01\x02\x03\x04'
+
+    with raises(ValueError):
+        array_t.unpack_many(data[:6])
+
+
+def test_array_compact_spec() -> None:
+    class Pos(Struct):
+        x: UInt8
+        y: UInt16
+
+    arr_t = Array[UInt16, Literal[1000000]]
+    assert sizeof(arr_t) == 2000000
+    assert arr_t(b'\x01\x00' * 1000000)[999999] == 1
+
+    pos_arr_t = Array[Pos, Literal[100000]]
+    assert sizeof(pos_arr_t) == 300000
+    data = bytes(range(3)) * 100000
+    array = pos_arr_t(data)
+    assert array[99999].y == 0x0201
+    assert bytes(array) == data
+    for idx in range(100000):
+        array[idx].x = idx & 0xff
+    assert bytes(array) == b''.join(
+        bytes((idx & 0xff, 1, 2)) for idx in range(100000))
+
+    class Holder(Struct):
+        items: Array[Pos, Literal[2]]
+        flag: UInt8
+
+    holder = Holder(b'\x01\x02\x00\x03\x04\x00\x05')
+    assert holder.items[1].y == 4
+    assert holder.flag == 5
+    holder.items = b'\x06\x07\x00\x08\x09\x00'
+    holder.flag = 10
+    assert holder.items[0].y == 7
+    assert bytes(holder) == b'\x06\x07\x00\x08\x09\x00\x0a'
+
+
+def test_from_buffer_pack_into() -> None:
+    buffer = bytearray(b'\xff\x01\x00\x02\x00')
+    array = Array[UInt16, Literal[2]].from_buffer(buffer, 1)
+    assert tuple(array) == (1, 2)
+    array[0] = 3
+    assert buffer[1] == 1
+
+    nested = Array[Array[UInt8, Literal[2]], Literal[2]].from_buffer(buffer)
+    assert nested[1][1] == 2
+
+    out = bytearray(6)
+    array.pack_into(out, 2)
+    assert out == b'\x00\x00\x03\x00\x02\x00'
+    nested.pack_into(out)
+    assert out[:4] == b'\xff\x01\x00\x02'
+    with raises(ValueError):
+        Array[UInt16, Literal[2]].from_buffer(buffer, 2)
@@ -232,3 +232,13 @@ def test_shifted_in_union() -> None:
     assert union.field_a[7] == 0x34
     assert union.field_a[8] == 0x12
     assert bytes(union) == b'\x00\x00\x00\x00\x00\x00\x00\x34\x12'
+
+
+def test_changed_negative_index() -> None:
+    class Data(Union):
+        u32: UInt32
+        a4: Array[UInt8, Literal[4]]
+
+    data = Data()
+    data.a4[-1] = 0x12
+    assert data.u32 == 0x12000000
@@ -343,3 +343,25 @@ def test_inplace_operator() -> None:
     obj_4 += obj_6
     assert obj_4 is obj_4_bak
     assert obj_4 == 100
+
+
+def test_unpack_many() -> None:
+    data = b'\x01\x00\x02\x00\xff\xff'
+    assert UInt16.unpack_many(data) == [1, 2, 0xffff]
+    assert list(Int16.iter_unpack(bytearray(data))) == [1, 2, -1]
+    assert Float.unpack_many(b'\x00\x00\x80\x3f') == [1.0]
+    with raises(ValueError):
+        UInt16.unpack_many(b'\x00')
+
+
+def test_from_buffer_pack_into() -> None:
+    buffer = bytearray(b'\xff\x01\x02\x00\x00\x80\x3f')
+    assert UInt16.from_buffer(buffer, 1) == 0x0201
+    assert Int16.from_buffer(b'\xfe\xff') == -2
+    assert Float.from_buffer(buffer, 3) == 1.0
+    UInt16(0x1234).pack_into(buffer, 1)
+    assert buffer[:3] == b'\xff\x34\x12'
+    with raises(ValueError):
+        UInt16.from_buffer(buffer, 6)
+    with raises(ValueError):
+        UInt8(1).pack_into(buffer, -1)
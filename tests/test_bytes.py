@@ -338,3 +338,25 @@ def test_typechecks_type_another() -> None:
     assert not isinstance(bytes4_v, bytes8_t)
     with raises(TypeError):
         issubclass(bytes4_v, bytes8_t)  # type: ignore
+
+
+def test_fill_in_place() -> None:
+    data = Bytes(4, b'\x00\x00')
+    snapshot = bytes(data)
+    for idx in range(4):
+        data[idx] = bytes((idx + 1, ))
+    assert bytes(data) == b'\x01\x02\x03\x04'
+    assert snapshot == b'\x00\x00\x00\x00'
+    assert data[2] == b'\x03'
+
+    class Packet(Struct):
+        raw: Bytes[Literal[4]]
+
+    packet = Packet(b'\x01\x02\x03\x04')
+    raw = packet.raw
+    raw[0] = b'\x09'
+    assert bytes(packet) == b'\x09\x02\x03\x04'
+    packet.raw = b'\x05'
+    assert bytes(raw) == b'\x05\x00\x00\x00'
+    assert raw[1] == b'\x00'
+    assert bytes(Bytes(4, raw)) == b'\x05\x00\x00\x00'
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+from io import BytesIO
+from mmap import PAGESIZE
+from pathlib import Path
+from socket import socketpair
+from typing import Literal
+
+from pytest import raises
+from typc import (Array, Bytes, Struct, UInt8, UInt16, UInt32, Union, batch,
+                  query, sizeof)
+from typc.io import (BufferBinding, Field, Projection, RecordCursor,
+                     RecordFile)
+
+
+class Pos(Struct):
+    x: UInt16
+    y: UInt16
+
+
+def test_record_file_read(tmp_path: Path) -> None:
+    path = tmp_path / 'records.bin'
+    path.write_bytes(b'\x01\x00\x02\x00\x03\x00\x04\x00\x05\x00\x06\x00')
+    with RecordFile(path, Pos) as records:
+        assert len(records) == 3
+        assert records[0].x == 1
+        assert records[1].y == 4
+        assert records[-1].x == 5
+        assert [pos.y for pos in records] == [2, 4, 6]
+        assert [pos.x for pos in records[1:]] == [3, 5]
+        assert bytes(records[2]) == b'\x05\x00\x06\x00'
+        assert isinstance(records[0], Pos)
+        with raises(IndexError):
+            _ = records[3]
+        with raises(TypeError):
+            records[0].x = 7
+    assert len(records) == 0
+
+
+def test_record_file_types(tmp_path: Path) -> None:
+    path = tmp_path / 'records.bin'
+    path.write_bytes(b'\x01\x02\x03\x04')
+    with RecordFile(path, UInt16) as values:
+        assert list(values) == [0x0201, 0x0403]
+    with RecordFile(path, Array[UInt8, Literal[2]]) as arrays:
+        assert arrays[1][0] == 3
+    with RecordFile(path, UInt16, writable=True) as values:
+        assert values[0] == 0x0201
+        assert not isinstance(values[0], UInt16)
+        values[0] += 1
+        assert values[0] == 0x0202
+    assert path.read_bytes() == b'\x02\x02\x03\x04'
+
+
+def test_record_file_bad(tmp_path: Path) -> None:
+    path = tmp_path / 'records.bin'
+    path.write_bytes(b'')
+    with RecordFile(path, Pos) as records:
+        assert len(records) == 0
+        assert not list(records)
+    path.write_bytes(b'\x00\x00\x00')
+    with raises(ValueError):
+        RecordFile(path, Pos)
+    with raises(TypeError):
+        RecordFile(path, int)  # type: ignore
+
+
+class Entry(Struct):
+    pos: Pos
+    data: Array[UInt8, Literal[2]]
+
+
+def test_record_file_write(tmp_path: Path) -> None:
+    path = tmp_path / 'records.bin'
+    path.write_bytes(bytes(sizeof(Entry) * 4096))
+    with RecordFile(path, Entry, writable=True) as entries:
+        assert not entries.dirty_ranges()
+        entry = entries[1]
+        entry.pos.y = 0x1234
+        entry.data[1] = 7
+        assert entries[1].pos.y == 0x1234
+        entries[-1] = ((1, 2), (3, 4))
+        assert entries.dirty_ranges() == [
+            (0, PAGESIZE),
+            (len(entries) * sizeof(Entry) - PAGESIZE,
+             len(entries) * sizeof(Entry)),
+        ]
+        entries.flush()
+        assert not entries.dirty_ranges()
+    data = path.read_bytes()
+    assert data[6:12] == b'\x00\x00\x34\x12\x00\x07'
+    assert data[-6:] == b'\x01\x00\x02\x00\x03\x04'
+
+
+def test_buffer_binding() -> None:
+    buffer = bytearray(12)
+    binding = BufferBinding(buffer)
+    entry = binding.bind(Entry, 6)
+    entry.pos.x = 0x0102
+    entry.data = b'\x05\x06'
+    assert buffer == bytes(6) + b'\x02\x01\x00\x00\x05\x06'
+    assert binding.dirty_ranges() == [(0, 12)]
+    binding.store(Pos, 0, (7, 8))
+    assert buffer[:4] == b'\x07\x00\x08\x00'
+    binding.flush()
+    assert not binding.dirty_ranges()
+    with raises(ValueError):
+        binding.bind(Entry, 8)
+    assert binding.bind(UInt16, 0) == 7
+
+
+def test_buffer_binding_batch() -> None:
+    buffer = bytearray(PAGESIZE * 2)
+    binding = BufferBinding(buffer)
+    entry = binding.bind(Entry, PAGESIZE + 2)
+    with batch(entry):
+        entry.pos.y = 0x0304
+        entry.data[0] = 5
+        assert not binding.dirty_ranges()
+    assert buffer[PAGESIZE + 4:PAGESIZE + 7] == b'\x04\x03\x05'
+    assert binding.dirty_ranges() == [(PAGESIZE, PAGESIZE * 2)]
+
+
+def test_readinto() -> None:
+    class Data(Union):
+        pos: Pos
+        raw: Bytes[Literal[4]]
+
+    class Packet(Struct):
+        kind: UInt8
+        data: Data
+
+    stream = BytesIO(b'\x01\x00\x02\x00\x03\x00\x04\x00\x05')
+    pos = Pos()
+    assert pos.readinto(stream) == 4
+    assert (pos.x, pos.y) == (1, 2)
+    assert pos.readinto(stream) == 4
+    assert (pos.x, pos.y) == (3, 4)
+    with raises(EOFError):
+        pos.readinto(stream)
+    assert (pos.x, pos.y) == (5, 4)
+    assert pos.readinto(stream) == 0
+
+    packet = Packet()
+    data_pos = packet.data.pos
+    raw = packet.data.raw
+    assert raw.readinto(BytesIO(b'\x07\x00\x08\x00')) == 4
+    assert bytes(raw) == b'\x07\x00\x08\x00'
+    assert (data_pos.x, data_pos.y) == (7, 8)
+    assert bytes(packet) == b'\x00\x07\x00\x08\x00'
+    assert raw.readinto(BytesIO(b'\x09\x00\x0a\x00')) == 4
+    assert (data_pos.x, data_pos.y) == (9, 10)
+    assert bytes(packet) == b'\x00\x09\x00\x0a\x00'
+
+    array = Array[UInt16, Literal[2]].read(BytesIO(b'\x05\x00\x06\x00'))
+    assert tuple(array) == (5, 6)
+    assert UInt16.read(BytesIO(b'\x09\x00')) == 9
+    with raises(EOFError):
+        Pos.read(BytesIO(b''))
+
+    buffer = bytearray(6)
+    Pos.view(buffer, 2).readinto(BytesIO(b'\x01\x02\x03\x04'))
+    assert buffer == b'\x00\x00\x01\x02\x03\x04'
+
+
+def test_readinto_storage() -> None:
+    class Line(Struct):
+        start: Pos
+        end: Pos
+
+    line = Line()
+    start = line.start
+    assert line.readinto(BytesIO(bytes(range(8)))) == 8
+    assert (start.x, start.y) == (0x100, 0x302)
+    data = b'\x01\x00\x02\x00\x03\x00\x04\x00'
+    assert line.readinto(BytesIO(data)) == 8
+    assert line.start is start
+    assert (start.x, start.y, line.end.x, line.end.y) == (1, 2, 3, 4)
+    with raises(EOFError):
+        line.readinto(BytesIO(b'\x05\x00\x06'))
+    assert (start.x, start.y, line.end.x, line.end.y) == (5, 6, 3, 4)
+    assert bytes(line) == b'\x05\x00\x06\x00\x03\x00\x04\x00'
+    assert line.readinto(BytesIO(bytes(range(8)))) == 8
+    assert (start.x, line.end.y) == (0x100, 0x706)
+
+    array = Array[Pos, Literal[2]]()
+    first = array[0]
+    assert array.readinto(BytesIO(data)) == 8
+    assert (first.x, array[1].y) == (1, 4)
+    with raises(EOFError):
+        array.readinto(BytesIO(b'\x07\x00\x08\x00\x09'))
+    assert (first.x, first.y) == (7, 8)
+    assert bytes(array) == b'\x07\x00\x08\x00\x09\x00\x04\x00'
+
+    value = UInt16(0x1234)
+    with raises(EOFError):
+        value.readinto(BytesIO(b'\x78'))
+    assert value == 0x1278
+
+
+def test_recv_into() -> None:
+    sender, receiver = socketpair()
+    with sender, receiver:
+        data = Bytes(4)
+        sender.sendall(b'ab')
+        sender.sendall(b'cd')
+        assert data.recv_into(receiver) == 4
+        assert bytes(data) == b'abcd'
+        sender.sendall(b'\x01\x00\x02\x00')
+        pos = Pos()
+        assert pos.recv_into(receiver) == 4
+        assert (pos.x, pos.y) == (1, 2)
+
+
+def test_record_cursor() -> None:
+    buffer = bytearray(b'\x01\x00\x02\x00\x03\x00'
+                       b'\x04\x00\x05\x00\x06\x00')
+    cursor = Pos.cursor(buffer)
+    assert len(cursor) == 3
+    seen = []
+    for pos in cursor:
+        seen.append((pos.x, pos.y))
+    assert seen == [(1, 2), (3, 4), (5, 6)]
+    assert cursor.tell() == 2
+
+    first = cursor.seek(0)
+    assert first is cursor.seek(-1)
+    assert cursor.tell() == 2
+    assert first.x == 5
+    first.y = 7
+    assert buffer[10:] == b'\x07\x00'
+    with raises(IndexError):
+        cursor.seek(3)
+
+    arrays = Array[UInt8, Literal[2]].cursor(bytes(buffer))
+    assert [array[0] for array in arrays] == [1, 2, 3, 4, 5, 7]
+    assert arrays.seek(1)[0] == 2
+    assert not list(Pos.cursor(b''))
+    with raises(ValueError):
+        Pos.cursor(buffer[:5])
+    with raises(TypeError):
+        RecordCursor(UInt16, buffer)
+
+
+def test_projection() -> None:
+    class Data(Union):
+        u32: UInt32
+        raw: Bytes[Literal[4]]
+
+    class Record(Struct):
+        pos: Pos
+        skipped: Array[UInt8, Literal[8]]
+        data: Data
+        kind: UInt8
+
+    buffer = b''.join(
+        bytes(Record(((idx, idx + 1), 0, bytes((idx, 0, 0, 0)), idx * 2)))
+        for idx in range(3))
+    size = sizeof(Record)
+
+    projection = Record.project(['pos.y', 'kind'])
+    assert projection.fields() == ('pos.y', 'kind')
+    assert projection(buffer) == (1, 0)
+    assert projection.unpack_from(buffer, size) == (2, 2)
+    assert projection.unpack_many(buffer) == [(1, 0), (2, 2), (3, 4)]
+    assert projection(Record(buffer[size:2 * size])) == (2, 2)
+
+    reordered = Record.project(['kind', 'pos'])
+    assert list(reordered.iter_unpack(buffer))[2] == (4, b'\x02\x00\x03\x00')
+
+    overlapping = Record.project(['data.raw', 'pos.x', 'data.u32'])
+    assert overlapping.unpack_many(buffer)[1] == (b'\x01\x00\x00\x00', 1, 1)
+    assert overlapping(buffer, 2 * size) == (b'\x02\x00\x00\x00', 2, 2)
+
+    with raises(KeyError):
+        Record.project(['pos.z'])
+    with raises(ValueError):
+        Record.project([])
+    with raises(ValueError):
+        projection(buffer, 2 * size + 1)
+    with raises(ValueError):
+        projection.unpack_many(buffer[:-1])
+    with raises(TypeError):
+        Projection(Pos(), ['x'])
+
+
+def test_query(tmp_path: Path) -> None:
+    class Record(Struct):
+        kind: UInt8
+        pos: Pos
+        size: UInt16
+
+    buffer = b''.join(
+        bytes(Record((idx % 3, (idx, idx * 2), idx * 10))) for idx in range(6))
+    records = query(buffer, Record)
+    assert records.select('size') == [(idx * 10, ) for idx in range(6)]
+    assert records.indices() == list(range(6))
+
+    kind_1 = records.where(Field('kind') == 1)
+    assert kind_1.indices() == [1, 4]
+    assert kind_1.select('pos.y', 'size') == [(2, 10), (8, 40)]
+    assert records.where(lambda record: record.kind == 2).select('size') == [
+        (20, ), (50, )
+    ]
+    assert records.where(
+        (Field('kind') != 0) & ~(Field('pos.x') > 3)).indices() == [1, 2]
+    assert records.where((Field('kind') == 0) | (Field('size') >= 50)).indices(
+    ) == [0, 3, 5]
+    assert records.where(Field('pos.y') == Field('size')).indices() == [0]
+    assert records.where(Field('kind') == 1).where(
+        lambda record: record.pos.x > 1).select('pos.x') == [(4, )]
+    assert records.where(Field('pos') == bytes(Pos((5, 10)))).indices() == [5]
+    selected = records.where(Field('kind') == 2).select()
+    assert [record.size for record in selected] == [20, 50]
+    assert not query(b'', Record).where(Field('kind') == 1).select('kind')
+
+    path = tmp_path / 'records.bin'
+    path.write_bytes(buffer)
+    with RecordFile(path, Record) as record_file:
+        assert query(record_file).where(
+            Field('size') < 20).select('kind') == [(0, ), (1, )]
+
+    with raises(KeyError):
+        records.where(Field('bad') == 1).indices()
+    with raises(TypeError):
+        query(buffer)
+    with raises(ValueError):
+        query(buffer[:-1], Record)
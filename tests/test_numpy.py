@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from pytest import importorskip, raises
+from typc import (Array, Bytes, Float, Int16, Pointer32, Struct, UInt8,
+                  UInt16, UInt32, Union, create_struct, padded, query,
+                  shifted, sizeof)
+from typc.io import Field
+
+np = importorskip('numpy')
+
+
+class Pos(Struct):
+    x: UInt16
+    y: Int16
+
+
+Record = create_struct(
+    'Record', {
+        'pos': Pos,
+        'flags': padded(UInt8, 1),
+        'size': shifted(Float, 2),
+        'data': Array[Array[UInt8, Literal[2]], Literal[2]],
+        'name': Bytes[Literal[3]],
+        'ptr': Pointer32[UInt8],
+    })
+
+
+class Data(Union):
+    u32: UInt32
+    pos: Pos
+
+
+def test_struct_dtype() -> None:
+    dtype = Record.to_numpy_dtype()
+    assert dtype.itemsize == sizeof(Record)
+    assert dtype.names == ('pos', 'flags', 'size', 'data', 'name', 'ptr')
+    assert dtype.fields['pos'][1] == 0
+    assert dtype.fields['flags'][1] == 4
+    assert dtype.fields['size'][1] == 8
+    assert dtype.fields['size'][0] == np.dtype('<f4')
+    assert dtype.fields['data'][0].shape == (2, 2)
+    assert dtype.fields['pos'][0].fields['y'][0] == np.dtype('<i2')
+    assert dtype.fields['ptr'][0] == np.dtype('<u4')
+
+
+def test_union_dtype() -> None:
+    dtype = Data.to_numpy_dtype()
+    assert dtype.itemsize == 4
+    assert dtype.fields['u32'][1] == dtype.fields['pos'][1] == 0
+
+
+def test_decode_numpy() -> None:
+    buffer = bytearray(b'\x01\x00\xff\xff\x02\x00\x03\x00')
+    records = Pos.decode_numpy(buffer)
+    assert records.shape == (2, )
+    assert records['x'].tolist() == [1, 2]
+    assert records['y'].tolist() == [-1, 3]
+    records['x'][1] = 5
+    assert buffer[4] == 5
+
+    arrays = Array[UInt16, Literal[2]].decode_numpy(bytes(buffer))
+    assert arrays.shape == (2, 2)
+    assert arrays[1].tolist() == [5, 3]
+
+    with raises(ValueError):
+        Pos.decode_numpy(buffer[:6])
+
+
+def test_to_columns() -> None:
+    buffer = bytes(Pos((1, -2))) + bytes(Pos((3, -4)))
+    columns = Pos.to_numpy_columns(buffer)
+    assert isinstance(columns['x'], np.ndarray)
+    assert columns['x'].tolist() == [1, 3]
+    assert columns['y'].dtype == np.dtype('<i2')
+    assert columns['y'].tolist() == [-2, -4]
+    assert Record.to_numpy_columns(b'',
+                                   ['ptr'])['ptr'].dtype == np.dtype('<u4')
+    assert not isinstance(Pos.to_columns(buffer)['x'], np.ndarray)
+
+    buffer = bytes(Record(((1, 2), 3, 4.0, ((5, 6), (7, 8)), b'abc', 9)))
+    columns = Record.to_numpy_columns(buffer, ['name'])
+    assert columns['name'].dtype == np.dtype('S3')
+    assert columns['name'].tolist() == [b'abc']
+    columns = Record.to_numpy_columns(buffer)
+    assert 'name' in columns
+    assert columns['name'].tolist() == [b'abc']
+    assert columns['data[1][0]'].tolist() == [7]
+
+
+def test_query_vectorized() -> None:
+    buffer = b''.join(bytes(Pos(pos)) for pos in ((1, -2), (3, -4), (5, 6)))
+    records = query(buffer, Pos)
+    assert records.where((Field('x') > 1) & ~(Field('y') > 0)).indices() == [1]
+    assert records.where(Field('x') == 5).select('y') == [(6, )]
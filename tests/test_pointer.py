@@ -4,6 +4,7 @@ from pytest import raises
 from typc import (ForwardRef, Pointer16, Pointer32, Struct, UInt8, UInt16,
                   UInt32, UInt64, Union, Void, clone_type, sizeof, type_name,
                   typeof)
+from typc.pointer import _Pointer
 
 
 class SomeStruct(Struct):
@@ -18,6 +19,14 @@ def test_create_getitem_type() -> None:
     assert sizeof(ptr_t) == 4
 
 
+def test_sized_pointer_interned() -> None:
+    sized_t = Pointer32.__bases__[0]
+    assert _Pointer[UInt32, Void] is sized_t  # type: ignore
+    assert _Pointer[clone_type(UInt32), Void] is sized_t  # type: ignore
+    assert _Pointer[UInt16, Void] is Pointer16.__bases__[0]  # type: ignore
+    assert Pointer16.__bases__[0] is not sized_t
+
+
 def test_create_getitem_type_bad() -> None:
     ptr_t = Pointer32[int]  # type: ignore
     with raises(TypeError):
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Literal
 from typing_extensions import Annotated
 
 from pytest import raises
-from typc import (Padding, Shift, Struct, UInt8, UInt16, clone_type, offsetof,
-                  padded, shifted, sizeof, type_name, typeof)
+from typc import (Array, Bytes, Padding, Shift, Struct, UInt8, UInt16,
+                  clone_type, create_struct, offsetof, padded, shifted, sizeof,
+                  type_name, typeof)
 
 
 def test_struct_declaration_annotations() -> None:
@@ -667,3 +668,373 @@ def test_typechecks_type_another() -> None:
     assert not isinstance(pos1, Pos2)
     with raises(TypeError):
         issubclass(pos1, Pos2)  # type: ignore
+
+
+def test_lazy_partial_modifications() -> None:
+    class Pos(Struct):
+        x: UInt16
+        y: UInt16
+
+    class Rect(Struct):
+        point1: Pos
+        point2: Pos
+        flags: UInt8
+
+    class Scene(Struct):
+        rect: Rect
+
+    scene = Scene(b'\x01\x00\x02\x00\x03\x00\x04\x00\x05')
+    rect = scene.rect
+    assert rect.point2.y == 4
+    assert bytes(rect) == b'\x01\x00\x02\x00\x03\x00\x04\x00\x05'
+
+    rect.point2.x = 0x1234
+    assert bytes(rect) == b'\x01\x00\x02\x00\x34\x12\x04\x00\x05'
+    assert bytes(scene) == bytes(rect)
+
+    point2_ref = rect.point2
+    scene.rect = b'\x11\x00\x22\x00\x33\x00\x44\x00\x55'
+    assert point2_ref.x == 0x33
+    assert rect.point1.y == 0x22
+    assert rect.flags == 0x55
+    assert bytes(rect) == b'\x11\x00\x22\x00\x33\x00\x44\x00\x55'
+    assert bytes(scene) == bytes(rect)
+
+
+def test_lazy_tuple_init() -> None:
+    class Pos(Struct):
+        x: UInt16
+        y: UInt16
+
+    class Rect(Struct):
+        point1: Pos
+        point2: Pos
+
+    rect = Rect(((1, 2), Pos((3, 4))))
+    assert rect.point2.x == 3
+    assert bytes(rect) == b'\x01\x00\x02\x00\x03\x00\x04\x00'
+
+    with raises(ValueError):
+        Rect(b'\x00\x00')
+
+
+def test_short_tuple_set() -> None:
+    class Pos(Struct):
+        x: UInt8
+        y: UInt8
+        z: UInt8
+
+    class Line(Struct):
+        start: Pos
+        end: Pos
+
+    class Shape(Struct):
+        line: Line
+
+    line = Line(b'\x01\x02\x03\x04\x05\x06')
+    line.start = (9, )
+    assert bytes(line) == b'\x09\x02\x03\x04\x05\x06'
+
+    line = Line(b'\x01\x02\x03\x04\x05\x06')
+    assert line.start.z == 3
+    line.start = (9, )
+    assert (line.start.x, line.start.y, line.start.z) == (9, 2, 3)
+    assert bytes(line) == b'\x09\x02\x03\x04\x05\x06'
+
+    shape = Shape(b'\x01\x02\x03\x04\x05\x06')
+    shape.line = ((7, ), )
+    assert bytes(shape) == b'\x07\x02\x03\x04\x05\x06'
+    shape.line = ((8, ), )
+    assert shape.line.end.z == 6
+    assert bytes(shape.line) == b'\x08\x02\x03\x04\x05\x06'
+
+
+def test_padding_bytes_cleared() -> None:
+    class Data(Struct):
+        first: UInt8
+        _pad: Padding[Literal[1]]
+        second: Annotated[UInt8, Shift(1)]
+
+    class Outer(Struct):
+        data: Data
+        flags: UInt8
+
+    raw = b'\x01\xff\xff\x02'
+    assert bytes(Data(raw)) == b'\x01\x00\x00\x02'
+    data = Data(raw)
+    assert data.first == 1
+    assert bytes(data) == b'\x01\x00\x00\x02'
+    assert bytes(Data.from_buffer(raw)) == b'\x01\x00\x00\x02'
+    assert bytes(Outer(raw + b'\x03')) == b'\x01\x00\x00\x02\x03'
+    outer = Outer(raw + b'\x03')
+    assert outer.flags == 3
+    assert bytes(outer) == b'\x01\x00\x00\x02\x03'
+
+
+def test_codec_non_identifier_members() -> None:
+    struct_t = create_struct('struct_t', {
+        'first field': UInt8,
+        'class': UInt16,
+    })
+    holder_t = create_struct('holder_t', {'data': struct_t})
+    holder = holder_t(b'\x01\x02\x03')
+    data: Any = holder['data']
+    assert data['first field'] == 1
+    assert data['class'] == 0x0302
+    holder['data'] = (4, 5)
+    assert bytes(data) == b'\x04\x05\x00'
+
+
+def test_flattened_nested() -> None:
+    class Pos(Struct):
+        x: UInt16
+        y: UInt16
+
+    class Rect(Struct):
+        pos: Pos
+        size: Array[UInt8, Literal[2]]
+        pad: Padding[Literal[1]]
+
+    class Scene(Struct):
+        rects: Array[Rect, Literal[2]]
+        flags: UInt8
+
+    class World(Struct):
+        scene: Scene
+
+    raw = (b'\x01\x00\x02\x00\x03\x04\x00'
+           b'\x05\x00\x06\x00\x07\x08\x00\x09')
+    world = World(raw)
+    scene = world.scene
+    assert scene.rects[1].pos.y == 6
+    assert scene.rects[0].size[1] == 4
+    assert scene.flags == 9
+    assert bytes(scene) == raw
+
+    rect_ref = scene.rects[0]
+    pos_ref = rect_ref.pos
+    new_raw = (b'\x11\x00\x12\x00\x13\x14\x00'
+               b'\x15\x00\x16\x00\x17\x18\x00\x19')
+    world.scene = new_raw
+    assert pos_ref.x == 0x11
+    assert rect_ref.size[0] == 0x13
+    assert scene.rects[1].pos.x == 0x15
+    assert scene.flags == 0x19
+    assert bytes(scene) == new_raw
+
+    pos_ref.y = 0x1234
+    assert bytes(scene)[:4] == b'\x11\x00\x34\x12'
+    assert bytes(world)[:4] == b'\x11\x00\x34\x12'
+    world.scene = raw
+    assert (pos_ref.x, pos_ref.y, scene.rects[1].size[1]) == (1, 2, 8)
+    assert bytes(world) == raw
+
+    other = Scene(((((1, 2), (3, 4)), ((5, 6), (7, 8))), 9))
+    assert bytes(other) == raw
+
+
+def test_unpack_many() -> None:
+    class Pos(Struct):
+        x: UInt16
+        y: UInt16
+
+    class Record(Struct):
+        pos: Pos
+        flags: UInt8
+
+    data = bytearray(b'\x01\x00\x02\x00\x03\x04\x00\x05\x00\x06')
+    records = Record.unpack_many(data)
+    assert len(records) == 2
+    assert records[0].pos.y == 2
+    assert records[1].pos.x == 4
+    assert records[1].flags == 6
+    assert bytes(records[0]) == bytes(data[:5])
+
+    records[0].flags = 7
+    assert data[4] == 3
+
+    iterator = Record.iter_unpack(memoryview(data))
+    assert next(iterator).pos.x == 1
+    assert next(iterator).flags == 6
+    assert next(iterator, None) is None
+
+    assert not Record.unpack_many(b'')
+    with raises(ValueError):
+        Record.unpack_many(data[:7])
+
+
+def test_from_buffer_pack_into() -> None:
+    class Pos(Struct):
+        x: UInt16
+        y: UInt16
+
+    class Record(Struct):
+        pos: Pos
+        flags: UInt8
+        data: Array[UInt8, Literal[2]]
+
+    buffer = bytearray(b'\xff\x01\x00\x02\x00\x03\x04\x05')
+    record = Record.from_buffer(buffer, 1)
+    assert record.pos.y == 2
+    assert record.flags == 3
+    assert record.data[1] == 5
+    record.flags = 7
+    assert buffer[5] == 3
+
+    out = bytearray(9)
+    record.pack_into(out, 2)
+    assert out == b'\x00\x00\x01\x00\x02\x00\x07\x04\x05'
+    Record(b'\x01\x00\x02\x00\x03\x04\x05').pack_into(out)
+    assert out[:7] == b'\x01\x00\x02\x00\x03\x04\x05'
+    record.pos.pack_into(memoryview(out), 5)
+    assert out[5:] == b'\x01\x00\x02\x00'
+
+    with raises(ValueError):
+        Record.from_buffer(buffer, 2)
+    with raises(ValueError):
+        record.pack_into(out, 3)
+
+
+def test_to_columns() -> None:
+    class Pos(Struct):
+        x: UInt16
+        y: UInt8
+
+    class Record(Struct):
+        pos: Pos
+        data: Array[UInt8, Literal[2]]
+
+    buffer = b''.join(
+        bytes(Record(((idx, idx + 1), (idx * 2, idx * 3))))
+        for idx in range(3))
+    columns = Record.to_columns(buffer)
+    assert list(columns) == ['pos.x', 'pos.y', 'data[0]', 'data[1]']
+    assert list(columns['pos.x']) == [0, 1, 2]
+    assert list(columns['pos.y']) == [1, 2, 3]
+    assert list(columns['data[1]']) == [0, 3, 6]
+
+    columns = Record.to_columns(memoryview(buffer), ['data', 'pos.y'])
+    assert list(columns) == ['data[0]', 'data[1]', 'pos.y']
+    assert list(columns['data[0]']) == [0, 2, 4]
+    assert not list(Record.to_columns(b'')['pos.x'])
+    with raises(KeyError):
+        Record.to_columns(buffer, ['pos.z'])
+    with raises(ValueError):
+        Record.to_columns(buffer[:4])
+
+
+def test_to_columns_bytes() -> None:
+    class Named(Struct):
+        value: UInt8
+        name: Bytes[Literal[3]]
+
+    buffer = bytes(Named((1, b'abc')))
+    assert list(Named.to_columns(buffer, ['value'])['value']) == [1]
+    with raises(TypeError, match="'name'"):
+        Named.to_columns(buffer, ['name'])
+    with raises(TypeError, match="'name'"):
+        Named.to_columns(buffer)
+
+
+def test_accessor_setter() -> None:
+    class Pos(Struct):
+        x: UInt16
+        y: UInt16
+
+    class Record(Struct):
+        kind: UInt8
+        points: Array[Pos, Literal[2]]
+
+    get_y = Record.accessor('points[1].y')
+    set_y = Record.setter('points[1].y')
+    get_point = Record.accessor('points[0]')
+
+    buffer = bytearray(b'\xff\x01\x01\x00\x02\x00\x03\x00\x04\x00')
+    assert get_y(buffer, 1) == 4
+    assert get_point(buffer, 1) == b'\x01\x00\x02\x00'
+    set_y(buffer, 5, 1)
+    assert buffer[-2:] == b'\x05\x00'
+
+    view = Record.view(buffer, 1)
+    assert get_y(view) == 5
+    set_y(view, 6)
+    assert view.points[1].y == 6
+
+    record = Record((1, ((2, 3), (4, 5))))
+    assert get_y(record) == 5
+    assert get_point(record) == b'\x02\x00\x03\x00'
+    set_y(record, 7)
+    assert record.points[1].y == 7
+    assert get_y(Record(bytes(record))) == 7
+
+    with raises(KeyError):
+        Record.accessor('points[2].y')
+    with raises(KeyError):
+        Record.setter('kind.x')
+
+
+def test_accessor_setter_decoded() -> None:
+    class Pos(Struct):
+        x: UInt16
+        y: UInt16
+
+    class Record(Struct):
+        kind: UInt8
+        points: Array[Pos, Literal[2]]
+        name: Bytes[Literal[2]]
+
+    class Outer(Struct):
+        head: UInt8
+        record: Record
+
+    get_y = Record.accessor('points[1].y')
+    set_y = Record.setter('points[1].y')
+    get_name = Record.accessor('name')
+    data = bytes(Record((1, ((2, 3), (4, 5)), b'ab')))
+
+    record = Record(data)
+    assert get_y(record) == 5
+    assert get_name(record) == b'ab'
+    set_y(record, 7)
+    assert get_y(record) == 7
+    assert record.points[1].y == 7
+    assert bytes(record) == data[:7] + b'\x07\x00' + data[9:]
+
+    record = Record(data)
+    assert record.kind == 1
+    set_y(record, 8)
+    assert get_y(record) == 8
+    assert record.points[1].x == 4
+    assert record.points[1].y == 8
+
+    outer = Outer((9, data))
+    inner: Any = outer.record
+    set_y(inner, 6)
+    assert get_y(inner) == 6
+    assert outer.record.points[1].y == 6
+    assert Outer.accessor('record.points[1].y')(outer) == 6
+    Outer.setter('record.kind')(outer, 3)
+    assert outer.record.kind == 3
+    assert bytes(outer) == b'\x09\x03' + data[1:7] + b'\x06\x00' + data[9:]
+
+
+def test_paths_large_array() -> None:
+    class Blob(Struct):
+        head: UInt16
+        data: Array[UInt8, Literal[1048576]]
+        tail: UInt16
+
+    buffer = bytearray(sizeof(Blob))
+    buffer[-2:] = b'\x01\x02'
+    set_item = Blob.setter('data[5]')
+    set_item(buffer, 9)
+    assert buffer[7] == 9
+    assert Blob.accessor('data[5]')(buffer) == 9
+    assert Blob.accessor('tail')(buffer) == 0x0201
+    assert Blob.project(['tail', 'head'])(buffer) == (0x0201, 0)
+    assert list(Blob.to_columns(buffer, ['tail'])['tail']) == [0x0201]
+
+    for path in ('data[1048576]', 'data.5', 'data[x]', 'head[0]', 'data[5',
+                 '.head', ''):
+        with raises(KeyError):
+            Blob.accessor(path)
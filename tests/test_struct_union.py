@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typc import Struct, UInt8, UInt16, UInt32, Union
+from typing import Literal
+
+from typc import Array, Struct, UInt8, UInt16, UInt32, Union, batch
 
 
 def test_struct_as_member() -> None:
@@ -311,3 +313,109 @@ def test_shifted_in_union() -> None:
 
     assert union.field_b.field3_4 == 0x1200
     assert bytes(union) == b'\x00\x00\x00\x00\x00\x00\x00\x12\x00'
+
+
+def test_notifications_only_under_union() -> None:
+    class Pos(Struct):
+        x: UInt8
+        y: UInt8
+
+    class Rect(Struct):
+        pos: Pos
+        size: Pos
+
+    class SomeUnion(Union):
+        rect: Rect
+        raw: UInt32
+
+    class Scene(Struct):
+        rects: Array[Rect, Literal[2]]
+
+    rect = Rect(0)
+    pos = rect.pos
+    pos.x = 1
+    rect.size.y = 2
+    assert bytes(rect) == b'\x01\x00\x00\x02'
+
+    scene = Scene(0)
+    scene.rects[1].size.x = 3
+    pos = scene.rects[0].pos
+    pos.y = 4
+    assert bytes(scene) == b'\x00\x04\x00\x00\x00\x00\x03\x00'
+    assert bytes(scene.rects[1]) == b'\x00\x00\x03\x00'
+
+    union = SomeUnion(0)
+    size = union.rect.size
+    size.y = 0x12
+    assert union.raw == 0x12000000
+    union.raw = 0x34000000
+    assert size.y == 0x34
+    assert bytes(union.rect) == b'\x00\x00\x00\x34'
+
+
+def test_batch() -> None:
+    class Message(Struct):
+        kind: UInt8
+        flags: UInt8
+        length: UInt16
+
+    class Packet(Union):
+        message: Message
+        raw: UInt32
+
+    packet = Packet(0)
+    message = packet.message
+    with batch(message) as value:
+        assert value is message
+        value.kind = 1
+        value.length = 0x0302
+        assert packet.raw == 0
+    assert packet.raw == 0x03020001
+    assert bytes(packet) == b'\x01\x00\x02\x03'
+
+    with batch(message):
+        pass
+    assert packet.raw == 0x03020001
+
+    with batch(packet):
+        packet.message.flags = 4
+    assert packet.raw == 0x03020401
+
+
+def test_batch_root() -> None:
+    class Pos(Struct):
+        x: UInt8
+        y: UInt8
+
+    pos = Pos(0)
+    with batch(pos):
+        pos.x = 1
+    assert bytes(pos) == b'\x01\x00'
+
+
+def test_set_part_offset_index() -> None:
+    class Inner(Struct):
+        field1: UInt8
+        field2: UInt16
+        field3: UInt8
+        field4: UInt32
+
+    class SomeUnion(Union):
+        inner: Inner
+        raw16: UInt16
+        raw32: UInt32
+
+    union = SomeUnion(0)
+    inner = union.inner
+    assert inner.field4 == 0
+    union.raw32 = 0x44332211
+    assert inner.field1 == 0x11
+    assert inner.field2 == 0x3322
+    assert inner.field3 == 0x44
+    union.raw16 = 0xaabb
+    assert inner.field1 == 0xbb
+    assert inner.field2 == 0x33aa
+    assert union.raw32 == 0x4433aabb
+    inner.field3 = 0x55
+    assert union.raw32 == 0x5533aabb
+    assert union.raw16 == 0xaabb
@@ -4,8 +4,9 @@ from typing import Literal
 from typing_extensions import Annotated
 
 from pytest import raises
-from typc import (Padding, Shift, Struct, UInt8, UInt16, Union, clone_type,
-                  offsetof, padded, shifted, sizeof, type_name, typeof)
+from typc import (Padding, Shift, Struct, UInt8, UInt16, Union, as_buffer,
+                  clone_type, offsetof, padded, shifted, sizeof, type_name,
+                  typeof)
 
 
 def test_declaration_annotations() -> None:
@@ -672,3 +673,34 @@ def test_typechecks_type_another() -> None:
     assert not isinstance(union_a, UnionB)
     with raises(TypeError):
         issubclass(union_a, UnionB)  # type: ignore
+
+
+def test_set_keeps_storage() -> None:
+    class Data(Union):
+        u16: UInt16
+        u8: UInt8
+
+    class Packet(Struct):
+        data: Data
+
+    packet = Packet(b'\x01\x02')
+    data = packet.data
+    exported = as_buffer(data)
+    assert data.u8 == 1
+    data.u16 = 0x0403
+    assert bytes(data) == b'\x03\x04'
+    assert data.u8 == 3
+    assert exported == b'\x03\x04'
+    data.u8 = 5
+    assert (data.u16, bytes(data)) == (0x0405, b'\x05\x04')
+    assert bytes(packet) == b'\x05\x04'
+    packet.data = b'\x06\x07'
+    assert (data.u8, data.u16) == (6, 0x0706)
+    assert exported == b'\x06\x07'
+    packet.data = 0
+    assert bytes(data) == b'\x00\x00'
+    with raises(ValueError):
+        packet.data = b'\x05'
+    with raises(ValueError):
+        Data(b'\x05\x06\x07')
+    assert bytes(data) == b'\x00\x00'
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import sys
+from gc import collect
+from hashlib import sha256
+from typing import Literal
+from weakref import ref
+
 from pytest import raises
-from typc import (Struct, UInt8, UInt16, clone_type, offsetof, rename, sizeof,
-                  type_name, typeof)
+from typc import (Array, Bytes, ForwardRef, Padding, Pointer32, Struct, UInt8,
+                  UInt16, Union, as_buffer, clone_type, offsetof, rename,
+                  sizeof, type_name, typeof)
 
 
 def test_sizeof_type() -> None:
@@ -50,6 +57,48 @@ def test_typeof_bad() -> None:
         _ = typeof('Invalid value')  # type: ignore
 
 
+def test_offsetof_path() -> None:
+    class Pos(Struct):
+        x: UInt8
+        y: UInt16
+
+    class Data(Union):
+        raw: Bytes[Literal[6]]
+        points: Array[Pos, Literal[2]]
+
+    class Record(Struct):
+        kind: UInt8
+        data: Data
+
+    assert offsetof(Record, 'data') == 1
+    assert offsetof(Record, 'data.points') == 1
+    assert offsetof(Record, 'data.points[1].y') == 5
+    assert offsetof(Record(), 'data.points[0].x') == 1
+    assert offsetof(Data, 'points[1]') == 3
+    assert sizeof(Record, 'data.points[1]') == 3
+    assert sizeof(Record(), 'data.points') == 6
+    assert sizeof(Data, 'raw') == 6
+    with raises(KeyError):
+        offsetof(Record, 'data.points[2]')
+    with raises(KeyError):
+        sizeof(Record, 'bad')
+
+
+def test_offsetof_path_large_array() -> None:
+    class Blob(Struct):
+        head: UInt16
+        data: Array[Array[UInt16, Literal[1024]], Literal[1024]]
+
+    assert offsetof(Blob, 'data[5]') == 2 + 5 * 2048
+    assert offsetof(Blob, 'data[1023][1023]') == 2 + 1024 * 2048 - 2
+    assert sizeof(Blob, 'data[7]') == 2048
+    assert sizeof(Array[UInt16, Literal[1024]], '[3]') == 2
+    with raises(KeyError):
+        offsetof(Blob, 'data[1024]')
+    with raises(KeyError):
+        offsetof(Blob, 'data[0][1024]')
+
+
 def test_offsetof_bad() -> None:
     with raises(TypeError):
         _ = offsetof('Invalid value', 'bad_field')  # type: ignore
@@ -74,7 +123,7 @@ def test_rename() -> None:
     class SomeStruct(Struct):
         field: UInt8
 
-    rename(SomeStruct, 'AnotherName')
+    assert rename(SomeStruct, 'AnotherName') is SomeStruct
     assert type_name(SomeStruct) == 'AnotherName'
 
 
@@ -89,3 +138,114 @@ def test_rename_bad_name() -> None:
 
     with raises(TypeError):
         rename(SomeStruct, name=123)  # type: ignore
+
+
+def test_type_hash() -> None:
+    class Pos(Struct):
+        x: UInt8
+        y: UInt16
+
+    class Pos2(Struct):
+        x: UInt8
+        y: UInt16
+
+    class Other(Struct):
+        y: UInt8
+        x: UInt16
+
+    cache = {Pos: 1, UInt8: 2, Array[UInt8, Literal[2]]: 3}
+    assert cache[Pos2] == 1
+    assert Other not in cache
+    assert cache[clone_type(UInt8)] == 2
+    assert cache[Array[UInt8, Literal[2]]] == 3
+    assert Array[UInt8, Literal[3]] not in cache
+    assert hash(clone_type(Pos)) == hash(Pos)
+
+
+def test_anonymous_types_interned() -> None:
+    assert Array[UInt8, Literal[4]] is Array[UInt8, Literal[4]]
+    assert typeof(Array(UInt8, 4)) is Array[UInt8, Literal[4]]
+    assert Bytes[Literal[8]] is typeof(Bytes(8))
+    assert Pointer32[UInt8] is Pointer32[UInt8]
+    assert Pointer32[ForwardRef] is not Pointer32[ForwardRef]
+
+    named = clone_type(Array[UInt16, Literal[4]])
+    rename(named, 'named_t')
+    assert Array[UInt16, Literal[4]] is not named
+    assert type_name(Array[UInt16, Literal[4]]) == 'uint16_t[4]'
+
+
+def test_rename_interned() -> None:
+    class Holder(Struct):
+        arr: Array[UInt16, Literal[4]]
+        raw: Bytes[Literal[3]]
+        ptr: Pointer32[UInt8]
+
+    for member_type in (Array[UInt16, Literal[4]], Bytes[Literal[3]],
+                        Pointer32[UInt8]):
+        renamed = rename(member_type, 'renamed_t')
+        assert renamed is not member_type
+        assert renamed == member_type
+        assert type_name(renamed) == 'renamed_t'
+    assert type_name(Holder.arr) == 'uint16_t[4]'
+    assert type_name(Holder.raw) == 'char[3]'
+    assert type_name(Holder.ptr) == 'uint8_t *'
+
+
+def test_anonymous_types_cached() -> None:
+    array_ref = ref(Array[UInt16, Literal[77]])
+    bytes_ref = ref(Bytes[Literal[77]])
+    collect()
+    assert array_ref() is Array[UInt16, Literal[77]]
+    assert bytes_ref() is Bytes[Literal[77]]
+
+
+def test_as_buffer() -> None:
+    class Pos(Struct):
+        x: UInt8
+        y: UInt16
+
+    class Data(Union):
+        u16: UInt16
+        raw: Bytes[Literal[2]]
+
+    pos = Pos(b'\x01\x02\x03')
+    assert as_buffer(pos) == b'\x01\x02\x03'
+    pos.y = 0x0504
+    assert as_buffer(pos).tobytes() == b'\x01\x04\x05'
+    assert sha256(as_buffer(pos)).digest() == sha256(bytes(pos)).digest()
+
+    data = Data(b'\x01\x02')
+    buffer = as_buffer(data)
+    assert buffer.readonly
+    data.u16 = 0x0403
+    assert buffer == b'\x03\x04'
+
+    raw = Bytes(3, b'abc')
+    buffer = as_buffer(raw)
+    raw[1] = b'x'
+    assert buffer == b'axc'
+
+    arr = Array[UInt16, Literal[2]]((1, 2))
+    assert as_buffer(arr) == b'\x01\x00\x02\x00'
+
+    class Padded(Struct):
+        value: UInt8
+        _pad: Padding[Literal[1]]
+
+    raw_pos = b'\x01\x02\x03'
+    assert as_buffer(Pos(raw_pos)).obj is raw_pos
+    raw_points = b'\x01\x02\x03\x04\x05\x06'
+    points = Array[Pos, Literal[2]](raw_points)
+    assert as_buffer(points).obj is raw_points
+    assert points[1].x == 4
+    assert as_buffer(points) == raw_points
+    assert as_buffer(Padded(b'\x01\xff')) == b'\x01\x00'
+    assert as_buffer(Array[Padded, Literal[1]](b'\x01\xff')) == b'\x01\x00'
+    assert as_buffer(Pos.view(bytearray(b'\xff\x01\x02\x03'), 1)) == (
+        b'\x01\x02\x03')
+    with raises(TypeError):
+        as_buffer(Pos)  # type: ignore
+    if sys.version_info >= (3, 12):
+        assert memoryview(pos) == b'\x01\x04\x05'
+        assert bytearray(data) == b'\x03\x04'
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from pytest import raises
+from typc import (Array, Bytes, Pointer32, Struct, UInt8, UInt16, UInt32,
+                  Union, offsetof, sizeof, typeof)
+
+
+class Pos(Struct):
+    x: UInt16
+    y: UInt16
+
+
+class Rect(Struct):
+    pos: Pos
+    size: Array[UInt8, Literal[2]]
+    name: Bytes[Literal[3]]
+    ptr: Pointer32[UInt8]
+
+
+class Data(Union):
+    u32: UInt32
+    pos: Pos
+
+
+def test_view_read() -> None:
+    buffer = bytearray(b'\x11\x22\x33\x44\x01\x02abc\x78\x56\x34\x12')
+    rect = Rect.view(buffer)
+    assert rect.pos.x == 0x2211
+    assert rect.pos.y == 0x4433
+    assert rect.size[0] == 1
+    assert rect.size[-1] == 2
+    assert rect.name == b'abc'
+    assert rect.ptr == 0x12345678
+    assert bytes(rect) == bytes(buffer)
+    assert bytes(rect.pos) == b'\x11\x22\x33\x44'
+
+
+def test_view_write() -> None:
+    buffer = bytearray(sizeof(Rect))
+    rect = Rect.view(buffer)
+    rect.pos.x = 0x1234
+    rect.size[1] = 5
+    rect.name = b'ab'
+    rect.ptr = 0x11223344
+    assert buffer == b'\x34\x12\x00\x00\x00\x05ab\x00\x44\x33\x22\x11'
+
+    rect.pos = (1, 2)
+    assert buffer[:4] == b'\x01\x00\x02\x00'
+    rect['pos'] = Pos((3, 4))
+    assert buffer[:4] == b'\x03\x00\x04\x00'
+    rect.size = b'\x07\x08'
+    assert rect.size[0] == 7
+    rect.pos = 0
+    assert buffer[:4] == b'\x00\x00\x00\x00'
+
+
+def test_view_offset() -> None:
+    buffer = bytearray(b'\xff' * 2 + b'\x01\x00\x02\x00' + b'\xff' * 2)
+    pos = Pos.view(buffer, 2)
+    assert pos.x == 1
+    assert pos.y == 2
+    pos.y = 3
+    assert buffer == b'\xff\xff\x01\x00\x03\x00\xff\xff'
+
+    with raises(ValueError):
+        Pos.view(buffer, 6)
+    with raises(ValueError):
+        Pos.view(buffer, -1)
+
+
+def test_view_shared_memory() -> None:
+    buffer = bytearray(8)
+    first = Pos.view(buffer, 0)
+    arr = Array[UInt8, Literal[8]].view(memoryview(buffer))
+    first.x = 0x0102
+    assert arr[0] == 2
+    assert arr[1] == 1
+    arr[2] = 9
+    assert first.y == 9
+
+
+def test_view_union() -> None:
+    buffer = bytearray(4)
+    data = Data.view(buffer)
+    data.u32 = 0x12345678
+    assert data.pos.x == 0x5678
+    assert data.pos.y == 0x1234
+    data.pos.y = 0
+    assert data.u32 == 0x5678
+    assert offsetof(data, 'pos') == 0
+
+
+def test_view_isinstance() -> None:
+    buffer = bytearray(4)
+    pos = Pos.view(buffer)
+    assert isinstance(pos, Pos)
+    assert isinstance(pos, Struct)
+    assert typeof(pos) is Pos
+    assert sizeof(pos) == 4
+    assert list(pos) == ['x', 'y']
+    assert len(pos) == 2
+    assert 'x' in pos
+    assert isinstance(Data.view(buffer), Union)
+
+
+def test_view_bad_access() -> None:
+    buffer = bytearray(sizeof(Rect))
+    rect = Rect.view(buffer)
+    with raises(AttributeError):
+        _ = rect.bad_field  # type: ignore
+    with raises(KeyError):
+        _ = rect['bad_field']
+    with raises(IndexError):
+        _ = rect.size[2]
+    with raises(TypeError):
+        Pos.view(b'\x00\x00\x00\x00').x = 1
@@ -2,11 +2,13 @@ from .array import Array
 from .atoms import (Double, Float, Int8, Int16, Int32, Int64, Integer, Real,
                     UInt8, UInt16, UInt32, UInt64)
 from .bytes import Bytes
+from .io import query
 from .modifier import Padding, Shift, padded, shifted
 from .pointer import ForwardRef, Pointer16, Pointer32, Pointer64, Void
 from .structure import Struct, create_struct
 from .union import Union, create_union
-from .utils import clone_type, offsetof, rename, sizeof, type_name, typeof
+from .utils import (as_buffer, batch, clone_type, offsetof, rename, sizeof,
+                    type_name, typeof)
 
 __all__ = (
     'Array',
@@ -32,11 +34,14 @@ __all__ = (
     'UInt64',
     'Union',
     'Void',
+    'as_buffer',
+    'batch',
     'clone_type',
     'create_struct',
     'create_union',
     'offsetof',
     'padded',
+    'query',
     'rename',
     'shifted',
     'sizeof',
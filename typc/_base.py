@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import (Any, Iterator, Literal, Optional, Type, TypeVar, Union,
-                    overload)
+from mmap import mmap
+from socket import socket
+from typing import (Any, BinaryIO, Iterator, Literal, Optional, Type, TypeVar,
+                    Union, overload)
 
 SELF = TypeVar('SELF', bound='ContainerBase')
 CLASS = TypeVar('CLASS')
+BUFFER = Union[bytes, bytearray, memoryview, mmap]
 
 
 class BaseType:
@@ -30,6 +33,18 @@ class BaseType:
     def __bytes__(self) -> bytes:
         raise NotImplementedError
 
+    def __buffer__(self, flags: int) -> memoryview:
+        raise NotImplementedError
+
+    def pack_into(self, buffer: BUFFER, offset: int = 0) -> None:
+        raise NotImplementedError
+
+    def readinto(self, fileobj: BinaryIO) -> int:
+        raise NotImplementedError
+
+    def recv_into(self, sock: socket) -> int:
+        raise NotImplementedError
+
     def __typc_set__(self, value: Any) -> None:
         raise NotImplementedError
 
@@ -65,5 +80,12 @@ class ContainerBase(BaseType):
         ...  # mark as non-abstract for pylint
         raise NotImplementedError
 
+    def __getitem__(self, name: str) -> Any:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        raise NotImplementedError
+
     def __typc_set__(self, value: Any) -> None:
         raise NotImplementedError
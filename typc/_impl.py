@@ -1,24 +1,172 @@
 from __future__ import annotations
 
+import re
+import sys
+from array import array
+from collections import OrderedDict
+from importlib.util import find_spec
 from math import ceil, floor, trunc
-from operator import (add, and_, floordiv, ge, gt, invert, le, lshift, lt, mod,
-                      mul, neg, or_, pos, rshift, sub, truediv, xor)
+from operator import (add, and_, floordiv, ge, gt, invert, itemgetter, le,
+                      lshift, lt, mod, mul, neg, or_, pos, rshift, sub,
+                      truediv, xor)
 from struct import Struct as BuiltinStruct
-from typing import Any, Callable, Dict, Literal, Optional, Tuple, Union
-
-from ._utils import false_isinstance, false_issubclass
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Literal,
+                    Optional, Protocol, Tuple, TypeVar, Union)
+from weakref import WeakValueDictionary
+
+from ._utils import (buffer_size, check_buffer, check_records,
+                     false_isinstance, false_issubclass)
+
+
+TYPE = TypeVar('TYPE')
+
+RECENT_TYPES_LIMIT = 1024
+
+_SWAP_BYTES = sys.byteorder != 'little'
+
+NUMPY_AVAILABLE = find_spec('numpy') is not None
+
+_PATH = re.compile(r'(?:[^.\[\]]+|\[\d+\])(?:\.[^.\[\]]+|\[\d+\])*')
+_PATH_STEP = re.compile(r'\[(\d+)\]|([^.\[\]]+)')
+
+_interned_types: WeakValueDictionary[Tuple[Any, ...], Any]
+_interned_types = WeakValueDictionary()
+_recent_types: OrderedDict[Tuple[Any, ...], Any] = OrderedDict()
+
+
+def intern_type(key: Tuple[Any, ...], factory: Callable[..., TYPE],
+                *args: Any) -> TYPE:
+    interned = _recent_types.get(key)
+    if interned is not None:
+        _recent_types.move_to_end(key)
+        return interned
+    interned = _interned_types.get(key)
+    if interned is None:
+        interned = _interned_types[key] = factory(*args)
+    _recent_types[key] = interned
+    if len(_recent_types) > RECENT_TYPES_LIMIT:
+        _recent_types.popitem(last=False)
+    return interned
+
+
+def is_interned(typc_type: TypcType) -> bool:
+    key = typc_type.__typc_intern_key__()
+    return key is not None and _interned_types.get(key) is typc_type
+
+
+def path_steps(path: str) -> List[Union[str, int]]:
+    if not _PATH.fullmatch(path):
+        raise KeyError(path)
+    return [
+        int(index) if index else name
+        for index, name in _PATH_STEP.findall(path)
+    ]
+
+
+def resolve_path(typc_type: TypcType, path: str) -> Tuple[int, TypcType]:
+    offset = 0
+    for step in path_steps(path):
+        child = typc_type.__typc_child__(step)
+        if child is None:
+            raise KeyError(path)
+        child_offset, typc_type = child
+        offset += child_offset
+    return offset, typc_type
+
+
+def _collect_leaves(typc_type: TypcType, path: str, offset: int,
+                    out: List[Tuple[str, int, TypcType]]) -> None:
+    scalar = typc_type.__typc_scalar__()
+    if scalar is not None:
+        out.append((path, offset, scalar))
+        return
+    children = typc_type.__typc_children__()
+    if not children:
+        out.append((path, offset, typc_type))
+        return
+    for key, child_offset, child_type in children:
+        if isinstance(key, int):
+            child_path = f'{path}[{key}]'
+        else:
+            child_path = f'{path}.{key}' if path else key
+        _collect_leaves(child_type, child_path, offset + child_offset, out)
+
+
+def type_leaves(
+    typc_type: TypcType,
+    fields: Optional[Iterable[str]] = None,
+) -> List[Tuple[str, int, TypcType]]:
+    leaves: List[Tuple[str, int, TypcType]] = []
+    if fields is None:
+        _collect_leaves(typc_type, '', 0, leaves)
+        return leaves
+    for field in fields:
+        offset, field_type = resolve_path(typc_type, field)
+        _collect_leaves(field_type, field, offset, leaves)
+    return leaves
+
+
+def atom_typecode(atom_type: TypcAtomType) -> Optional[str]:
+    spec = atom_type.__typc_spec__.format
+    if spec in ('f', 'd'):
+        candidates = spec
+    elif spec.islower():
+        candidates = 'bhilq'
+    else:
+        candidates = 'BHILQ'
+    for typecode in candidates:
+        if array(typecode).itemsize == atom_type.__typc_size__:
+            return typecode
+    return None
+
+
+def atom_column(path: str, atom_type: TypcType, buffer: Any, offset: int,
+                stride: int, count: int) -> array[Any]:
+    if not isinstance(atom_type, TypcAtomType):
+        raise TypeError(f'Field {path!r} of type '
+                        f'{atom_type.__typc_get_name__()} has no array column')
+    typecode = atom_typecode(atom_type)
+    assert typecode is not None
+    item_size = atom_type.__typc_size__
+    data = bytearray(count * item_size)
+    with memoryview(buffer) as view, view.cast('B') as raw:
+        for idx in range(item_size):
+            data[idx::item_size] = raw[offset + idx::stride]
+    column = array(typecode)
+    column.frombytes(data)
+    if _SWAP_BYTES:
+        column.byteswap()
+    return column
+
+
+def numpy_column(path: str, leaf_type: TypcType, buffer: Any, offset: int,
+                 stride: int, count: int) -> Any:
+    # pylint: disable=unused-argument
+    from numpy import empty, ndarray  # pylint: disable=import-outside-toplevel
+    dtype = leaf_type.to_numpy_dtype()
+    if not count:
+        return empty(0, dtype)
+    return ndarray((count, ), dtype, buffer, offset, (stride, )).copy()
+
+
+class TypcParent(Protocol):
+    def __typc_changed__(self, source: TypcValue, data: bytes,
+                         offset: int) -> None:
+        ...
 
 
 class TypcType:
-    __slots__ = ('__typc_size__', '__typc_spec__', '__typc_name__')
+    __slots__ = ('__typc_size__', '__typc_spec__', '__typc_name__',
+                 '__typc_hash__', '__weakref__')
     __typc_spec__: BuiltinStruct
     __typc_size__: int
     __typc_name__: Optional[str]
+    __typc_hash__: int
 
     def __call__(
         self,
         values: Union[Literal[None], Literal[0], bytes] = None,
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> TypcValue:
         raise NotImplementedError
 
@@ -28,9 +176,90 @@ class TypcType:
     def __typc_clone__(self) -> TypcType:
         raise NotImplementedError
 
+    def __typc_load__(self, buffer: Any, offset: int) -> Any:
+        raise NotImplementedError
+
+    def __typc_store__(self, buffer: Any, offset: int, value: Any) -> None:
+        raise NotImplementedError
+
+    def __typc_leaf_format__(self) -> Tuple[str, int]:
+        return f'{self.__typc_size__}s', 1
+
+    def __typc_padding__(self) -> List[Tuple[int, int]]:
+        return []
+
+    def __typc_intern_key__(self) -> Optional[Tuple[Any, ...]]:
+        return None
+
+    def __typc_children__(self) -> List[Tuple[Any, int, TypcType]]:
+        return []
+
+    def __typc_child__(self, key: Any) -> Optional[Tuple[int, TypcType]]:
+        return None
+
+    def __typc_scalar__(self) -> Optional[TypcAtomType]:
+        return None
+
+    def __typc_record__(self, raw: Tuple[Any, ...]) -> Any:
+        return self(raw[0])
+
+    def from_buffer(self, buffer: Any, offset: int = 0) -> Any:
+        check_buffer(buffer, offset, self.__typc_size__)
+        return self.__typc_record__(
+            self.__typc_spec__.unpack_from(buffer, offset))
+
+    def iter_unpack(self, buffer: Any) -> Iterator[Any]:
+        check_records(buffer, self.__typc_size__)
+        return map(self.__typc_record__,
+                   self.__typc_spec__.iter_unpack(buffer))
+
+    def unpack_many(self, buffer: Any) -> List[Any]:
+        return list(self.iter_unpack(buffer))
+
+    def read(self, fileobj: Any) -> TypcValue:
+        value = self()
+        if not value.readinto(fileobj):
+            raise EOFError
+        return value
+
+    def to_numpy_dtype(self) -> Any:
+        from numpy import dtype  # pylint: disable=import-outside-toplevel
+        return dtype(f'V{self.__typc_size__}')
+
+    def decode_numpy(self, buffer: Any) -> Any:
+        from numpy import frombuffer  # pylint: disable=import-outside-toplevel
+        check_records(buffer, self.__typc_size__)
+        return frombuffer(buffer, self.to_numpy_dtype())
+
+    def __typc_columns__(self, buffer: Any, fields: Optional[Iterable[str]],
+                         make_column: Callable[..., Any]) -> Dict[str, Any]:
+        size = self.__typc_size__
+        check_records(buffer, size)
+        count = buffer_size(buffer) // size
+        columns: Dict[str, Any] = {}
+        for path, offset, leaf_type in type_leaves(self, fields):
+            columns[path] = make_column(path, leaf_type, buffer, offset, size,
+                                        count)
+        return columns
+
+    def to_columns(
+            self,
+            buffer: Any,
+            fields: Optional[Iterable[str]] = None) -> Dict[str, array[Any]]:
+        return self.__typc_columns__(buffer, fields, atom_column)
+
+    def to_numpy_columns(
+            self,
+            buffer: Any,
+            fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        return self.__typc_columns__(buffer, fields, numpy_column)
+
     def __eq__(self, obj: object) -> bool:
         raise NotImplementedError
 
+    def __hash__(self) -> int:
+        return self.__typc_hash__
+
     def __instancecheck__(self, instance: Any) -> bool:
         raise NotImplementedError
 
@@ -41,7 +270,7 @@ class TypcType:
 class TypcValue:
     __slots__ = ('__typc_type__', '__typc_child_data__')
     __typc_type__: TypcType
-    __typc_child_data__: Optional[Tuple[TypcValue, int]]
+    __typc_child_data__: Optional[Tuple[TypcParent, int]]
 
     def __typc_set__(self, value: Any) -> None:
         raise NotImplementedError
@@ -56,6 +285,77 @@ class TypcValue:
     def __bytes__(self) -> bytes:
         raise NotImplementedError
 
+    def __typc_buffer_source__(self) -> Any:
+        return bytes(self)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self.__typc_buffer_source__()).toreadonly()
+
+    def __typc_pack_into__(self, buffer: Any, offset: int) -> None:
+        size = self.__typc_type__.__typc_size__
+        buffer[offset:offset + size] = self.__typc_buffer_source__()
+
+    def pack_into(self, buffer: Any, offset: int = 0) -> None:
+        check_buffer(buffer, offset, self.__typc_type__.__typc_size__)
+        self.__typc_pack_into__(buffer, offset)
+
+    def __typc_fill_buffer__(self) -> Optional[Any]:
+        return None
+
+    def __typc_location__(self) -> Optional[Tuple[Any, int]]:
+        return None
+
+    def __typc_raw_buffer__(self) -> Any:
+        return None
+
+    def __typc_filled__(self, received: int) -> None:
+        pass
+
+    def __typc_fill__(self, read: Callable[[memoryview],
+                                           Optional[int]]) -> int:
+        size = self.__typc_type__.__typc_size__
+        storage = self.__typc_fill_buffer__()
+        in_place = storage is not None
+        if storage is None:
+            storage = bytearray(size)
+        received = 0
+        with memoryview(storage) as view, view.cast('B') as raw_view:
+            while received < size:
+                count = read(raw_view[received:])
+                if not count:
+                    break
+                received += count
+        if not received:
+            return 0
+        # A short read keeps the bytes received so far on both paths: the
+        # leading part of the value is replaced, the rest is left as is.
+        if in_place:
+            self.__typc_filled__(received)
+        elif received < size:
+            self.__typc_set_part__(bytes(storage[:received]), 0)
+        else:
+            self.__typc_set__(bytes(storage))
+        child_data = self.__typc_child_data__
+        if child_data is not None:
+            parent, self_offset = child_data
+            parent.__typc_changed__(self, bytes(self), self_offset)
+        if received < size:
+            raise EOFError
+        return received
+
+    def readinto(self, fileobj: Any) -> int:
+        return self.__typc_fill__(fileobj.readinto)
+
+    def recv_into(self, sock: Any) -> int:
+        return self.__typc_fill__(sock.recv_into)
+
+    def __typc_leaves__(self, out: List[Any]) -> None:
+        out.append(bytes(self))
+
+    def __typc_set_leaves__(self, leaves: Tuple[Any, ...], start: int,
+                            data: bytes, offset: int) -> None:
+        self.__typc_set__(leaves[start])
+
 
 class TypcAtomBaseMeta(type):
     __typc_native__: type
@@ -99,16 +399,19 @@ class TypcAtomBase(type, metaclass=TypcAtomBaseMeta):
 
 
 class TypcAtomType(TypcType):
-    __slots__ = ('__typc_native__', '__typc_value_type__')
+    __slots__ = ('__typc_native__', '__typc_value_type__', '__typc_le_spec__')
     __typc_native__: type
     __typc_name__: str
+    __typc_le_spec__: BuiltinStruct
 
     def __init__(self, name: str, spec: str, size: int,
                  native_type: type) -> None:
         self.__typc_spec__ = BuiltinStruct(spec)
+        self.__typc_le_spec__ = BuiltinStruct('<' + spec)
         self.__typc_size__ = size
         self.__typc_name__ = name
         self.__typc_native__ = native_type
+        self.__typc_hash__ = hash(('atom', spec))
         self.__typc_value_type__ = TypcAtomValue
         if native_type is int:
             self.__typc_value_type__ = TypcIntegerValue
@@ -118,7 +421,7 @@ class TypcAtomType(TypcType):
     def __call__(
         self,
         values: Any = None,
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> TypcAtomValue:
         return self.__typc_value_type__(self, values, child_data)
 
@@ -128,16 +431,62 @@ class TypcAtomType(TypcType):
     def __typc_clone__(self) -> TypcAtomType:
         new_type: TypcAtomType = TypcAtomType.__new__(TypcAtomType)
         new_type.__typc_spec__ = self.__typc_spec__
+        new_type.__typc_le_spec__ = self.__typc_le_spec__
         new_type.__typc_size__ = self.__typc_size__
         new_type.__typc_name__ = self.__typc_name__
         new_type.__typc_native__ = self.__typc_native__
+        new_type.__typc_hash__ = self.__typc_hash__
         new_type.__typc_value_type__ = self.__typc_value_type__
         return new_type
 
+    def __typc_to_native__(self, value: Any) -> Any:
+        native_type = self.__typc_native__
+        if isinstance(value, native_type):
+            return value
+        if value in (None, 0):
+            return native_type()
+        if isinstance(value, bytes):
+            if len(value) != self.__typc_size__:
+                raise ValueError
+            return self.__typc_spec__.unpack(value)[0]
+        if isinstance(value, TypcAtomValue):
+            return value.__typc_value__
+        raise TypeError
+
+    def __typc_load__(self, buffer: Any, offset: int) -> Any:
+        return self.__typc_le_spec__.unpack_from(buffer, offset)[0]
+
+    def __typc_leaf_format__(self) -> Tuple[str, int]:
+        return self.__typc_spec__.format, 1
+
+    def __typc_scalar__(self) -> TypcAtomType:
+        return self
+
+    def __typc_store__(self, buffer: Any, offset: int, value: Any) -> None:
+        self.__typc_le_spec__.pack_into(buffer, offset,
+                                        self.__typc_to_native__(value))
+
+    def from_buffer(self, buffer: Any, offset: int = 0) -> TypcAtomValue:
+        check_buffer(buffer, offset, self.__typc_size__)
+        return self(self.__typc_load__(buffer, offset))
+
+    def iter_unpack(self, buffer: Any) -> Iterator[Any]:
+        check_records(buffer, self.__typc_size__)
+        return map(itemgetter(0), self.__typc_le_spec__.iter_unpack(buffer))
+
+    def to_numpy_dtype(self) -> Any:
+        from numpy import dtype  # pylint: disable=import-outside-toplevel
+        spec = self.__typc_spec__.format
+        kind = 'f' if spec in ('f', 'd') else 'i' if spec.islower() else 'u'
+        return dtype(f'<{kind}{self.__typc_size__}')
+
     def __eq__(self, obj: object) -> bool:
         return (isinstance(obj, TypcAtomType)
                 and obj.__typc_spec__.format == self.__typc_spec__.format)
 
+    def __hash__(self) -> int:
+        return self.__typc_hash__
+
     def __instancecheck__(self, instance: Any) -> bool:
         if isinstance(instance, TypcAtomValue):
             return instance.__typc_type__ == self
@@ -158,49 +507,24 @@ class TypcAtomValue(TypcValue):
         self,
         atom_type: TypcAtomType,
         value: Union[bytes, TypcAtomValue, Literal[None], Literal[0]] = None,
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> None:
         self.__typc_type__ = atom_type
         self.__typc_child_data__ = child_data
-        native_type = atom_type.__typc_native__
-        if isinstance(value, native_type):
-            value_raw = value
-        elif value in (None, 0):
-            value_raw = native_type()
-        elif isinstance(value, bytes):
-            type_size = atom_type.__typc_size__
-            value_size = len(value)
-            if value_size == type_size:
-                value_raw, = atom_type.__typc_spec__.unpack(value)
-            else:
-                raise ValueError
-        elif isinstance(value, TypcAtomValue):
-            value_raw = value.__typc_value__
-        else:
-            raise TypeError
-        self.__typc_value__ = value_raw
+        self.__typc_value__ = atom_type.__typc_to_native__(value)
 
     def __bytes__(self) -> bytes:
         return self.__typc_type__.__typc_spec__.pack(self.__typc_value__)
 
+    def __typc_pack_into__(self, buffer: Any, offset: int) -> None:
+        self.__typc_type__.__typc_le_spec__.pack_into(buffer, offset,
+                                                      self.__typc_value__)
+
+    def __typc_leaves__(self, out: List[Any]) -> None:
+        out.append(self.__typc_value__)
+
     def __typc_set__(self, value: Any) -> None:
-        native_type = self.__typc_type__.__typc_native__
-        if isinstance(value, native_type):
-            self.__typc_value__ = value
-        elif value in (None, 0):
-            self.__typc_value__ = native_type()
-        elif isinstance(value, bytes):
-            atom_type = self.__typc_type__
-            type_size = atom_type.__typc_size__
-            value_size = len(value)
-            if value_size == type_size:
-                self.__typc_value__, = atom_type.__typc_spec__.unpack(value)
-            else:
-                raise ValueError
-        elif isinstance(value, TypcAtomValue):
-            self.__typc_value__ = value.__typc_value__
-        else:
-            raise TypeError
+        self.__typc_value__ = self.__typc_type__.__typc_to_native__(value)
 
     def __typc_set_part__(self, data: bytes, offset: int) -> None:
         spec = self.__typc_type__.__typc_spec__
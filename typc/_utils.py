@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Generic
+import re
+from struct import calcsize
+from typing import Any, Dict, Generic, List, Tuple, Union
 
 generic_class_getitem = Generic.__dict__['__class_getitem__'].__func__
 
+_FORMAT_ITEM = re.compile(r'(\d*)([a-zA-Z?])')
+
 
 class _Empty:
     pass
@@ -15,3 +19,65 @@ def false_issubclass(obj: Any):
 
 def false_isinstance(obj: Any):
     return isinstance(obj, _Empty)
+
+
+def buffer_size(buffer: Any) -> int:
+    with memoryview(buffer) as view:
+        return view.nbytes
+
+
+def check_buffer(buffer: Any, offset: int, size: int) -> None:
+    if offset < 0 or offset + size > buffer_size(buffer):
+        raise ValueError(f'Buffer too small for {size} bytes at {offset}')
+
+
+def buffer_bytes(buffer: Any, offset: int, size: int) -> bytes:
+    with memoryview(buffer) as view:
+        return view[offset:offset + size].tobytes()
+
+
+def buffer_slice(buffer: Any, offset: int, size: int) -> memoryview:
+    return memoryview(buffer).cast('B')[offset:offset + size]
+
+
+def format_padding(fmt: str) -> List[Tuple[int, int]]:
+    padding: List[Tuple[int, int]] = []
+    position = 0
+    for count, code in _FORMAT_ITEM.findall(fmt):
+        size = calcsize(f'<{count}{code}')
+        if code == 'x':
+            if padding and padding[-1][1] == position:
+                padding[-1] = (padding[-1][0], position + size)
+            else:
+                padding.append((position, position + size))
+        position += size
+    return padding
+
+
+def clear_padding(raw: Union[bytes, bytearray],
+                  padding: List[Tuple[int, int]]) -> bytes:
+    if not padding:
+        return bytes(raw)
+    data = bytearray(raw)
+    for start, end in padding:
+        data[start:end] = bytes(end - start)
+    return bytes(data)
+
+
+def check_records(buffer: Any, size: int) -> None:
+    total = buffer_size(buffer)
+    if not size or total % size:
+        raise ValueError(f'Buffer of {total} bytes is not a sequence of '
+                         f'{size}-byte records')
+
+
+def members_dtype(members: Dict[str, Tuple[int, Any]], size: int) -> Any:
+    from numpy import dtype  # pylint: disable=import-outside-toplevel
+    return dtype({
+        'names': list(members),
+        'formats': [
+            member_type.to_numpy_dtype() for _, member_type in members.values()
+        ],
+        'offsets': [offset for offset, _ in members.values()],
+        'itemsize': size,
+    })
@@ -1,16 +1,48 @@
 from __future__ import annotations
 
+import sys
+from array import array
 from struct import Struct as BuiltinStruct
-from typing import (Any, Dict, Generic, List, Literal, Optional, Tuple, Type,
-                    TypeVar, Union, overload)
-
-from ._base import BaseType, ContainerBase
-from ._impl import TypcAtomValue, TypcType, TypcValue
-from ._utils import false_isinstance, false_issubclass, generic_class_getitem
+from typing import (Any, BinaryIO, Dict, Generic, Iterator, List, Literal,
+                    Optional, Tuple, Type, TypeVar, Union, overload)
+
+from ._base import BUFFER, BaseType, ContainerBase
+from ._impl import (TypcAtomType, TypcParent, TypcType, TypcValue,
+                    atom_typecode, intern_type)
+from ._utils import (buffer_bytes, buffer_slice, check_buffer, check_records,
+                     clear_padding, false_isinstance, false_issubclass,
+                     generic_class_getitem)
+from .atom import Integer, Real
+from .io import RecordCursor
 from .structure import field_to_spec
 
 EL = TypeVar('EL', bound=BaseType)
 SIZE = TypeVar('SIZE', bound=int)
+INT_EL = TypeVar('INT_EL', bound=Integer)
+REAL_EL = TypeVar('REAL_EL', bound=Real)
+
+_SWAP_BYTES = sys.byteorder != 'little'
+
+
+def array_typecode(element_type: TypcType) -> Optional[str]:
+    if not isinstance(element_type, TypcAtomType):
+        return None
+    return atom_typecode(element_type)
+
+
+def _array_from_bytes(typecode: str, data: Any) -> array[Any]:
+    result = array(typecode)
+    result.frombytes(data)
+    if _SWAP_BYTES:
+        result.byteswap()
+    return result
+
+
+def _array_to_bytes(values: array[Any]) -> bytes:
+    if _SWAP_BYTES:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
 
 
 class ArrayMeta(type):
@@ -29,8 +61,8 @@ class ArrayBase(Generic[EL, SIZE]):
         values: Any = None,
     ) -> ArrayValue:
         if isinstance(element_type, TypcType) and isinstance(size, int):
-            array_type = ArrayType(element_type, size, None)
-            return ArrayValue(array_type, values)
+            array_type = anonymous_array(element_type, size)
+            return array_type(values)
         raise TypeError
 
     def __getitem__(self, args: Tuple[Any, ...]) -> Any:
@@ -38,7 +70,7 @@ class ArrayBase(Generic[EL, SIZE]):
         if isinstance(el_type, TypcType) and hasattr(size_literal, '__args__'):
             size = size_literal.__args__[0]
             if isinstance(size, int):
-                return ArrayType(el_type, size, None)
+                return anonymous_array(el_type, size)
         return generic_class_getitem(self, args)
 
     def __subclasscheck__(self, subclass: Any) -> bool:
@@ -49,7 +81,7 @@ class ArrayBase(Generic[EL, SIZE]):
 
     def __instancecheck__(self, instance: Any) -> bool:
         # pylint: disable=unidiomatic-typecheck
-        if type(instance) is ArrayValue:
+        if type(instance) in (ArrayValue, AtomArrayValue, ArrayView):
             return True
         return false_isinstance(instance)
 
@@ -94,6 +126,53 @@ class Array(Generic[EL, SIZE], BaseType, metaclass=ArrayMeta):
         ...  # mark as non-abstract for pylint
         raise NotImplementedError
 
+    @classmethod
+    def view(cls: Type[Array[EL, SIZE]],
+             buffer: BUFFER,
+             offset: int = 0) -> Array[EL, SIZE]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def cursor(cls: Type[Array[EL, SIZE]],
+               buffer: BUFFER) -> RecordCursor[Array[EL, SIZE]]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def from_buffer(cls: Type[Array[EL, SIZE]],
+                    buffer: BUFFER,
+                    offset: int = 0) -> Array[EL, SIZE]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def read(cls: Type[Array[EL, SIZE]], fileobj: BinaryIO) -> Array[EL, SIZE]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def iter_unpack(cls: Type[Array[EL, SIZE]],
+                    buffer: BUFFER) -> Iterator[Array[EL, SIZE]]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def unpack_many(cls: Type[Array[EL, SIZE]],
+                    buffer: BUFFER) -> List[Array[EL, SIZE]]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def to_numpy_dtype(cls) -> Any:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def decode_numpy(cls, buffer: BUFFER) -> Any:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
     @overload
     def __get__(self, owner: Literal[None],
                 inst: Type[ContainerBase]) -> Type[Array[EL, SIZE]]:
@@ -141,7 +220,19 @@ class Array(Generic[EL, SIZE], BaseType, metaclass=ArrayMeta):
     def __set__(self, owner: ContainerBase, value: Any) -> None:
         raise NotImplementedError
 
+    @overload
+    def __getitem__(self: Array[INT_EL, Any], index: int) -> int:
+        ...
+
+    @overload
+    def __getitem__(self: Array[REAL_EL, Any], index: int) -> float:
+        ...
+
+    @overload
     def __getitem__(self, index: int) -> EL:
+        ...
+
+    def __getitem__(self, index: int) -> Any:
         raise NotImplementedError
 
     def __setitem__(
@@ -151,6 +242,21 @@ class Array(Generic[EL, SIZE], BaseType, metaclass=ArrayMeta):
     ) -> None:
         raise NotImplementedError
 
+    @overload
+    def __iter__(self: Array[INT_EL, Any]) -> Iterator[int]:
+        ...
+
+    @overload
+    def __iter__(self: Array[REAL_EL, Any]) -> Iterator[float]:
+        ...
+
+    @overload
+    def __iter__(self) -> Iterator[EL]:
+        ...
+
+    def __iter__(self) -> Iterator[Any]:
+        raise NotImplementedError
+
     def __bytes__(self) -> bytes:
         ...  # mark as non-abstract for pylint
         raise NotImplementedError
@@ -165,16 +271,31 @@ class Array(Generic[EL, SIZE], BaseType, metaclass=ArrayMeta):
 
 
 class ArrayType(TypcType):
-    __slots__ = ('__typc_element__', '__typc_count__')
+    __slots__ = ('__typc_element__', '__typc_count__', '__typc_typecode__',
+                 '__typc_value_type__', '__typc_leaf_info__')
+    __typc_element__: TypcType
+    __typc_count__: int
+    __typc_typecode__: Optional[str]
+    __typc_value_type__: Type[ArrayValue]
+    __typc_leaf_info__: Optional[Tuple[Optional[BuiltinStruct], int,
+                                       List[Tuple[int, int]]]]
 
     def __init__(self, element_type: TypcType, size: int,
                  name: Optional[str]) -> None:
         self.__typc_element__ = element_type
         self.__typc_count__ = size
-        spec = field_to_spec(element_type)
-        self.__typc_spec__ = BuiltinStruct('<' + spec * size)
+        if isinstance(element_type, TypcAtomType):
+            spec = f'{size}{element_type.__typc_spec__.format}'
+        else:
+            spec = f'{size * element_type.__typc_size__}s'
+        self.__typc_spec__ = BuiltinStruct('<' + spec)
         self.__typc_size__ = self.__typc_spec__.size
         self.__typc_name__ = name
+        self.__typc_hash__ = hash(('array', element_type, size))
+        self.__typc_typecode__ = array_typecode(element_type)
+        self.__typc_value_type__ = (AtomArrayValue if self.__typc_typecode__
+                                    else ArrayValue)
+        self.__typc_leaf_info__ = None
 
     def item_type(self) -> TypcType:
         return self.__typc_element__
@@ -186,9 +307,9 @@ class ArrayType(TypcType):
         self,
         values: Union[Literal[None], Literal[0], bytes, Tuple[Any, ...],
                       ArrayValue] = None,
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> ArrayValue:
-        return ArrayValue(self, values, child_data)
+        return self.__typc_value_type__(self, values, child_data)
 
     def __typc_get_name__(self) -> str:
         if self.__typc_name__ is None:
@@ -204,17 +325,129 @@ class ArrayType(TypcType):
         new_type.__typc_name__ = self.__typc_name__
         new_type.__typc_element__ = self.__typc_element__
         new_type.__typc_count__ = self.__typc_count__
+        new_type.__typc_hash__ = self.__typc_hash__
+        new_type.__typc_typecode__ = self.__typc_typecode__
+        new_type.__typc_value_type__ = self.__typc_value_type__
+        new_type.__typc_leaf_info__ = self.__typc_leaf_info__
         return new_type
 
+    def __typc_leaf_format__(self) -> Tuple[str, int]:
+        element_type = self.__typc_element__
+        element_format, element_count = element_type.__typc_leaf_format__()
+        if (len(element_format) != 1
+                or element_format == field_to_spec(element_type)):
+            return super().__typc_leaf_format__()
+        count = self.__typc_count__
+        return f'{count}{element_format}', element_count * count
+
+    def __typc_padding__(self) -> List[Tuple[int, int]]:
+        _, _, padding = self.__typc_get_leaf_info__()
+        return padding
+
+    def __typc_intern_key__(self) -> Optional[Tuple[Any, ...]]:
+        return ('array', id(self.__typc_element__), self.__typc_count__)
+
+    def __typc_children__(self) -> List[Tuple[Any, int, TypcType]]:
+        element_type = self.__typc_element__
+        element_size = element_type.__typc_size__
+        return [(idx, idx * element_size, element_type)
+                for idx in range(self.__typc_count__)]
+
+    def __typc_child__(self, key: Any) -> Optional[Tuple[int, TypcType]]:
+        if not isinstance(key, int) or not 0 <= key < self.__typc_count__:
+            return None
+        element_type = self.__typc_element__
+        return key * element_type.__typc_size__, element_type
+
+    def __typc_get_leaf_info__(
+        self
+    ) -> Tuple[Optional[BuiltinStruct], int, List[Tuple[int, int]]]:
+        leaf_info = self.__typc_leaf_info__
+        if leaf_info is None:
+            element_type = self.__typc_element__
+            element_format, element_count = (
+                element_type.__typc_leaf_format__())
+            leaf_spec = None
+            leaf_format, _ = self.__typc_leaf_format__()
+            if leaf_format != field_to_spec(self):
+                leaf_spec = BuiltinStruct('<' + leaf_format)
+            padding: List[Tuple[int, int]] = []
+            element_padding = element_type.__typc_padding__()
+            if element_padding:
+                element_size = element_type.__typc_size__
+                padding = [(idx * element_size + start,
+                            idx * element_size + end)
+                           for idx in range(self.__typc_count__)
+                           for start, end in element_padding]
+            leaf_info = self.__typc_leaf_info__ = (leaf_spec, element_count,
+                                                   padding)
+        return leaf_info
+
+    def iter_unpack(self, buffer: Any) -> Iterator[ArrayValue]:
+        typecode = self.__typc_typecode__
+        if typecode is None:
+            return super().iter_unpack(buffer)
+        check_records(buffer, self.__typc_size__)
+        return _iter_atom_arrays(self, _array_from_bytes(typecode, buffer))
+
+    def from_buffer(self, buffer: Any, offset: int = 0) -> ArrayValue:
+        typecode = self.__typc_typecode__
+        if typecode is None:
+            return super().from_buffer(buffer, offset)
+        size = self.__typc_size__
+        check_buffer(buffer, offset, size)
+        return _atom_array_value(
+            self, _array_from_bytes(typecode,
+                                    buffer_slice(buffer, offset, size)))
+
+    def to_numpy_dtype(self) -> Any:
+        from numpy import dtype  # pylint: disable=import-outside-toplevel
+        element_dtype = self.__typc_element__.to_numpy_dtype()
+        return dtype((element_dtype.base,
+                      (self.__typc_count__, ) + element_dtype.shape))
+
+    def view(self, buffer: Any, offset: int = 0) -> ArrayView:
+        check_buffer(buffer, offset, self.__typc_size__)
+        return ArrayView(self, buffer, offset)
+
+    def cursor(self, buffer: Any) -> RecordCursor[Any]:
+        return RecordCursor(self, buffer)
+
+    def __typc_load__(self, buffer: Any, offset: int) -> ArrayView:
+        return ArrayView(self, buffer, offset)
+
+    def __typc_store__(self, buffer: Any, offset: int, value: Any) -> None:
+        size = self.__typc_size__
+        if value in (None, 0):
+            buffer[offset:offset + size] = bytes(size)
+        elif isinstance(value, tuple):
+            element_type = self.__typc_element__
+            element_size = element_type.__typc_size__
+            for idx, val in enumerate(value):
+                element_type.__typc_store__(buffer,
+                                            offset + idx * element_size, val)
+        else:
+            if isinstance(value, (ArrayValue, ArrayView)):
+                value = bytes(value)
+            elif not isinstance(value, bytes):
+                raise TypeError
+            if len(value) != size:
+                raise ValueError
+            buffer[offset:offset + size] = value
+
     def __eq__(self, obj: object) -> bool:
         if obj is self:
             return True
         return (isinstance(obj, ArrayType)
+                and obj.__typc_hash__ == self.__typc_hash__
                 and obj.__typc_count__ == self.__typc_count__
                 and obj.__typc_element__ == self.__typc_element__)
 
+    def __hash__(self) -> int:
+        return self.__typc_hash__
+
     def __instancecheck__(self, instance: Any) -> bool:
-        if isinstance(instance, ArrayValue):
+        if isinstance(instance, (ArrayValue, ArrayView)):
             return instance.__typc_type__ == self
         return false_isinstance(instance)
 
@@ -226,41 +459,45 @@ class ArrayType(TypcType):
         return false_issubclass(subclass)
 
 
+def anonymous_array(element_type: TypcType, size: int) -> ArrayType:
+    return intern_type(('array', id(element_type), size), ArrayType,
+                       element_type, size, None)
+
+
+def _array_raw(
+    array_type: ArrayType,
+    values: Any,
+) -> Optional[Union[bytes, Tuple[Any, ...]]]:
+    if values in (None, 0):
+        return None
+    if isinstance(values, bytes):
+        if len(values) != array_type.__typc_size__:
+            raise ValueError
+        return values
+    if isinstance(values, (ArrayValue, ArrayView)):
+        return bytes(values)
+    if isinstance(values, tuple):
+        return values
+    raise TypeError
+
+
 class ArrayValue(TypcValue):
-    __slots__ = ('__typc_inited__', '__typc_value__')
+    __slots__ = ('__typc_raw__', '__typc_value__')
     __typc_type__: ArrayType
-    __typc_value__: List[TypcValue]
+    __typc_raw__: Optional[Union[bytes, bytearray, Tuple[Any, ...]]]
+    __typc_value__: Dict[int, TypcValue]
 
     def __init__(
         self,
         array_type: ArrayType,
         values: Union[bytes, Tuple[Any, ...], ArrayValue, Literal[None],
                       Literal[0]] = None,
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> None:
         self.__typc_type__ = array_type
         self.__typc_child_data__ = child_data
-        if values in (None, 0):
-            self.__typc_inited__ = False
-            return
-        if isinstance(values, bytes):
-            values_tuple = array_type.__typc_spec__.unpack(values)
-        elif isinstance(values, ArrayValue):
-            values_tuple = array_type.__typc_spec__.unpack(bytes(values))
-        elif isinstance(values, tuple):
-            values_tuple = values
-        else:
-            raise TypeError
-        element_type = array_type.__typc_element__
-        element_size = element_type.__typc_size__
-        self.__typc_value__ = [
-            element_type(
-                val,
-                None if child_data is None else
-                (self, child_data[1] + idx * element_size),
-            ) for idx, val in enumerate(values_tuple)
-        ]
-        self.__typc_inited__ = True
+        self.__typc_value__ = {}
+        self.__typc_raw__ = _array_raw(array_type, values)
 
     def item_type(self) -> TypcType:
         return self.__typc_type__.__typc_element__
@@ -268,88 +505,425 @@ class ArrayValue(TypcValue):
     def length(self) -> int:
         return self.__typc_type__.__typc_count__
 
-    def __getitem__(self, index: int) -> TypcValue:
-        if not self.__typc_inited__:
-            self._zero_init()
-        return self.__typc_value__[index]
+    def _index(self, index: int) -> int:
+        count = self.__typc_type__.__typc_count__
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError
+        return index
+
+    def _raw_element(self, index: int) -> Any:
+        raw = self.__typc_raw__
+        if raw is None:
+            return None
+        if isinstance(raw, tuple):
+            return raw[index] if index < len(raw) else None
+        element_size = self.__typc_type__.__typc_element__.__typc_size__
+        return bytes(raw[index * element_size:(index + 1) * element_size])
+
+    def _materialize(self, index: int, value: Any = None) -> TypcValue:
+        array_type = self.__typc_type__
+        element_type = array_type.__typc_element__
+        child_data = self.__typc_child_data__
+        element = element_type(
+            value,
+            None if child_data is None else
+            (self, child_data[1] + index * element_type.__typc_size__),
+        )
+        values_dict = self.__typc_value__
+        values_dict[index] = element
+        # A bytearray is storage owned for readinto, keep it for reuse
+        if (len(values_dict) == array_type.__typc_count__
+                and not isinstance(self.__typc_raw__, bytearray)):
+            self.__typc_raw__ = None
+        return element
+
+    def _materialize_all(self) -> Dict[int, TypcValue]:
+        values_dict = self.__typc_value__
+        for idx in range(self.__typc_type__.__typc_count__):
+            if idx not in values_dict:
+                self._materialize(idx, self._raw_element(idx))
+        return values_dict
+
+    def __getitem__(self, index: int) -> Any:
+        index = self._index(index)
+        values_dict = self.__typc_value__
+        if index in values_dict:
+            return values_dict[index]
+        return self._materialize(index, self._raw_element(index))
 
     def __setitem__(self, index: int, value: Any) -> None:
-        if not self.__typc_inited__:
-            self._zero_init()
-        el_type = self.__typc_type__.__typc_element__
-        self.__typc_value__[index].__typc_set__(value)
+        index = self._index(index)
+        values_dict = self.__typc_value__
+        if index in values_dict:
+            element = values_dict[index]
+            element.__typc_set__(value)
+        elif isinstance(value, tuple):
+            element = self._materialize(index, self._raw_element(index))
+            element.__typc_set__(value)
+        else:
+            element = self._materialize(index, value)
         if self.__typc_child_data__ is not None:
             parent, self_offset = self.__typc_child_data__
+            el_type = self.__typc_type__.__typc_element__
             parent.__typc_changed__(
-                self, bytes(self.__typc_value__[index]),
+                self, bytes(element),
                 self_offset + index * el_type.__typc_size__)
 
-    def _zero_init(self) -> None:
-        element_type = self.__typc_type__.__typc_element__
-        element_count = self.__typc_type__.__typc_count__
-        element_size = element_type.__typc_size__
-        child_data = self.__typc_child_data__
-        self.__typc_value__ = [
-            element_type(
-                0,
-                None if child_data is None else
-                (self, child_data[1] + idx * element_size),
-            ) for idx in range(element_count)
-        ]
-        self.__typc_inited__ = True
+    def __typc_leaves__(self, out: List[Any]) -> None:
+        array_type = self.__typc_type__
+        values_dict = self.__typc_value__
+        leaf_spec, _, _ = array_type.__typc_get_leaf_info__()
+        if leaf_spec is None:
+            out.append(bytes(self))
+        elif len(values_dict) == array_type.__typc_count__:
+            for idx in range(array_type.__typc_count__):
+                values_dict[idx].__typc_leaves__(out)
+        else:
+            out.extend(leaf_spec.unpack(bytes(self)))
+
+    def __typc_set_leaves__(self, leaves: Tuple[Any, ...], start: int,
+                            data: bytes, offset: int) -> None:
+        array_type = self.__typc_type__
+        values_dict = self.__typc_value__
+        leaf_spec, step, _ = array_type.__typc_get_leaf_info__()
+        if leaf_spec is None:
+            self.__typc_set__(leaves[start])
+        elif len(values_dict) == array_type.__typc_count__:
+            element_size = array_type.__typc_element__.__typc_size__
+            for idx in range(array_type.__typc_count__):
+                values_dict[idx].__typc_set_leaves__(
+                    leaves, start + idx * step, data,
+                    offset + idx * element_size)
+        else:
+            self.__typc_set__(data[offset:offset + array_type.__typc_size__])
 
     def __bytes__(self) -> bytes:
-        if not self.__typc_inited__:
-            self._zero_init()
-        raw_value = tuple(
-            (v.__typc_value__ if isinstance(v, TypcAtomValue) else bytes(v))
-            for v in self.__typc_value__)
-        return self.__typc_type__.__typc_spec__.pack(*raw_value)
+        array_type = self.__typc_type__
+        if isinstance(self.__typc_raw__, tuple):
+            self._materialize_all()
+        values_dict = self.__typc_value__
+        raw = self.__typc_raw__
+        if raw is None and not values_dict:
+            return bytes(array_type.__typc_size__)
+        leaf_spec, _, padding = array_type.__typc_get_leaf_info__()
+        if not values_dict:
+            assert isinstance(raw, (bytes, bytearray))
+            return clear_padding(raw, padding)
+        if len(values_dict) < array_type.__typc_count__:
+            element_size = array_type.__typc_element__.__typc_size__
+            data = (bytearray(array_type.__typc_size__)
+                    if raw is None else bytearray(raw))
+            for idx, element in values_dict.items():
+                data[idx * element_size:(idx + 1) *
+                     element_size] = bytes(element)
+            return clear_padding(bytes(data), padding)
+        if leaf_spec is not None:
+            out: List[Any] = []
+            self.__typc_leaves__(out)
+            return leaf_spec.pack(*out)
+        return b''.join(
+            bytes(values_dict[idx])
+            for idx in range(array_type.__typc_count__))
+
+    def __typc_raw_buffer__(self) -> Any:
+        raw = self.__typc_raw__
+        if not self.__typc_value__ and isinstance(raw, (bytes, bytearray)):
+            return raw
+        return None
+
+    def __typc_buffer_source__(self) -> Any:
+        raw = self.__typc_raw_buffer__()
+        if raw is not None and not self.__typc_type__.__typc_padding__():
+            return raw
+        return bytes(self)
 
     def __len__(self) -> int:
         return self.__typc_type__.__typc_count__
 
     def __typc_set__(self, value: Any) -> None:
-        if not self.__typc_inited__:
-            self.__init__(self.__typc_type__, value)  # type: ignore
+        array_type = self.__typc_type__
+        if isinstance(value, tuple):
+            values_dict = self._materialize_all()
+            for idx, item in enumerate(value):
+                values_dict[idx].__typc_set__(item)
             return
-        self_type = self.__typc_type__
-        new_values: Tuple[Any, ...]
-        if value in (None, 0):
-            new_values = (0, ) * self_type.__typc_count__
-        elif isinstance(value, bytes):
-            new_values = self_type.__typc_spec__.unpack(value)
-        elif isinstance(value, ArrayValue):
-            new_values = self_type.__typc_spec__.unpack(bytes(value))
-        elif isinstance(value, tuple):
-            new_values = value
-        else:
-            raise TypeError
-        values_list = self.__typc_value__
-        for i, new_val in enumerate(new_values):
-            values_list[i].__typc_set__(new_val)
+        raw = self.__typc_raw__ = _array_raw(array_type, value)
+        values_dict = self.__typc_value__
+        if not values_dict:
+            return
+        if (isinstance(raw, bytes)
+                and len(values_dict) == array_type.__typc_count__):
+            leaf_spec, _, _ = array_type.__typc_get_leaf_info__()
+            if leaf_spec is not None:
+                self.__typc_raw__ = None
+                self.__typc_set_leaves__(leaf_spec.unpack(raw), 0, raw, 0)
+                return
+        for idx, element in list(values_dict.items()):
+            element.__typc_set__(self._raw_element(idx))
+        if len(values_dict) == self.__typc_type__.__typc_count__:
+            self.__typc_raw__ = None
 
     def __typc_set_part__(self, data: bytes, offset: int) -> None:
-        el_type = self.__typc_type__.__typc_element__
-        el_size = el_type.__typc_size__
-        values_list = self.__typc_value__
+        array_type = self.__typc_type__
+        el_size = array_type.__typc_element__.__typc_size__
+        if isinstance(self.__typc_raw__, tuple):
+            self._materialize_all()
+        values_dict = self.__typc_value__
+        if len(values_dict) < array_type.__typc_count__:
+            raw = self.__typc_raw__
+            if isinstance(raw, bytearray):
+                raw[offset:offset + len(data)] = data
+            else:
+                if raw is None:
+                    raw = bytes(array_type.__typc_size__)
+                assert isinstance(raw, bytes)
+                self.__typc_raw__ = (raw[:offset] + data +
+                                     raw[offset + len(data):])
         first_off = offset % el_size
         first_idx = offset // el_size
         last_idx = (offset + len(data) - 1) // el_size
         if first_off:
             el_data = data[:el_size - first_off]
-            values_list[first_idx].__typc_set_part__(el_data, first_off)
+            element = values_dict.get(first_idx)
+            if element is not None:
+                element.__typc_set_part__(el_data, first_off)
             first_idx += 1
             data = data[el_size - first_off:]
         for idx in range(last_idx - first_idx + 1):
+            element = values_dict.get(first_idx + idx)
+            if element is None:
+                continue
             el_data = data[idx * el_size:(idx + 1) * el_size]
             if len(el_data) == el_size:
-                values_list[first_idx + idx].__typc_set__(el_data)
+                element.__typc_set__(el_data)
             else:
-                values_list[first_idx + idx].__typc_set_part__(el_data, 0)
+                element.__typc_set_part__(el_data, 0)
 
     def __typc_changed__(self, source: TypcValue, data: bytes,
                          offset: int) -> None:
         assert self.__typc_child_data__ is not None
         parent, _ = self.__typc_child_data__
         parent.__typc_changed__(self, data, offset)
+
+    def __typc_fill_buffer__(self) -> Any:
+        raw = self.__typc_raw__
+        if isinstance(raw, bytearray):
+            return raw
+        if isinstance(raw, tuple):
+            self._materialize_all()
+            raw = None
+        array_type = self.__typc_type__
+        storage = (bytearray(array_type.__typc_size__) if raw is None else
+                   bytearray(raw))
+        self.__typc_raw__ = storage
+        return storage
+
+    def __typc_filled__(self, received: int) -> None:
+        array_type = self.__typc_type__
+        values_dict = self.__typc_value__
+        raw = self.__typc_raw__
+        assert isinstance(raw, bytearray)
+        if (received == array_type.__typc_size__
+                and len(values_dict) == array_type.__typc_count__):
+            leaf_spec, _, _ = array_type.__typc_get_leaf_info__()
+            if leaf_spec is not None:
+                self.__typc_set_leaves__(leaf_spec.unpack(raw), 0,
+                                         bytes(raw), 0)
+                return
+        el_size = array_type.__typc_element__.__typc_size__
+        for idx, element in values_dict.items():
+            el_offset = idx * el_size
+            if el_offset + el_size <= received:
+                element.__typc_set__(self._raw_element(idx))
+            elif el_offset < received:
+                element.__typc_set_part__(
+                    buffer_bytes(raw, el_offset, received - el_offset), 0)
+
+
+def _atom_array(array_type: ArrayType, values: Any) -> array[Any]:
+    typecode = array_type.__typc_typecode__
+    assert typecode is not None
+    if isinstance(values, (ArrayValue, ArrayView)):
+        values = bytes(values)
+    if isinstance(values, bytes):
+        if len(values) != array_type.__typc_size__:
+            raise ValueError
+        return _array_from_bytes(typecode, values)
+    result = array(typecode, bytes(array_type.__typc_size__))
+    if values in (None, 0):
+        return result
+    if isinstance(values, tuple):
+        element_type = array_type.__typc_element__
+        assert isinstance(element_type, TypcAtomType)
+        to_native = element_type.__typc_to_native__
+        for idx, val in enumerate(values):
+            result[idx] = to_native(val)
+        return result
+    raise TypeError
+
+
+def _atom_array_value(array_type: ArrayType,
+                      items: array[Any]) -> AtomArrayValue:
+    value = AtomArrayValue.__new__(AtomArrayValue)
+    value.__typc_type__ = array_type
+    value.__typc_child_data__ = None
+    value.__typc_raw__ = None
+    value.__typc_value__ = items
+    return value
+
+
+def _iter_atom_arrays(array_type: ArrayType,
+                      items: array[Any]) -> Iterator[AtomArrayValue]:
+    count = array_type.__typc_count__
+    for start in range(0, len(items), count):
+        yield _atom_array_value(array_type, items[start:start + count])
+
+
+class AtomArrayValue(ArrayValue):
+    __slots__ = ()
+    __typc_value__: array[Any]  # type: ignore
+
+    def __init__(
+        self,
+        array_type: ArrayType,
+        values: Union[bytes, Tuple[Any, ...], ArrayValue, Literal[None],
+                      Literal[0]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
+    ) -> None:
+        # pylint: disable=super-init-not-called
+        self.__typc_type__ = array_type
+        self.__typc_child_data__ = child_data
+        self.__typc_raw__ = None
+        self.__typc_value__ = _atom_array(array_type, values)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.__typc_value__[index]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        el_type = self.__typc_type__.__typc_element__
+        assert isinstance(el_type, TypcAtomType)
+        values = self.__typc_value__
+        values[index] = el_type.__typc_to_native__(value)
+        if self.__typc_child_data__ is not None:
+            parent, self_offset = self.__typc_child_data__
+            index = self._index(index)
+            parent.__typc_changed__(
+                self, el_type.__typc_le_spec__.pack(values[index]),
+                self_offset + index * el_type.__typc_size__)
+
+    def __bytes__(self) -> bytes:
+        return _array_to_bytes(self.__typc_value__)
+
+    def __typc_buffer_source__(self) -> Any:
+        if _SWAP_BYTES:
+            return _array_to_bytes(self.__typc_value__)
+        return memoryview(self.__typc_value__).cast('B')
+
+    def __typc_fill_buffer__(self) -> Any:
+        return None if _SWAP_BYTES else self.__typc_value__
+
+    def __typc_filled__(self, received: int) -> None:
+        pass
+
+    def __typc_leaves__(self, out: List[Any]) -> None:
+        out.append(_array_to_bytes(self.__typc_value__))
+
+    def __typc_set_leaves__(self, leaves: Tuple[Any, ...], start: int,
+                            data: bytes, offset: int) -> None:
+        self.__typc_set__(leaves[start])
+
+    def __typc_set__(self, value: Any) -> None:
+        values = self.__typc_value__
+        if isinstance(value, tuple):
+            el_type = self.__typc_type__.__typc_element__
+            assert isinstance(el_type, TypcAtomType)
+            to_native = el_type.__typc_to_native__
+            for idx, val in enumerate(value):
+                values[idx] = to_native(val)
+            return
+        values[:] = _atom_array(self.__typc_type__, value)
+
+    def __typc_set_part__(self, data: bytes, offset: int) -> None:
+        values = self.__typc_value__
+        if _SWAP_BYTES:
+            raw = bytearray(_array_to_bytes(values))
+            raw[offset:offset + len(data)] = data
+            values[:] = _array_from_bytes(values.typecode, bytes(raw))
+            return
+        with memoryview(values) as view, view.cast('B') as raw_view:
+            raw_view[offset:offset + len(data)] = data
+
+    def __typc_changed__(self, source: TypcValue, data: bytes,
+                         offset: int) -> None:
+        raise NotImplementedError
+
+
+class ArrayView(TypcValue):
+    __slots__ = ('__typc_buffer__', '__typc_offset__')
+    __typc_type__: ArrayType
+    __typc_buffer__: Any
+    __typc_offset__: int
+
+    def __init__(self, array_type: ArrayType, buffer: Any,
+                 offset: int) -> None:
+        self.__typc_type__ = array_type
+        self.__typc_child_data__ = None
+        self.__typc_buffer__ = buffer
+        self.__typc_offset__ = offset
+
+    def item_type(self) -> TypcType:
+        return self.__typc_type__.__typc_element__
+
+    def length(self) -> int:
+        return self.__typc_type__.__typc_count__
+
+    def _element_offset(self, index: int) -> int:
+        count = self.__typc_type__.__typc_count__
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError
+        element_size = self.__typc_type__.__typc_element__.__typc_size__
+        return self.__typc_offset__ + index * element_size
+
+    def __getitem__(self, index: int) -> Any:
+        offset = self._element_offset(index)
+        return self.__typc_type__.__typc_element__.__typc_load__(
+            self.__typc_buffer__, offset)
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        offset = self._element_offset(index)
+        self.__typc_type__.__typc_element__.__typc_store__(
+            self.__typc_buffer__, offset, value)
+
+    def __bytes__(self) -> bytes:
+        return buffer_bytes(self.__typc_buffer__, self.__typc_offset__,
+                            self.__typc_type__.__typc_size__)
+
+    def __typc_buffer_source__(self) -> Any:
+        return buffer_slice(self.__typc_buffer__, self.__typc_offset__,
+                            self.__typc_type__.__typc_size__)
+
+    def __typc_fill_buffer__(self) -> Any:
+        return buffer_slice(self.__typc_buffer__, self.__typc_offset__,
+                            self.__typc_type__.__typc_size__)
+
+    def __typc_location__(self) -> Tuple[Any, int]:
+        return self.__typc_buffer__, self.__typc_offset__
+
+    def __len__(self) -> int:
+        return self.__typc_type__.__typc_count__
+
+    def __typc_set__(self, value: Any) -> None:
+        self.__typc_type__.__typc_store__(self.__typc_buffer__,
+                                          self.__typc_offset__, value)
+
+    def __typc_set_part__(self, data: bytes, offset: int) -> None:
+        start = self.__typc_offset__ + offset
+        self.__typc_buffer__[start:start + len(data)] = data
+
+    def __typc_changed__(self, source: TypcValue, data: bytes,
+                         offset: int) -> None:
+        raise NotImplementedError
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import (Any, Dict, Generic, Literal, Optional, Tuple, Type,
-                    TypeVar, Union, overload)
+from typing import (Any, BinaryIO, Dict, Generic, Iterator, List, Literal,
+                    Optional, Tuple, Type, TypeVar, Union, overload)
 
-from ._base import BaseType, ContainerBase
+from ._base import BUFFER, BaseType, ContainerBase
 from ._impl import TypcAtomBase
 
 SELF = TypeVar('SELF', bound='AtomType[Any]')
@@ -101,6 +101,26 @@ class AtomType(BaseType, Generic[RES], metaclass=AtomMeta):
         ...  # mark as non-abstract for pylint
         raise NotImplementedError
 
+    @classmethod
+    def from_buffer(cls: Type[SELF], buffer: BUFFER, offset: int = 0) -> SELF:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def read(cls: Type[SELF], fileobj: BinaryIO) -> SELF:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def iter_unpack(cls: Type[AtomType[RES]], buffer: BUFFER) -> Iterator[RES]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def unpack_many(cls: Type[AtomType[RES]], buffer: BUFFER) -> List[RES]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
 
 @overload
 def binary_method(_self: Any, _obj: Union[int, AtomType[int]]) -> int:
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
 from struct import Struct as BuiltinStruct
-from typing import (Any, Dict, Generic, Literal, Optional, Tuple, Type,
-                    TypeVar, Union, overload)
+from typing import (Any, BinaryIO, Dict, Generic, Literal, Optional, Tuple,
+                    Type, TypeVar, Union, overload)
 
-from ._base import BaseType, ContainerBase
-from ._impl import TypcType, TypcValue
-from ._utils import false_isinstance, false_issubclass, generic_class_getitem
+from ._base import BUFFER, BaseType, ContainerBase
+from ._impl import TypcParent, TypcType, TypcValue, intern_type
+from ._utils import (buffer_bytes, false_isinstance, false_issubclass,
+                     generic_class_getitem)
 
 SIZE = TypeVar('SIZE', bound=int)
 
 
+def _to_raw(size: int, value: Any) -> bytes:
+    if value in (None, 0):
+        return bytes(size)
+    if isinstance(value, bytes):
+        len_value = len(value)
+        if len_value == size:
+            return value
+        if len_value < size:
+            return value + bytes(size - len_value)
+        raise ValueError
+    if isinstance(value, BytesValue):
+        return bytes(value.__typc_value__)
+    raise TypeError
+
+
 class BytesMeta(type):
     def __new__(cls, _name: str, _bases: Tuple[type, ...],
                 _namespace_dict: Dict[str, Any]):
@@ -26,7 +42,7 @@ class BytesBase(Generic[SIZE]):
         value: Any = None,
     ) -> BytesValue:
         if isinstance(size, int):
-            bytes_type = BytesType(size, None)
+            bytes_type = anonymous_bytes(size)
             return BytesValue(bytes_type, value)
         raise TypeError
 
@@ -34,7 +50,7 @@ class BytesBase(Generic[SIZE]):
         if hasattr(size_literal, '__args__'):
             size = size_literal.__args__[0]
             if isinstance(size, int):
-                return BytesType(size, None)
+                return anonymous_bytes(size)
         return generic_class_getitem(self, size_literal)
 
     def __subclasscheck__(self, subclass: Any) -> bool:
@@ -76,6 +92,18 @@ class Bytes(Generic[SIZE], BaseType, metaclass=BytesMeta):
         ...  # mark as non-abstract for pylint
         raise NotImplementedError
 
+    @classmethod
+    def from_buffer(cls: Type[Bytes[SIZE]],
+                    buffer: BUFFER,
+                    offset: int = 0) -> Bytes[SIZE]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def read(cls: Type[Bytes[SIZE]], fileobj: BinaryIO) -> Bytes[SIZE]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
     @overload
     def __get__(self, owner: Literal[None],
                 inst: Type[ContainerBase]) -> Type[Bytes[SIZE]]:
@@ -144,6 +172,7 @@ class BytesType(TypcType):
         self.__typc_spec__ = BuiltinStruct(f'{size}s')
         self.__typc_size__ = size
         self.__typc_name__ = name
+        self.__typc_hash__ = hash(('bytes', size))
 
     def length(self) -> int:
         return self.__typc_size__
@@ -151,7 +180,7 @@ class BytesType(TypcType):
     def __call__(
         self,
         values: Union[Literal[None], Literal[0], bytes, BytesValue] = None,
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> BytesValue:
         return BytesValue(self, values, child_data)
 
@@ -165,12 +194,30 @@ class BytesType(TypcType):
         new_type.__typc_spec__ = self.__typc_spec__
         new_type.__typc_size__ = self.__typc_size__
         new_type.__typc_name__ = self.__typc_name__
+        new_type.__typc_hash__ = self.__typc_hash__
         return new_type
 
+    def __typc_intern_key__(self) -> Optional[Tuple[Any, ...]]:
+        return ('bytes', self.__typc_size__)
+
+    def __typc_load__(self, buffer: Any, offset: int) -> bytes:
+        return buffer_bytes(buffer, offset, self.__typc_size__)
+
+    def to_numpy_dtype(self) -> Any:
+        from numpy import dtype  # pylint: disable=import-outside-toplevel
+        return dtype(f'S{self.__typc_size__}')
+
+    def __typc_store__(self, buffer: Any, offset: int, value: Any) -> None:
+        size = self.__typc_size__
+        buffer[offset:offset + size] = _to_raw(size, value)
+
     def __eq__(self, obj: object) -> bool:
         return (isinstance(obj, BytesType)
                 and obj.__typc_size__ == self.__typc_size__)
 
+    def __hash__(self) -> int:
+        return self.__typc_hash__
+
     def __instancecheck__(self, instance: Any) -> bool:
         if isinstance(instance, BytesValue):
             return instance.__typc_type__ == self
@@ -184,35 +231,25 @@ class BytesType(TypcType):
         return false_issubclass(subclass)
 
 
+def anonymous_bytes(size: int) -> BytesType:
+    return intern_type(('bytes', size), BytesType, size, None)
+
+
 class BytesValue(TypcValue):
     __slots__ = ('__typc_value__', )
     __typc_type__: BytesType
-    __typc_value__: bytes
+    __typc_value__: bytearray
 
     def __init__(
         self,
         bytes_type: BytesType,
         values: Union[bytes, BytesValue, Literal[None], Literal[0]] = None,
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> None:
         self.__typc_type__ = bytes_type
         self.__typc_child_data__ = child_data
-        size = bytes_type.__typc_size__
-        if values in (None, 0):
-            values_raw = bytes(size)
-        elif isinstance(values, bytes):
-            len_values = len(values)
-            if len_values == size:
-                values_raw = values
-            elif len_values < size:
-                values_raw = values + bytes(size - len(values))
-            else:
-                raise ValueError
-        elif isinstance(values, BytesValue):
-            values_raw = values.__typc_value__
-        else:
-            raise TypeError
-        self.__typc_value__ = values_raw
+        self.__typc_value__ = bytearray(
+            _to_raw(bytes_type.__typc_size__, values))
 
     def length(self) -> int:
         return self.__typc_type__.__typc_size__
@@ -221,7 +258,7 @@ class BytesValue(TypcValue):
         value = self.__typc_value__
         if index >= len(value):
             raise IndexError
-        return value[index:index + 1]
+        return bytes(value[index:index + 1])
 
     def __setitem__(self, index: int, value: bytes) -> None:
         prev = self.__typc_value__
@@ -229,37 +266,29 @@ class BytesValue(TypcValue):
             raise IndexError
         if len(value) != 1:
             raise ValueError
-        self.__typc_value__ = prev[:index] + value + prev[index + 1:]
+        prev[index] = value[0]
         if self.__typc_child_data__ is not None:
             parent, self_offset = self.__typc_child_data__
             parent.__typc_changed__(self, value, self_offset + index)
 
     def __bytes__(self) -> bytes:
+        return bytes(self.__typc_value__)
+
+    def __typc_buffer_source__(self) -> Any:
+        return self.__typc_value__
+
+    def __typc_fill_buffer__(self) -> Any:
         return self.__typc_value__
 
     def __len__(self) -> int:
         return self.__typc_type__.__typc_size__
 
     def __typc_set__(self, value: Any) -> None:
-        if value in (None, 0):
-            self.__typc_value__ = bytes(len(self.__typc_value__))
-        elif isinstance(value, bytes):
-            size = len(self.__typc_value__)
-            len_value = len(value)
-            if len_value == size:
-                self.__typc_value__ = value
-            elif len_value < size:
-                self.__typc_value__ = value + bytes(size - len(value))
-            else:
-                raise ValueError
-        elif isinstance(value, BytesValue):
-            self.__typc_value__ = value.__typc_value__
-        else:
-            raise TypeError
+        value_raw = self.__typc_value__
+        value_raw[:] = _to_raw(len(value_raw), value)
 
     def __typc_set_part__(self, data: bytes, offset: int) -> None:
-        prev = self.__typc_value__
-        self.__typc_value__ = prev[:offset] + data + prev[offset + len(data):]
+        self.__typc_value__[offset:offset + len(data)] = data
 
     def __typc_changed__(self, source: TypcValue, data: bytes,
                          offset: int) -> None:
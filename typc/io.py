@@ -0,0 +1,699 @@
+from __future__ import annotations
+
+from mmap import ACCESS_READ, ACCESS_WRITE, PAGESIZE, mmap
+from operator import eq, ge, gt, itemgetter, le, lt, ne
+from os import PathLike, fstat
+from struct import Struct as BuiltinStruct
+from typing import (Any, BinaryIO, Callable, Dict, Generic, Iterable,
+                    Iterator, List, Optional, Sequence, Set, Tuple, Type,
+                    TypeVar, Union, cast, overload)
+
+from ._base import BUFFER, BaseType
+from ._impl import (NUMPY_AVAILABLE, TypcType, TypcValue, numpy_column,
+                    path_steps, resolve_path)
+from ._utils import buffer_bytes, buffer_size, check_buffer, check_records
+
+TYPE = TypeVar('TYPE', bound=BaseType)
+
+_object_setattr = object.__setattr__
+
+
+class BufferBinding:
+    __slots__ = ('__typc_buffer__', '__typc_dirty__')
+
+    __typc_buffer__: Any
+    __typc_dirty__: Set[int]
+
+    def __init__(self, buffer: Union[bytearray, memoryview, mmap]) -> None:
+        self.__typc_buffer__ = buffer
+        self.__typc_dirty__ = set()
+
+    def bind(self, value_type: Type[TYPE], offset: int = 0) -> TYPE:
+        value_type_: Any = value_type
+        if not isinstance(value_type_, TypcType):
+            raise TypeError(f'{value_type!r} is not typc type')
+        size = value_type_.__typc_size__
+        check_buffer(self.__typc_buffer__, offset, size)
+        return self.__typc_bind__(value_type_, offset)
+
+    def __typc_bind__(self, value_type: TypcType, offset: int) -> Any:
+        if value_type.__typc_scalar__() is not None:
+            return value_type.__typc_load__(self.__typc_buffer__, offset)
+        return value_type(
+            buffer_bytes(self.__typc_buffer__, offset,
+                         value_type.__typc_size__), (self, offset))
+
+    def store(self, value_type: Union[Type[TYPE], TypcType], offset: int,
+              value: Any) -> None:
+        value_type_: Any = value_type
+        if not isinstance(value_type_, TypcType):
+            raise TypeError(f'{value_type!r} is not typc type')
+        size = value_type_.__typc_size__
+        check_buffer(self.__typc_buffer__, offset, size)
+        value_type_.__typc_store__(self.__typc_buffer__, offset, value)
+        self._mark(offset, size)
+
+    def _mark(self, offset: int, size: int) -> None:
+        if size:
+            first_page = offset // PAGESIZE
+            last_page = (offset + size - 1) // PAGESIZE
+            self.__typc_dirty__.update(range(first_page, last_page + 1))
+
+    def __typc_changed__(self, source: TypcValue, data: bytes,
+                         offset: int) -> None:
+        self.__typc_buffer__[offset:offset + len(data)] = data
+        self._mark(offset, len(data))
+
+    def dirty_ranges(self) -> List[Tuple[int, int]]:
+        ranges: List[Tuple[int, int]] = []
+        for page in sorted(self.__typc_dirty__):
+            start = page * PAGESIZE
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], start + PAGESIZE)
+            else:
+                ranges.append((start, start + PAGESIZE))
+        if ranges:
+            total = buffer_size(self.__typc_buffer__)
+            ranges[-1] = (ranges[-1][0], min(ranges[-1][1], total))
+        return ranges
+
+    def flush(self) -> None:
+        buffer = self.__typc_buffer__
+        if isinstance(buffer, mmap):
+            for start, end in self.dirty_ranges():
+                buffer.flush(start, end - start)
+        self.__typc_dirty__.clear()
+
+
+class RecordCursor(Generic[TYPE]):
+    __slots__ = ('__typc_type__', '__typc_value__', '__typc_count__',
+                 '__typc_index__')
+
+    __typc_type__: TypcType
+    __typc_value__: Any
+    __typc_count__: int
+    __typc_index__: int
+
+    def __init__(self, record_type: Union[Type[TYPE], TypcType],
+                 buffer: Any) -> None:
+        record_type_: Any = record_type
+        if not isinstance(record_type_, TypcType):
+            raise TypeError(f'{record_type!r} is not typc type')
+        size = record_type_.__typc_size__
+        check_records(buffer, size)
+        value = record_type_.__typc_load__(buffer, 0)
+        if not isinstance(value, TypcValue):
+            raise TypeError(f'{record_type!r} has no view to reuse')
+        self.__typc_type__ = record_type_
+        self.__typc_value__ = value
+        self.__typc_count__ = buffer_size(buffer) // size
+        self.__typc_index__ = 0
+
+    def __len__(self) -> int:
+        return self.__typc_count__
+
+    def tell(self) -> int:
+        return self.__typc_index__
+
+    def seek(self, index: int) -> TYPE:
+        count = self.__typc_count__
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError
+        self.__typc_index__ = index
+        value = self.__typc_value__
+        _object_setattr(value, '__typc_offset__',
+                        index * self.__typc_type__.__typc_size__)
+        return value
+
+    def __iter__(self) -> Iterator[TYPE]:
+        value = self.__typc_value__
+        size = self.__typc_type__.__typc_size__
+        for idx in range(self.__typc_count__):
+            self.__typc_index__ = idx
+            _object_setattr(value, '__typc_offset__', idx * size)
+            yield value
+
+
+class Projection:
+    __slots__ = ('__typc_type__', '__typc_fields__', '__typc_groups__',
+                 '__typc_order__')
+
+    __typc_type__: TypcType
+    __typc_fields__: Tuple[str, ...]
+    __typc_groups__: List[Tuple[BuiltinStruct, List[int]]]
+    __typc_order__: Optional[Callable[[Tuple[Any, ...]], Tuple[Any, ...]]]
+
+    def __init__(self, record_type: Any, fields: Iterable[str]) -> None:
+        if not isinstance(record_type, TypcType):
+            raise TypeError(f'{record_type!r} is not typc type')
+        self.__typc_type__ = record_type
+        self.__typc_fields__ = fields = tuple(fields)
+        if not fields:
+            raise ValueError('Projection needs at least one field')
+        entries: List[Tuple[int, int, str, int]] = []
+        for idx, field in enumerate(fields):
+            offset, field_type = resolve_path(record_type, field)
+            size = field_type.__typc_size__
+            scalar = field_type.__typc_scalar__()
+            entries.append(
+                (offset, size, f'{size}s' if scalar is None else
+                 scalar.__typc_spec__.format, idx))
+        entries.sort()
+        layouts: List[List[Tuple[int, int, str, int]]] = []
+        ends: List[int] = []
+        for entry in entries:
+            offset, size, _, _ = entry
+            for layout_idx, end in enumerate(ends):
+                if end <= offset:
+                    layouts[layout_idx].append(entry)
+                    ends[layout_idx] = offset + size
+                    break
+            else:
+                layouts.append([entry])
+                ends.append(offset + size)
+        record_size = record_type.__typc_size__
+        groups = self.__typc_groups__ = []
+        for layout in layouts:
+            spec = ''
+            position = 0
+            for offset, size, field_format, _ in layout:
+                if offset > position:
+                    spec += f'{offset - position}x'
+                spec += field_format
+                position = offset + size
+            if record_size > position:
+                spec += f'{record_size - position}x'
+            groups.append((BuiltinStruct('<' + spec),
+                           [idx for _, _, _, idx in layout]))
+        self.__typc_order__ = None
+        positions = groups[0][1]
+        if len(groups) == 1 and positions != sorted(positions):
+            self.__typc_order__ = itemgetter(*(positions.index(idx)
+                                               for idx in range(len(fields))))
+
+    def fields(self) -> Tuple[str, ...]:
+        return self.__typc_fields__
+
+    def _merge(self, parts: Tuple[Tuple[Any, ...], ...]) -> Tuple[Any, ...]:
+        result: List[Any] = [None] * len(self.__typc_fields__)
+        for (_, positions), values in zip(self.__typc_groups__, parts):
+            for position, value in zip(positions, values):
+                result[position] = value
+        return tuple(result)
+
+    def unpack_from(self, buffer: Any, offset: int = 0) -> Tuple[Any, ...]:
+        if isinstance(buffer, TypcValue):
+            buffer = buffer.__typc_buffer_source__()
+        check_buffer(buffer, offset, self.__typc_type__.__typc_size__)
+        groups = self.__typc_groups__
+        if len(groups) > 1:
+            return self._merge(
+                tuple(spec.unpack_from(buffer, offset) for spec, _ in groups))
+        values = groups[0][0].unpack_from(buffer, offset)
+        order = self.__typc_order__
+        return values if order is None else order(values)
+
+    def __call__(self, buffer: Any, offset: int = 0) -> Tuple[Any, ...]:
+        return self.unpack_from(buffer, offset)
+
+    def iter_unpack(self, buffer: Any) -> Iterator[Tuple[Any, ...]]:
+        check_records(buffer, self.__typc_type__.__typc_size__)
+        groups = self.__typc_groups__
+        if len(groups) > 1:
+            return map(self._merge,
+                       zip(*(spec.iter_unpack(buffer) for spec, _ in groups)))
+        records = groups[0][0].iter_unpack(buffer)
+        order = self.__typc_order__
+        return records if order is None else map(order, records)
+
+    def unpack_many(self, buffer: Any) -> List[Tuple[Any, ...]]:
+        return list(self.iter_unpack(buffer))
+
+
+def _step_offsets(typc_type: TypcType,
+                  steps: List[Union[str, int]]) -> List[int]:
+    starts = [0]
+    for step in steps:
+        child = typc_type.__typc_child__(step)
+        assert child is not None
+        child_offset, typc_type = child
+        starts.append(starts[-1] + child_offset)
+    return [starts[-1] - start for start in starts[:-1]]
+
+
+def _descend(value: Any, steps: List[Union[str, int]],
+             direct: bool) -> Tuple[Any, int]:
+    # Stop at the first value still holding its raw storage, reading
+    # members of it would only materialize them
+    for depth, step in enumerate(steps):
+        if direct and value.__typc_raw_buffer__() is not None:
+            return value, depth
+        value = value[step] if isinstance(step, int) else getattr(value, step)
+    return value, len(steps)
+
+
+class Accessor:
+    __slots__ = ('__typc_offset__', '__typc_leaf__', '__typc_steps__',
+                 '__typc_offsets__', '__typc_direct__', '__typc_unpack__')
+
+    __typc_offset__: int
+    __typc_leaf__: TypcType
+    __typc_steps__: List[Union[str, int]]
+    __typc_offsets__: List[int]
+    __typc_direct__: bool
+    __typc_unpack__: Callable[[Any, int], Tuple[Any, ...]]
+
+    def __init__(self, record_type: Any, path: str) -> None:
+        if not isinstance(record_type, TypcType):
+            raise TypeError(f'{record_type!r} is not typc type')
+        self.__typc_offset__, leaf_type = resolve_path(record_type, path)
+        self.__typc_leaf__ = leaf_type
+        self.__typc_steps__ = steps = path_steps(path)
+        self.__typc_offsets__ = _step_offsets(record_type, steps)
+        self.__typc_direct__ = not leaf_type.__typc_padding__()
+        scalar = leaf_type.__typc_scalar__()
+        spec = (f'{leaf_type.__typc_size__}s'
+                if scalar is None else scalar.__typc_spec__.format)
+        self.__typc_unpack__ = BuiltinStruct('<' + spec).unpack_from
+
+    def __call__(self, target: Any, offset: int = 0) -> Any:
+        if isinstance(target, TypcValue):
+            location = target.__typc_location__()
+            if location is None:
+                steps = self.__typc_steps__
+                value, depth = _descend(target, steps, self.__typc_direct__)
+                if depth < len(steps):
+                    raw = value.__typc_raw_buffer__()
+                    return self.__typc_unpack__(
+                        raw, self.__typc_offsets__[depth])[0]
+                if not isinstance(value, TypcValue):
+                    return value
+                if self.__typc_leaf__.__typc_scalar__() is None:
+                    return bytes(value)
+                scalar_value: Any = value
+                return scalar_value.__typc_value__
+            target, base = location
+            offset += base
+        return self.__typc_unpack__(target, self.__typc_offset__ + offset)[0]
+
+
+class Setter:
+    __slots__ = ('__typc_offset__', '__typc_leaf__', '__typc_steps__',
+                 '__typc_offsets__', '__typc_direct__')
+
+    __typc_offset__: int
+    __typc_leaf__: TypcType
+    __typc_steps__: List[Union[str, int]]
+    __typc_offsets__: List[int]
+    __typc_direct__: bool
+
+    def __init__(self, record_type: Any, path: str) -> None:
+        if not isinstance(record_type, TypcType):
+            raise TypeError(f'{record_type!r} is not typc type')
+        self.__typc_offset__, self.__typc_leaf__ = resolve_path(
+            record_type, path)
+        self.__typc_steps__ = steps = path_steps(path)
+        self.__typc_offsets__ = _step_offsets(record_type, steps)
+        self.__typc_direct__ = self.__typc_leaf__.__typc_scalar__() is not None
+
+    def __call__(self, target: Any, value: Any, offset: int = 0) -> None:
+        if isinstance(target, TypcValue):
+            location = target.__typc_location__()
+            if location is None:
+                *steps, last = self.__typc_steps__
+                parent, depth = _descend(target, steps, self.__typc_direct__)
+                if (self.__typc_direct__
+                        and parent.__typc_raw_buffer__() is not None):
+                    self._patch(parent, value, self.__typc_offsets__[depth])
+                elif isinstance(last, int):
+                    parent[last] = value
+                else:
+                    setattr(parent, last, value)
+                return
+            target, base = location
+            offset += base
+        self.__typc_leaf__.__typc_store__(target,
+                                          self.__typc_offset__ + offset, value)
+
+    def _patch(self, target: TypcValue, value: Any, offset: int) -> None:
+        leaf_type = self.__typc_leaf__
+        data = bytearray(leaf_type.__typc_size__)
+        leaf_type.__typc_store__(data, 0, value)
+        target.__typc_set_part__(bytes(data), offset)
+        child_data = target.__typc_child_data__
+        if child_data is not None:
+            parent, target_offset = child_data
+            parent.__typc_changed__(target, bytes(data),
+                                    target_offset + offset)
+
+
+class RecordFile(Generic[TYPE]):
+    __slots__ = ('__typc_type__', '__typc_file__', '__typc_buffer__',
+                 '__typc_count__', '__typc_binding__')
+
+    __typc_type__: TypcType
+    __typc_file__: Optional[BinaryIO]
+    __typc_buffer__: Any
+    __typc_count__: int
+    __typc_binding__: Optional[BufferBinding]
+
+    def __init__(self,
+                 path: Union[str, PathLike[str]],
+                 record_type: Type[TYPE],
+                 writable: bool = False) -> None:
+        record_type_: Any = record_type
+        if not isinstance(record_type_, TypcType):
+            raise TypeError(f'{record_type!r} is not typc type')
+        self.__typc_type__ = record_type_
+        self.__typc_file__ = file = open(path, 'r+b' if writable else 'rb')
+        try:
+            if fstat(file.fileno()).st_size:
+                buffer: Any = mmap(
+                    file.fileno(),
+                    0,
+                    access=ACCESS_WRITE if writable else ACCESS_READ)
+            else:
+                buffer = bytearray() if writable else b''
+            check_records(buffer, record_type_.__typc_size__)
+        except BaseException:
+            file.close()
+            raise
+        self.__typc_buffer__ = buffer
+        self.__typc_count__ = len(buffer) // record_type_.__typc_size__
+        self.__typc_binding__ = BufferBinding(buffer) if writable else None
+
+    def dirty_ranges(self) -> List[Tuple[int, int]]:
+        binding = self.__typc_binding__
+        return [] if binding is None else binding.dirty_ranges()
+
+    def flush(self) -> None:
+        binding = self.__typc_binding__
+        if binding is not None:
+            binding.flush()
+
+    def close(self) -> None:
+        file = self.__typc_file__
+        if file is None:
+            return
+        self.flush()
+        self.__typc_binding__ = None
+        buffer = self.__typc_buffer__
+        if isinstance(buffer, mmap):
+            buffer.close()
+        file.close()
+        self.__typc_file__ = None
+        self.__typc_buffer__ = b''
+        self.__typc_count__ = 0
+
+    def __enter__(self) -> RecordFile[TYPE]:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _record(self, index: int) -> Any:
+        record_type = self.__typc_type__
+        offset = index * record_type.__typc_size__
+        binding = self.__typc_binding__
+        if binding is not None:
+            return binding.__typc_bind__(record_type, offset)
+        return record_type.__typc_load__(self.__typc_buffer__, offset)
+
+    def _index(self, index: int) -> int:
+        count = self.__typc_count__
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError
+        return index
+
+    def __len__(self) -> int:
+        return self.__typc_count__
+
+    @overload
+    def __getitem__(self, index: int) -> TYPE:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[TYPE]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [
+                self._record(idx)
+                for idx in range(*index.indices(self.__typc_count__))
+            ]
+        return self._record(self._index(index))
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        binding = self.__typc_binding__
+        if binding is None:
+            raise TypeError('Record file is not writable')
+        record_type = self.__typc_type__
+        binding.store(record_type,
+                      self._index(index) * record_type.__typc_size__, value)
+
+    def __iter__(self) -> Iterator[TYPE]:
+        for idx in range(self.__typc_count__):
+            yield self._record(idx)
+
+
+class Condition:
+    __slots__ = ()
+
+    def __typc_fields__(self, out: Set[str]) -> None:
+        raise NotImplementedError
+
+    def __typc_eval__(self, values: Dict[str, Any], vectorized: bool) -> Any:
+        raise NotImplementedError
+
+    def __and__(self, other: Condition) -> Condition:
+        return _AllOf(self, other)
+
+    def __or__(self, other: Condition) -> Condition:
+        return _AnyOf(self, other)
+
+    def __invert__(self) -> Condition:
+        return _Not(self)
+
+
+class Field:
+    __slots__ = ('__typc_path__', )
+
+    __typc_path__: str
+
+    def __init__(self, path: str) -> None:
+        self.__typc_path__ = path
+
+    def __eq__(self, value: Any) -> Condition:  # type: ignore
+        return _Compare(self, eq, value)
+
+    def __ne__(self, value: Any) -> Condition:  # type: ignore
+        return _Compare(self, ne, value)
+
+    def __lt__(self, value: Any) -> Condition:
+        return _Compare(self, lt, value)
+
+    def __le__(self, value: Any) -> Condition:
+        return _Compare(self, le, value)
+
+    def __gt__(self, value: Any) -> Condition:
+        return _Compare(self, gt, value)
+
+    def __ge__(self, value: Any) -> Condition:
+        return _Compare(self, ge, value)
+
+    __hash__ = None  # type: ignore
+
+
+class _Compare(Condition):
+    __slots__ = ('__typc_field__', '__typc_operator__', '__typc_value__')
+
+    __typc_field__: Field
+    __typc_operator__: Callable[[Any, Any], Any]
+    __typc_value__: Any
+
+    def __init__(self, field: Field, operator: Callable[[Any, Any], Any],
+                 value: Any) -> None:
+        self.__typc_field__ = field
+        self.__typc_operator__ = operator
+        self.__typc_value__ = value
+
+    def __typc_fields__(self, out: Set[str]) -> None:
+        out.add(self.__typc_field__.__typc_path__)
+        value = self.__typc_value__
+        if isinstance(value, Field):
+            out.add(value.__typc_path__)
+
+    def __typc_eval__(self, values: Dict[str, Any], vectorized: bool) -> Any:
+        value = self.__typc_value__
+        if isinstance(value, Field):
+            value = values[value.__typc_path__]
+        return self.__typc_operator__(
+            values[self.__typc_field__.__typc_path__], value)
+
+
+class _AllOf(Condition):
+    __slots__ = ('__typc_left__', '__typc_right__')
+
+    __typc_left__: Condition
+    __typc_right__: Condition
+
+    def __init__(self, left: Condition, right: Condition) -> None:
+        self.__typc_left__ = left
+        self.__typc_right__ = right
+
+    def __typc_fields__(self, out: Set[str]) -> None:
+        self.__typc_left__.__typc_fields__(out)
+        self.__typc_right__.__typc_fields__(out)
+
+    def __typc_eval__(self, values: Dict[str, Any], vectorized: bool) -> Any:
+        left = self.__typc_left__.__typc_eval__(values, vectorized)
+        if vectorized:
+            return left & self.__typc_right__.__typc_eval__(values, vectorized)
+        return left and self.__typc_right__.__typc_eval__(values, vectorized)
+
+
+class _AnyOf(Condition):
+    __slots__ = ('__typc_left__', '__typc_right__')
+
+    __typc_left__: Condition
+    __typc_right__: Condition
+
+    def __init__(self, left: Condition, right: Condition) -> None:
+        self.__typc_left__ = left
+        self.__typc_right__ = right
+
+    def __typc_fields__(self, out: Set[str]) -> None:
+        self.__typc_left__.__typc_fields__(out)
+        self.__typc_right__.__typc_fields__(out)
+
+    def __typc_eval__(self, values: Dict[str, Any], vectorized: bool) -> Any:
+        left = self.__typc_left__.__typc_eval__(values, vectorized)
+        if vectorized:
+            return left | self.__typc_right__.__typc_eval__(values, vectorized)
+        return left or self.__typc_right__.__typc_eval__(values, vectorized)
+
+
+class _Not(Condition):
+    __slots__ = ('__typc_operand__', )
+
+    __typc_operand__: Condition
+
+    def __init__(self, operand: Condition) -> None:
+        self.__typc_operand__ = operand
+
+    def __typc_fields__(self, out: Set[str]) -> None:
+        self.__typc_operand__.__typc_fields__(out)
+
+    def __typc_eval__(self, values: Dict[str, Any], vectorized: bool) -> Any:
+        result = self.__typc_operand__.__typc_eval__(values, vectorized)
+        return ~result if vectorized else not result
+
+
+def _match_condition(record_type: TypcType, buffer: Any, count: int,
+                     condition: Condition) -> List[int]:
+    fields: Set[str] = set()
+    condition.__typc_fields__(fields)
+    names = sorted(fields)
+    paths = [resolve_path(record_type, name) for name in names]
+    scalars = [
+        scalar for scalar in (path_type.__typc_scalar__()
+                              for _, path_type in paths) if scalar is not None
+    ]
+    if NUMPY_AVAILABLE and len(scalars) == len(names):
+        from numpy import nonzero  # pylint: disable=import-outside-toplevel
+        size = record_type.__typc_size__
+        columns = {
+            name: numpy_column(name, scalar, buffer, offset, size, count)
+            for name, (offset, _), scalar in zip(names, paths, scalars)
+        }
+        return nonzero(condition.__typc_eval__(columns, True))[0].tolist()
+    projection = Projection(record_type, names)
+    return [
+        idx for idx, values in enumerate(projection.iter_unpack(buffer))
+        if condition.__typc_eval__(dict(zip(names, values)), False)
+    ]
+
+
+class Query(Generic[TYPE]):
+    __slots__ = ('__typc_type__', '__typc_buffer__', '__typc_predicates__')
+
+    __typc_type__: TypcType
+    __typc_buffer__: Any
+    __typc_predicates__: Tuple[Any, ...]
+
+    def __init__(self,
+                 record_type: Union[Type[TYPE], TypcType],
+                 buffer: Any,
+                 predicates: Sequence[Any] = ()) -> None:
+        record_type_: Any = record_type
+        if not isinstance(record_type_, TypcType):
+            raise TypeError(f'{record_type!r} is not typc type')
+        check_records(buffer, record_type_.__typc_size__)
+        self.__typc_type__ = record_type_
+        self.__typc_buffer__ = buffer
+        self.__typc_predicates__ = tuple(predicates)
+
+    def where(
+        self,
+        predicate: Union[Condition, Callable[[TYPE], Any]],
+    ) -> Query[TYPE]:
+        return Query(self.__typc_type__, self.__typc_buffer__,
+                     self.__typc_predicates__ + (predicate, ))
+
+    def indices(self) -> List[int]:
+        record_type = self.__typc_type__
+        buffer = self.__typc_buffer__
+        count = buffer_size(buffer) // record_type.__typc_size__
+        conditions = [
+            predicate for predicate in self.__typc_predicates__
+            if isinstance(predicate, Condition)
+        ]
+        callables = [
+            predicate for predicate in self.__typc_predicates__
+            if not isinstance(predicate, Condition)
+        ]
+        matches: Optional[List[int]] = None
+        if conditions:
+            condition = conditions[0]
+            for other in conditions[1:]:
+                condition = condition & other
+            matches = _match_condition(record_type, buffer, count, condition)
+        if callables:
+            cursor: RecordCursor[TYPE] = RecordCursor(record_type, buffer)
+            seek = cursor.seek
+            matches = [
+                idx for idx in (range(count) if matches is None else matches)
+                if all(predicate(seek(idx)) for predicate in callables)
+            ]
+        return list(range(count)) if matches is None else matches
+
+    def select(self, *fields: str) -> List[Any]:
+        record_type = self.__typc_type__
+        buffer = self.__typc_buffer__
+        size = record_type.__typc_size__
+        if not fields:
+            return [
+                record_type.from_buffer(buffer, idx * size)
+                for idx in self.indices()
+            ]
+        projection = Projection(record_type, fields)
+        if not self.__typc_predicates__:
+            return projection.unpack_many(buffer)
+        unpack = projection.unpack_from
+        return [unpack(buffer, idx * size) for idx in self.indices()]
+
+
+def query(source: Union[RecordFile[TYPE], BUFFER],
+          record_type: Optional[Type[TYPE]] = None) -> Query[TYPE]:
+    if isinstance(source, RecordFile):
+        if record_type is None:
+            record_type = cast(Type[TYPE], source.__typc_type__)
+        return Query(record_type, source.__typc_buffer__)
+    if record_type is None:
+        raise TypeError('Record type is required for raw buffers')
+    return Query(record_type, source)
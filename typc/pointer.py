@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import (Any, Generic, Literal, Optional, Tuple, Type, TypeVar,
-                    Union, cast, overload)
-
-from ._base import BaseType, ContainerBase
-from ._impl import TypcAtomType, TypcType, TypcValue
-from ._utils import false_isinstance, false_issubclass, generic_class_getitem
+from typing import (Any, BinaryIO, Generic, List, Literal, Optional, Tuple,
+                    Type, TypeVar, Union, cast, overload)
+
+from ._base import BUFFER, BaseType, ContainerBase
+from ._impl import (TypcAtomType, TypcParent, TypcType, TypcValue,
+                    intern_type)
+from ._utils import (check_buffer, false_isinstance, false_issubclass,
+                     generic_class_getitem)
 from .atom import AtomType
 from .atoms import UInt16, UInt32, UInt64
 
@@ -37,11 +39,12 @@ class PointerType(TypcType):
         self.__typc_spec__ = int_type.__typc_spec__
         self.__typc_size__ = int_type.__typc_size__
         self.__typc_name__ = name
+        self.__typc_hash__ = hash(('pointer', int_type))
 
     def __call__(
         self,
         values: Union[Literal[None], bytes, int, PointerValue] = None,
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> PointerValue:
         return PointerValue(self, values, child_data)
 
@@ -58,6 +61,7 @@ class PointerType(TypcType):
         new_type.__typc_spec__ = self.__typc_spec__
         new_type.__typc_size__ = self.__typc_size__
         new_type.__typc_name__ = self.__typc_name__
+        new_type.__typc_hash__ = self.__typc_hash__
         new_type.__typc_int_type__ = self.__typc_int_type__
         new_type.__typc_ref_type__ = self.__typc_ref_type__
         return new_type
@@ -69,6 +73,46 @@ class PointerType(TypcType):
                 and obj.__typc_int_type__ == self.__typc_int_type__
                 and obj.__typc_ref_type__ == self.__typc_ref_type__)
 
+    def __hash__(self) -> int:
+        return self.__typc_hash__
+
+    def __typc_intern_key__(self) -> Optional[Tuple[Any, ...]]:
+        if self.__typc_ref_type__ is None:
+            return None
+        return ('pointer', id(self.__typc_int_type__),
+                id(self.__typc_ref_type__))
+
+    def __typc_load__(self, buffer: Any, offset: int) -> int:
+        return self.__typc_int_type__.__typc_load__(buffer, offset)
+
+    def __typc_store__(self, buffer: Any, offset: int, value: Any) -> None:
+        self.__typc_int_type__.__typc_store__(buffer, offset,
+                                              self.__typc_to_int__(value))
+
+    def __typc_leaf_format__(self) -> Tuple[str, int]:
+        return self.__typc_int_type__.__typc_leaf_format__()
+
+    def __typc_scalar__(self) -> TypcAtomType:
+        return self.__typc_int_type__
+
+    def from_buffer(self, buffer: Any, offset: int = 0) -> PointerValue:
+        check_buffer(buffer, offset, self.__typc_size__)
+        return PointerValue(self, self.__typc_load__(buffer, offset))
+
+    def to_numpy_dtype(self) -> Any:
+        return self.__typc_int_type__.to_numpy_dtype()
+
+    def __typc_to_int__(self, value: Any) -> int:
+        if value is None:
+            return 0
+        if isinstance(value, int):
+            return value
+        if isinstance(value, bytes):
+            return self.__typc_spec__.unpack(value)[0]
+        if isinstance(value, PointerValue):
+            return value.__typc_value__
+        raise TypeError
+
     def int_type(self) -> TypcType:
         return self.__typc_int_type__
 
@@ -96,6 +140,14 @@ class PointerType(TypcType):
         return false_issubclass(subclass)
 
 
+def anonymous_pointer(int_type: TypcAtomType,
+                      ref_type: Optional[REFX]) -> PointerType:
+    if ref_type is None:
+        return PointerType(int_type, None, None)
+    return intern_type(('pointer', id(int_type), id(ref_type)), PointerType,
+                       int_type, ref_type, None)
+
+
 class PointerValue(TypcValue):
     __slots__ = ('__typc_value__', )
     __typc_type__: PointerType
@@ -105,7 +157,7 @@ class PointerValue(TypcValue):
         self,
         ptr_type: PointerType,
         values: Union[Literal[None], bytes, int, PointerValue] = None,
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> None:
         self.__typc_type__ = ptr_type
         self.__typc_child_data__ = child_data
@@ -120,6 +172,13 @@ class PointerValue(TypcValue):
     def __bytes__(self) -> bytes:
         return self.__typc_type__.__typc_spec__.pack(self.__typc_value__)
 
+    def __typc_pack_into__(self, buffer: Any, offset: int) -> None:
+        self.__typc_type__.__typc_int_type__.__typc_le_spec__.pack_into(
+            buffer, offset, self.__typc_value__)
+
+    def __typc_leaves__(self, out: List[Any]) -> None:
+        out.append(self.__typc_value__)
+
     def __int__(self) -> int:
         return self.__typc_value__
 
@@ -129,18 +188,7 @@ class PointerValue(TypcValue):
     def set(self,
             value: Union[Literal[None], bytes, int,
                          PointerValue] = None) -> None:
-        value_: Any = value
-        if value_ is None:
-            int_value = 0
-        elif isinstance(value_, int):
-            int_value = value_
-        elif isinstance(value_, bytes):
-            int_value, = self.__typc_type__.__typc_spec__.unpack(value_)
-        elif isinstance(value_, PointerValue):
-            int_value = value_.__typc_value__
-        else:
-            raise TypeError
-        self.__typc_value__ = int_value
+        self.__typc_value__ = self.__typc_type__.__typc_to_int__(value)
 
     def __typc_set__(self, value: Any) -> None:
         self.set(value)
@@ -195,6 +243,19 @@ class _Pointer(BaseType, Generic[INT, REF], metaclass=PointerMeta):
         # pylint: disable=super-init-not-called
         raise NotImplementedError
 
+    @classmethod
+    def from_buffer(cls: Type[_Pointer[INT, REF]],
+                    buffer: BUFFER,
+                    offset: int = 0) -> _Pointer[INT, REF]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def read(cls: Type[_Pointer[INT, REF]],
+             fileobj: BinaryIO) -> _Pointer[INT, REF]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
     @overload
     def __get__(self, owner: Literal[None],
                 inst: Type[ContainerBase]) -> Type[_Pointer[INT, REF]]:
@@ -281,19 +342,8 @@ class _Pointer(BaseType, Generic[INT, REF], metaclass=PointerMeta):
         # pylint: disable=arguments-differ
         int_type = args[0]
         assert isinstance(int_type, TypcAtomType)
-
-        # Do not specify type args for _Pointer to avoid recursion
-        class PointerSized(_Pointer):  # type: ignore
-            __typc_int_type__ = cast(Type[INT], int_type)
-
-            def __class_getitem__(cls, ref_type: Any) -> Any:
-                if isinstance(ref_type, TypcType) or ref_type is Void:
-                    return PointerType(int_type, ref_type, None)
-                if ref_type is ForwardRef:
-                    return PointerType(int_type, None, None)
-                return generic_class_getitem(cls, ref_type)
-
-        return PointerSized
+        return intern_type(('sized_pointer', int_type), _sized_pointer,
+                           int_type)
 
     def __new__(  # pylint: disable=arguments-differ
         cls,
@@ -307,12 +357,27 @@ class _Pointer(BaseType, Generic[INT, REF], metaclass=PointerMeta):
             ref_type = None
         else:
             raise TypeError
-        pointer_type = PointerType(cast(TypcAtomType, cls.__typc_int_type__),
-                                   ref_type, None)
+        pointer_type = anonymous_pointer(
+            cast(TypcAtomType, cls.__typc_int_type__), ref_type)
         pointer_value = PointerValue(pointer_type, value)
         return pointer_value
 
 
+def _sized_pointer(int_type: TypcAtomType) -> type:
+    # Do not specify type args for _Pointer to avoid recursion
+    class PointerSized(_Pointer):  # type: ignore
+        __typc_int_type__ = cast(Type[AtomType[int]], int_type)
+
+        def __class_getitem__(cls, ref_type: Any) -> Any:
+            if isinstance(ref_type, TypcType) or ref_type is Void:
+                return anonymous_pointer(int_type, ref_type)
+            if ref_type is ForwardRef:
+                return anonymous_pointer(int_type, None)
+            return generic_class_getitem(cls, ref_type)
+
+    return PointerSized
+
+
 class Pointer16(_Pointer[UInt16, REF], Generic[REF]):
     pass
 
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
 from struct import Struct as BuiltinStruct
-from typing import (Any, Dict, Iterator, List, Literal, Optional, Tuple, Type,
-                    TypeVar, Union, cast, overload)
+from typing import (Any, BinaryIO, Callable, Dict, Iterable, Iterator, List,
+                    Literal, Optional, Tuple, Type, TypeVar, Union, cast,
+                    overload)
 
-from ._base import BaseType, ContainerBase
-from ._impl import TypcAtomType, TypcAtomValue, TypcType, TypcValue
+from ._base import BUFFER, BaseType, ContainerBase
+from ._impl import TypcAtomType, TypcParent, TypcType, TypcValue
 from ._meta import MAP, MEMBER, members_from_class
 from ._modifier import Modified
-from ._utils import false_isinstance, false_issubclass
+from ._utils import (buffer_bytes, buffer_slice, check_buffer,
+                     clear_padding, false_isinstance, false_issubclass,
+                     format_padding, members_dtype)
+from .io import Accessor, Projection, RecordCursor, Setter
 from .modifier import Padding
 
 SELF = TypeVar('SELF', bound='Struct')
@@ -22,10 +28,135 @@ def field_to_spec(field: TypcType) -> str:
             if isinstance(field, TypcAtomType) else f'{field.__typc_size__}s')
 
 
+class StructCodec:
+    __slots__ = ('encode', 'encode_into', 'decode', 'assign', 'leaves',
+                 'assign_leaves', 'leaf_format', 'leaf_count', 'leaf_spec',
+                 'padding', 'flat')
+
+    encode: Callable[[Dict[str, TypcValue]], bytes]
+    encode_into: Callable[[Dict[str, TypcValue], Any, int], None]
+    decode: Callable[[TypcValue, Tuple[Any, ...], Optional[int]],
+                     Dict[str, TypcValue]]
+    assign: Callable[[Dict[str, TypcValue], Tuple[Any, ...]], None]
+    leaves: Callable[[Dict[str, TypcValue], List[Any]], None]
+    assign_leaves: Callable[
+        [Dict[str, TypcValue], Tuple[Any, ...], int, bytes, int], None]
+    leaf_format: str
+    leaf_count: int
+    leaf_spec: BuiltinStruct
+    padding: List[Tuple[int, int]]
+    flat: bool
+
+
+def compile_codec(struct_type: StructType) -> StructCodec:
+    codec = StructCodec()
+    namespace: Dict[str, Any] = {
+        'pack': struct_type.__typc_spec__.pack,
+        'pack_into': struct_type.__typc_spec__.pack_into,
+    }
+    pack_args: List[str] = []
+    plain_items: List[str] = []
+    child_items: List[str] = []
+    assign_lines: List[str] = []
+    leaves_lines: List[str] = []
+    assign_leaves_lines: List[str] = []
+    leaf_format = ''
+    leaf_count = 0
+    position = 0
+    flat = True
+    blob_padding: List[Tuple[int, int]] = []
+    for idx, (name, (offset, member_type)) in enumerate(
+            struct_type.__typc_members__.items()):
+        namespace[f't{idx}'] = member_type
+        if offset > position:
+            leaf_format += f'{offset - position}x'
+        member_format, member_count = member_type.__typc_leaf_format__()
+        leaf_format += member_format
+        position = offset + member_type.__typc_size__
+        if member_format != field_to_spec(member_type):
+            flat = False
+        else:
+            blob_padding.extend(
+                (offset + start, offset + end)
+                for start, end in member_type.__typc_padding__())
+        if isinstance(member_type, TypcAtomType):
+            pack_args.append(f'values[{name!r}].__typc_value__')
+            leaves_lines.append(
+                f'    out.append(values[{name!r}].__typc_value__)')
+            assign_leaves_lines.append(
+                f'    values[{name!r}].__typc_value__ = '
+                f'leaves[start + {leaf_count}]')
+        else:
+            pack_args.append(f'values[{name!r}].__bytes__()')
+            leaves_lines.append(f'    values[{name!r}].__typc_leaves__(out)')
+            assign_leaves_lines.append(
+                f'    values[{name!r}].__typc_set_leaves__('
+                f'leaves, start + {leaf_count}, data, offset + {offset})')
+        leaf_count += member_count
+        plain_items.append(f'{name!r}: t{idx}(raw[{idx}])')
+        child_items.append(f'{name!r}: t{idx}(raw[{idx}], '
+                           f'(owner, base + {offset}))')
+        assign_lines.append(f'    values[{name!r}].__typc_set__(raw[{idx}])')
+    if struct_type.__typc_size__ > position:
+        leaf_format += f'{struct_type.__typc_size__ - position}x'
+    codec.leaf_format = leaf_format
+    codec.leaf_count = leaf_count
+    codec.leaf_spec = BuiltinStruct('<' + leaf_format)
+    codec.padding = sorted(format_padding(leaf_format) + blob_padding)
+    codec.flat = flat
+    namespace['leaf_pack'] = codec.leaf_spec.pack
+    namespace['leaf_pack_into'] = codec.leaf_spec.pack_into
+    if flat:
+        encode_lines = [f'    return pack({", ".join(pack_args)})']
+        encode_into_lines = [
+            f'    pack_into(buffer, offset, {", ".join(pack_args)})'
+        ]
+    else:
+        encode_lines = [
+            '    out = []',
+            '    leaves(values, out)',
+            '    return leaf_pack(*out)',
+        ]
+        encode_into_lines = [
+            '    out = []',
+            '    leaves(values, out)',
+            '    leaf_pack_into(buffer, offset, *out)',
+        ]
+    source = '\n'.join((
+        'def leaves(values, out):',
+        *leaves_lines,
+        'def encode(values):',
+        *encode_lines,
+        'def encode_into(values, buffer, offset):',
+        *encode_into_lines,
+        'def decode(owner, raw, base):',
+        '    if base is None:',
+        f'        return {{{", ".join(plain_items)}}}',
+        f'    return {{{", ".join(child_items)}}}',
+        'def assign(values, raw):',
+        *assign_lines,
+        'def assign_leaves(values, leaves, start, data, offset):',
+        *assign_leaves_lines,
+    ))
+    exec(source, namespace)  # pylint: disable=exec-used
+    codec.encode = namespace['encode']
+    codec.encode_into = namespace['encode_into']
+    codec.decode = namespace['decode']
+    codec.assign = namespace['assign']
+    codec.leaves = namespace['leaves']
+    codec.assign_leaves = namespace['assign_leaves']
+    return codec
+
+
 class StructType(TypcType):
-    __slots__ = ('__typc_members__', )
+    __slots__ = ('__typc_members__', '__typc_indices__', '__typc_offsets__',
+                 '__typc_layout__', '__typc_codec__')
 
     __typc_members__: Dict[str, Tuple[int, TypcType]]
+    __typc_indices__: Dict[str, int]
+    __typc_offsets__: List[int]
+    __typc_layout__: List[Tuple[str, int, TypcType]]
+    __typc_codec__: Optional[StructCodec]
     __typc_name__: str
 
     def __init__(self, name: str, members: MAP) -> None:
@@ -57,12 +188,26 @@ class StructType(TypcType):
                     spec += f'{padding}x'
         self.__typc_spec__ = BuiltinStruct('<' + spec)
         self.__typc_size__ = self.__typc_spec__.size
+        self.__typc_indices__ = {
+            member_name: idx
+            for idx, member_name in enumerate(members_dict)
+        }
+        self.__typc_layout__ = [
+            (member_name, member_offset, member_type)
+            for member_name, (member_offset,
+                              member_type) in members_dict.items()
+        ]
+        self.__typc_offsets__ = [
+            member_offset for _, member_offset, _ in self.__typc_layout__
+        ]
+        self.__typc_hash__ = hash(('struct', tuple(self.__typc_layout__)))
+        self.__typc_codec__ = None
 
     def __call__(
         self,
         values: Union[Literal[None], Literal[0], bytes, Tuple[Any, ...],
                       StructValue] = None,
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> StructValue:
         if values == 0:
             return StructValue(self, None, child_data)
@@ -76,16 +221,87 @@ class StructType(TypcType):
         new_type.__typc_spec__ = self.__typc_spec__
         new_type.__typc_size__ = self.__typc_size__
         new_type.__typc_name__ = self.__typc_name__
+        new_type.__typc_hash__ = self.__typc_hash__
         new_type.__typc_members__ = self.__typc_members__
+        new_type.__typc_indices__ = self.__typc_indices__
+        new_type.__typc_offsets__ = self.__typc_offsets__
+        new_type.__typc_layout__ = self.__typc_layout__
+        new_type.__typc_codec__ = self.__typc_codec__
         return new_type
 
+    def __typc_get_codec__(self) -> StructCodec:
+        codec = self.__typc_codec__
+        if codec is None:
+            codec = self.__typc_codec__ = compile_codec(self)
+        return codec
+
+    def __typc_leaf_format__(self) -> Tuple[str, int]:
+        codec = self.__typc_get_codec__()
+        return codec.leaf_format, codec.leaf_count
+
+    def __typc_padding__(self) -> List[Tuple[int, int]]:
+        return self.__typc_get_codec__().padding
+
+    def __typc_children__(self) -> List[Tuple[Any, int, TypcType]]:
+        return list(self.__typc_layout__)
+
+    def __typc_child__(self, key: Any) -> Optional[Tuple[int, TypcType]]:
+        return self.__typc_members__.get(key)
+
+    def __typc_record__(self, raw: Tuple[Any, ...]) -> StructValue:
+        return StructValue(self, raw)
+
+    def to_numpy_dtype(self) -> Any:
+        return members_dtype(self.__typc_members__, self.__typc_size__)
+
+    def view(self, buffer: Any, offset: int = 0) -> StructView:
+        check_buffer(buffer, offset, self.__typc_size__)
+        return StructView(self, buffer, offset)
+
+    def cursor(self, buffer: Any) -> RecordCursor[Any]:
+        return RecordCursor(self, buffer)
+
+    def project(self, fields: Iterable[str]) -> Projection:
+        return Projection(self, fields)
+
+    def accessor(self, path: str) -> Accessor:
+        return Accessor(self, path)
+
+    def setter(self, path: str) -> Setter:
+        return Setter(self, path)
+
+    def __typc_load__(self, buffer: Any, offset: int) -> StructView:
+        return StructView(self, buffer, offset)
+
+    def __typc_store__(self, buffer: Any, offset: int, value: Any) -> None:
+        size = self.__typc_size__
+        if value in (None, 0):
+            buffer[offset:offset + size] = bytes(size)
+        elif isinstance(value, tuple):
+            for (member_offset, member_type), val in zip(
+                    self.__typc_members__.values(), value):
+                member_type.__typc_store__(buffer, offset + member_offset,
+                                           val)
+        else:
+            if isinstance(value, (StructValue, StructView)):
+                value = bytes(value)
+            elif not isinstance(value, bytes):
+                raise TypeError
+            if len(value) != size:
+                raise ValueError
+            buffer[offset:offset + size] = value
+
     def __eq__(self, obj: object) -> bool:
         if obj is self:
             return True
         return (isinstance(obj, StructType)
+                and obj.__typc_hash__ == self.__typc_hash__
                 and tuple(obj.__typc_members__.items()) == tuple(
                     self.__typc_members__.items()))
 
+    def __hash__(self) -> int:
+        return self.__typc_hash__
+
     def __getattr__(self, name: str) -> TypcType:
         if name in self.__typc_members__:
             return self.__typc_members__[name][1]
@@ -106,7 +322,7 @@ class StructType(TypcType):
         return name in self.__typc_members__
 
     def __instancecheck__(self, instance: Any) -> bool:
-        if isinstance(instance, StructValue):
+        if isinstance(instance, (StructValue, StructView)):
             return instance.__typc_type__ == self
         return false_isinstance(instance)
 
@@ -118,15 +334,32 @@ class StructType(TypcType):
         return false_issubclass(subclass)
 
 
-STRUCT_VALUE_ATTRS = ('__typc_type__', '__typc_child_data__',
-                      '__typc_inited__', '__typc_value__')
+STRUCT_VALUE_ATTRS = ('__typc_type__', '__typc_child_data__', '__typc_raw__',
+                      '__typc_value__')
+
+
+def _struct_raw(
+    struct_type: StructType,
+    values: Any,
+) -> Optional[Union[bytes, Tuple[Any, ...]]]:
+    if values in (None, 0):
+        return None
+    if isinstance(values, bytes):
+        if len(values) != struct_type.__typc_size__:
+            raise ValueError
+        return values
+    if isinstance(values, (StructValue, StructView)):
+        return bytes(values)
+    if isinstance(values, tuple):
+        return values
+    raise TypeError
 
 
 class StructValue(TypcValue):
-    __slots__ = ('__typc_inited__', '__typc_value__')
+    __slots__ = ('__typc_raw__', '__typc_value__')
 
     __typc_type__: StructType
-    __typc_inited__: bool
+    __typc_raw__: Optional[Union[bytes, bytearray, Tuple[Any, ...]]]
     __typc_value__: Dict[str, TypcValue]
 
     def __init__(
@@ -134,65 +367,157 @@ class StructValue(TypcValue):
         struct_type: StructType,
         values: Optional[Union[Tuple[Any, ...], bytes, StructValue,
                                Literal[None], Literal[0]]],
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> None:
         self.__typc_type__ = struct_type
         self.__typc_child_data__ = child_data
-        if values in (None, 0):
-            self.__typc_inited__ = False
-            return
-        if isinstance(values, bytes):
-            values_tuple = struct_type.__typc_spec__.unpack(values)
-        elif isinstance(values, StructValue):
-            values_tuple = struct_type.__typc_spec__.unpack(bytes(values))
-        elif isinstance(values, tuple):
-            values_tuple = values
-        else:
-            raise TypeError
-        self.__typc_value__ = {
-            member_name: member_type(
-                val,
-                None if child_data is None else
-                (self, child_data[1] + member_offset),
-            )
-            for (member_name, (member_offset, member_type)), val in zip(
-                struct_type.__typc_members__.items(), values_tuple)
-        }
-        self.__typc_inited__ = True
+        self.__typc_value__ = {}
+        self.__typc_raw__ = _struct_raw(struct_type, values)
+
+    def _raw_member(self, name: str) -> Any:
+        raw = self.__typc_raw__
+        if raw is None:
+            return None
+        self_type = self.__typc_type__
+        if isinstance(raw, tuple):
+            idx = self_type.__typc_indices__[name]
+            return raw[idx] if idx < len(raw) else None
+        member_offset, member_type = self_type.__typc_members__[name]
+        if isinstance(member_type, TypcAtomType):
+            return member_type.__typc_load__(raw, member_offset)
+        return bytes(raw[member_offset:member_offset +
+                         member_type.__typc_size__])
+
+    def _materialize(self, name: str, value: Any = None) -> TypcValue:
+        members = self.__typc_type__.__typc_members__
+        member_offset, member_type = members[name]
+        child_data = self.__typc_child_data__
+        member_value = member_type(
+            value,
+            None if child_data is None else
+            (self, child_data[1] + member_offset),
+        )
+        values_dict = self.__typc_value__
+        values_dict[name] = member_value
+        # A bytearray is storage owned for readinto, keep it for reuse
+        if (len(values_dict) == len(members)
+                and not isinstance(self.__typc_raw__, bytearray)):
+            self.__typc_raw__ = None
+        return member_value
+
+    def _raw_tuple(self) -> Optional[Tuple[Any, ...]]:
+        self_type = self.__typc_type__
+        raw = self.__typc_raw__
+        if raw is None:
+            return (None, ) * len(self_type.__typc_members__)
+        if isinstance(raw, (bytes, bytearray)):
+            return self_type.__typc_spec__.unpack(raw)
+        if len(raw) == len(self_type.__typc_members__):
+            return raw
+        return None
+
+    def _materialize_all(self) -> Dict[str, TypcValue]:
+        values_dict = self.__typc_value__
+        if not values_dict:
+            raw_tuple = self._raw_tuple()
+            if raw_tuple is not None:
+                child_data = self.__typc_child_data__
+                values_dict = self.__typc_value__ = (
+                    self.__typc_type__.__typc_get_codec__().decode(
+                        self, raw_tuple,
+                        None if child_data is None else child_data[1]))
+                if not isinstance(self.__typc_raw__, bytearray):
+                    self.__typc_raw__ = None
+                return values_dict
+        for name in self.__typc_type__.__typc_members__:
+            if name not in values_dict:
+                self._materialize(name, self._raw_member(name))
+        return values_dict
 
     def __typc_set__(self, value: Any) -> None:
-        if not self.__typc_inited__:
-            self.__init__(self.__typc_type__, value)  # type: ignore
+        self_type = self.__typc_type__
+        if isinstance(value, tuple):
+            members = self_type.__typc_members__
+            values_dict = self._materialize_all()
+            if len(value) < len(members):
+                for name, member_value in zip(members, value):
+                    values_dict[name].__typc_set__(member_value)
+            else:
+                self_type.__typc_get_codec__().assign(values_dict, value)
             return
+        self.__typc_raw__ = _struct_raw(self_type, value)
+        values_dict = self.__typc_value__
+        if not values_dict:
+            return
+        if len(values_dict) == len(self_type.__typc_members__):
+            codec = self_type.__typc_get_codec__()
+            raw = self.__typc_raw__
+            if isinstance(raw, bytes) and not codec.flat:
+                codec.assign_leaves(values_dict, codec.leaf_spec.unpack(raw),
+                                    0, raw, 0)
+                self.__typc_raw__ = None
+                return
+            raw_tuple = self._raw_tuple()
+            if raw_tuple is not None:
+                codec.assign(values_dict, raw_tuple)
+                self.__typc_raw__ = None
+                return
+        for name, prev_val in list(values_dict.items()):
+            prev_val.__typc_set__(self._raw_member(name))
+        if len(values_dict) == len(self_type.__typc_members__):
+            self.__typc_raw__ = None
+
+    def __typc_leaves__(self, out: List[Any]) -> None:
         self_type = self.__typc_type__
-        new_values: Tuple[Any, ...]
-        if value in (None, 0):
-            new_values = (0, ) * len(self_type.__typc_members__)
-        elif isinstance(value, bytes):
-            new_values = self_type.__typc_spec__.unpack(value)
-        elif isinstance(value, StructValue):
-            new_values = self_type.__typc_spec__.unpack(bytes(value))
-        elif isinstance(value, tuple):
-            new_values = value
+        codec = self_type.__typc_get_codec__()
+        values_dict = self.__typc_value__
+        if len(values_dict) == len(self_type.__typc_members__):
+            codec.leaves(values_dict, out)
         else:
-            raise TypeError
+            out.extend(codec.leaf_spec.unpack(bytes(self)))
+
+    def __typc_set_leaves__(self, leaves: Tuple[Any, ...], start: int,
+                            data: bytes, offset: int) -> None:
+        self_type = self.__typc_type__
         values_dict = self.__typc_value__
-        for prev_val, new_val in zip(list(values_dict.values()), new_values):
-            prev_val.__typc_set__(new_val)
+        if len(values_dict) == len(self_type.__typc_members__):
+            self_type.__typc_get_codec__().assign_leaves(
+                values_dict, leaves, start, data, offset)
+        else:
+            self.__typc_set__(data[offset:offset + self_type.__typc_size__])
 
     def __typc_set_part__(self, data: bytes, offset: int) -> None:
+        self_type = self.__typc_type__
+        members = self_type.__typc_members__
+        if isinstance(self.__typc_raw__, tuple):
+            self._materialize_all()
+        values_dict = self.__typc_value__
+        if len(values_dict) < len(members):
+            raw = self.__typc_raw__
+            if isinstance(raw, bytearray):
+                raw[offset:offset + len(data)] = data
+            else:
+                if raw is None:
+                    raw = bytes(self_type.__typc_size__)
+                assert isinstance(raw, bytes)
+                self.__typc_raw__ = (raw[:offset] + data +
+                                     raw[offset + len(data):])
         last_byte = offset + len(data) - 1
-        for name, (member_start, member_type) in (
-                self.__typc_type__.__typc_members__.items()):
+        layout = self_type.__typc_layout__
+        first = max(bisect_right(self_type.__typc_offsets__, offset) - 1, 0)
+        for idx in range(first, len(layout)):
+            name, member_start, member_type = layout[idx]
             if member_start > last_byte:
                 break
             member_end = member_start + member_type.__typc_size__ - 1
             if member_end < offset:
                 continue
+            member_value = values_dict.get(name)
+            if member_value is None:
+                continue
             start = max(member_start, offset)
             end = min(member_end, last_byte)
             data_part = data[start - offset:end + 1 - offset]
-            member_value = self.__typc_value__[name]
             member_value.__typc_set_part__(data_part, start - member_start)
 
     def __typc_changed__(self, source: TypcValue, data: bytes,
@@ -201,43 +526,73 @@ class StructValue(TypcValue):
         parent, _ = self.__typc_child_data__
         parent.__typc_changed__(self, data, offset)
 
-    def _zero_init(self) -> None:
-        child_data = self.__typc_child_data__
-        self.__typc_value__ = {
-            member_name: member_type(
-                0,
-                None if child_data is None else
-                (self, child_data[1] + member_offset),
-            )
-            for member_name, (member_offset, member_type) in (
-                self.__typc_type__.__typc_members__.items())
-        }
-        self.__typc_inited__ = True
+    def __typc_fill_buffer__(self) -> bytearray:
+        raw = self.__typc_raw__
+        if isinstance(raw, bytearray):
+            return raw
+        if isinstance(raw, tuple):
+            self._materialize_all()
+            raw = None
+        self_type = self.__typc_type__
+        storage = (bytearray(self_type.__typc_size__) if raw is None else
+                   bytearray(raw))
+        self.__typc_raw__ = storage
+        return storage
+
+    def __typc_filled__(self, received: int) -> None:
+        self_type = self.__typc_type__
+        members = self_type.__typc_members__
+        values_dict = self.__typc_value__
+        raw = self.__typc_raw__
+        assert isinstance(raw, bytearray)
+        if (received == self_type.__typc_size__
+                and len(values_dict) == len(members)):
+            codec = self_type.__typc_get_codec__()
+            if codec.flat:
+                codec.assign(values_dict, self_type.__typc_spec__.unpack(raw))
+            else:
+                codec.assign_leaves(values_dict, codec.leaf_spec.unpack(raw),
+                                    0, bytes(raw), 0)
+            return
+        for name, member_value in values_dict.items():
+            member_offset, member_type = members[name]
+            if member_offset + member_type.__typc_size__ <= received:
+                member_value.__typc_set__(self._raw_member(name))
+            elif member_offset < received:
+                member_value.__typc_set_part__(
+                    buffer_bytes(raw, member_offset,
+                                 received - member_offset), 0)
 
     def __getattr__(self, name: str) -> TypcValue:
-        if not self.__typc_inited__:
-            self._zero_init()
-        if name in self.__typc_value__:
-            return self.__typc_value__[name]
+        values_dict = self.__typc_value__
+        if name in values_dict:
+            return values_dict[name]
+        if name in self.__typc_type__.__typc_members__:
+            return self._materialize(name, self._raw_member(name))
         raise AttributeError
 
     def __setattr__(self, name: str, value: Any) -> None:
         if name in STRUCT_VALUE_ATTRS:
             _object_setattr(self, name, value)
             return
-        if not self.__typc_inited__:
-            self._zero_init()
         values_dict = self.__typc_value__
         if name in values_dict:
             current_value = values_dict[name]
             current_value.__typc_set__(value)
-            if self.__typc_child_data__ is not None:
-                parent, self_offset = self.__typc_child_data__
-                member_offset, _ = (self.__typc_type__.__typc_members__[name])
-                parent.__typc_changed__(self, bytes(current_value),
-                                        self_offset + member_offset)
+        elif name in self.__typc_type__.__typc_members__:
+            if isinstance(value, tuple):
+                current_value = self._materialize(name,
+                                                  self._raw_member(name))
+                current_value.__typc_set__(value)
+            else:
+                current_value = self._materialize(name, value)
         else:
             raise AttributeError
+        if self.__typc_child_data__ is not None:
+            parent, self_offset = self.__typc_child_data__
+            member_offset, _ = (self.__typc_type__.__typc_members__[name])
+            parent.__typc_changed__(self, bytes(current_value),
+                                    self_offset + member_offset)
 
     def __getitem__(self, name: str) -> TypcValue:
         try:
@@ -261,15 +616,137 @@ class StructValue(TypcValue):
         return name in self.__typc_type__.__typc_members__
 
     def __bytes__(self) -> bytes:
-        if not self.__typc_inited__:
-            self._zero_init()
-        raw_value: List[Any] = []
-        for value in self.__typc_value__.values():
-            if isinstance(value, TypcAtomValue):
-                raw_value.append(value.__typc_value__)
-            else:
-                raw_value.append(bytes(value))
-        return self.__typc_type__.__typc_spec__.pack(*raw_value)
+        self_type = self.__typc_type__
+        members = self_type.__typc_members__
+        if isinstance(self.__typc_raw__, tuple):
+            self._materialize_all()
+        values_dict = self.__typc_value__
+        raw = self.__typc_raw__
+        if raw is None and not values_dict:
+            return bytes(self_type.__typc_size__)
+        codec = self_type.__typc_get_codec__()
+        if not values_dict:
+            assert isinstance(raw, (bytes, bytearray))
+            return clear_padding(raw, codec.padding)
+        if len(values_dict) < len(members):
+            data = (bytearray(self_type.__typc_size__)
+                    if raw is None else bytearray(raw))
+            for name, value in values_dict.items():
+                member_offset, member_type = members[name]
+                data[member_offset:member_offset +
+                     member_type.__typc_size__] = bytes(value)
+            return clear_padding(bytes(data), codec.padding)
+        return codec.encode(values_dict)
+
+    def __typc_raw_buffer__(self) -> Any:
+        raw = self.__typc_raw__
+        if not self.__typc_value__ and isinstance(raw, (bytes, bytearray)):
+            return raw
+        return None
+
+    def __typc_buffer_source__(self) -> Any:
+        raw = self.__typc_raw_buffer__()
+        if (raw is not None
+                and not self.__typc_type__.__typc_get_codec__().padding):
+            return raw
+        return bytes(self)
+
+    def __typc_pack_into__(self, buffer: Any, offset: int) -> None:
+        self_type = self.__typc_type__
+        values_dict = self.__typc_value__
+        if values_dict and len(values_dict) == len(self_type.__typc_members__):
+            self_type.__typc_get_codec__().encode_into(values_dict, buffer,
+                                                       offset)
+        else:
+            super().__typc_pack_into__(buffer, offset)
+
+
+STRUCT_VIEW_ATTRS = ('__typc_type__', '__typc_child_data__',
+                     '__typc_buffer__', '__typc_offset__')
+
+
+class StructView(TypcValue):
+    __slots__ = ('__typc_buffer__', '__typc_offset__')
+
+    __typc_type__: StructType
+    __typc_buffer__: Any
+    __typc_offset__: int
+
+    def __init__(self, struct_type: StructType, buffer: Any,
+                 offset: int) -> None:
+        self.__typc_type__ = struct_type
+        self.__typc_child_data__ = None
+        self.__typc_buffer__ = buffer
+        self.__typc_offset__ = offset
+
+    def __typc_set__(self, value: Any) -> None:
+        self.__typc_type__.__typc_store__(self.__typc_buffer__,
+                                          self.__typc_offset__, value)
+
+    def __typc_set_part__(self, data: bytes, offset: int) -> None:
+        start = self.__typc_offset__ + offset
+        self.__typc_buffer__[start:start + len(data)] = data
+
+    def __typc_changed__(self, source: TypcValue, data: bytes,
+                         offset: int) -> None:
+        raise NotImplementedError
+
+    def __getattr__(self, name: str) -> Any:
+        members = self.__typc_type__.__typc_members__
+        if name in members:
+            member_offset, member_type = members[name]
+            return member_type.__typc_load__(
+                self.__typc_buffer__, self.__typc_offset__ + member_offset)
+        raise AttributeError
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in STRUCT_VIEW_ATTRS:
+            _object_setattr(self, name, value)
+            return
+        members = self.__typc_type__.__typc_members__
+        if name in members:
+            member_offset, member_type = members[name]
+            member_type.__typc_store__(self.__typc_buffer__,
+                                       self.__typc_offset__ + member_offset,
+                                       value)
+        else:
+            raise AttributeError
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError from None
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        try:
+            return setattr(self, name, value)
+        except AttributeError:
+            raise KeyError from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__typc_type__.__typc_members__)
+
+    def __len__(self) -> int:
+        return len(self.__typc_type__.__typc_members__)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__typc_type__.__typc_members__
+
+    def __bytes__(self) -> bytes:
+        return buffer_bytes(self.__typc_buffer__, self.__typc_offset__,
+                            self.__typc_type__.__typc_size__)
+
+    def __typc_buffer_source__(self) -> Any:
+        return buffer_slice(self.__typc_buffer__, self.__typc_offset__,
+                            self.__typc_type__.__typc_size__)
+
+    def __typc_fill_buffer__(self) -> Any:
+        return buffer_slice(self.__typc_buffer__, self.__typc_offset__,
+                            self.__typc_type__.__typc_size__)
+
+    def __typc_location__(self) -> Tuple[Any, int]:
+        return self.__typc_buffer__, self.__typc_offset__
 
 
 class StructMeta(type):
@@ -299,7 +776,7 @@ class StructMeta(type):
 
     def __instancecheck__(self, instance: Any) -> bool:
         # pylint: disable=unidiomatic-typecheck
-        if type(instance) is StructValue:
+        if type(instance) is StructValue or type(instance) is StructView:
             return True
         return false_isinstance(instance)
 
@@ -329,6 +806,77 @@ class Struct(ContainerBase, metaclass=StructMeta):
         # pylint: disable=super-init-not-called
         raise NotImplementedError
 
+    @classmethod
+    def view(cls: Type[SELF], buffer: BUFFER, offset: int = 0) -> SELF:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def cursor(cls: Type[SELF], buffer: BUFFER) -> RecordCursor[SELF]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def project(cls, fields: Iterable[str]) -> Projection:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def accessor(cls, path: str) -> Accessor:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def setter(cls, path: str) -> Setter:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def from_buffer(cls: Type[SELF], buffer: BUFFER, offset: int = 0) -> SELF:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def read(cls: Type[SELF], fileobj: BinaryIO) -> SELF:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def iter_unpack(cls: Type[SELF], buffer: BUFFER) -> Iterator[SELF]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def unpack_many(cls: Type[SELF], buffer: BUFFER) -> List[SELF]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def to_numpy_dtype(cls) -> Any:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def decode_numpy(cls, buffer: BUFFER) -> Any:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def to_columns(
+            cls,
+            buffer: BUFFER,
+            fields: Optional[Iterable[str]] = None) -> Dict[str, array[Any]]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def to_numpy_columns(
+            cls,
+            buffer: BUFFER,
+            fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
     @overload
     def __set__(self, inst: ContainerBase, value: Literal[0]) -> None:
         ...
@@ -423,6 +971,66 @@ class UntypedStructType(_UntypedStruct):
         ...  # mark as non-abstract for pylint
         raise NotImplementedError
 
+    def view(self, buffer: BUFFER, offset: int = 0) -> UntypedStructValue:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def cursor(self, buffer: BUFFER) -> RecordCursor[UntypedStructValue]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def project(self, fields: Iterable[str]) -> Projection:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def accessor(self, path: str) -> Accessor:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def setter(self, path: str) -> Setter:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def from_buffer(self,
+                    buffer: BUFFER,
+                    offset: int = 0) -> UntypedStructValue:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def read(self, fileobj: BinaryIO) -> UntypedStructValue:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def iter_unpack(self, buffer: BUFFER) -> Iterator[UntypedStructValue]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def unpack_many(self, buffer: BUFFER) -> List[UntypedStructValue]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def to_numpy_dtype(self) -> Any:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def decode_numpy(self, buffer: BUFFER) -> Any:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def to_columns(
+            self,
+            buffer: BUFFER,
+            fields: Optional[Iterable[str]] = None) -> Dict[str, array[Any]]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def to_numpy_columns(
+            self,
+            buffer: BUFFER,
+            fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
     @overload
     def __call__(self, values: Literal[None] = None) -> UntypedStructValue:
         ...
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 from struct import Struct as BuiltinStruct
-from typing import Any, Dict, Iterator, Literal, Optional, Tuple, Type, TypeVar
+from typing import (Any, BinaryIO, Dict, Iterator, List, Literal, Optional,
+                    Tuple, Type, TypeVar)
 from typing import Union as TypingUnion
 from typing import cast, overload
 
-from ._base import BaseType, ContainerBase
-from ._impl import TypcType, TypcValue
+from ._base import BUFFER, BaseType, ContainerBase
+from ._impl import TypcParent, TypcType, TypcValue
 from ._meta import MAP, MEMBER, members_from_class
 from ._modifier import Modified
-from ._utils import false_isinstance, false_issubclass
+from ._utils import (buffer_bytes, buffer_slice, check_buffer,
+                     false_isinstance, false_issubclass, members_dtype)
+from .io import RecordCursor
 from .modifier import Padding
 
 SELF = TypeVar('SELF', bound='Union')
@@ -45,12 +48,13 @@ class UnionType(TypcType):
                 max_size = member_size
         self.__typc_size__ = max_size
         self.__typc_spec__ = BuiltinStruct(f'<{max_size}s')
+        self.__typc_hash__ = hash(('union', frozenset(members_dict.items())))
 
     def __call__(
         self,
         values: TypingUnion[Literal[None], Literal[0], bytes,
                             UnionValue] = None,
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> UnionValue:
         if values == 0:
             return UnionValue(self, None, child_data)
@@ -64,15 +68,53 @@ class UnionType(TypcType):
         new_type.__typc_spec__ = self.__typc_spec__
         new_type.__typc_size__ = self.__typc_size__
         new_type.__typc_name__ = self.__typc_name__
+        new_type.__typc_hash__ = self.__typc_hash__
         new_type.__typc_members__ = self.__typc_members__
         return new_type
 
+    def __typc_children__(self) -> List[Tuple[Any, int, TypcType]]:
+        return [(name, member_offset, member_type)
+                for name, (member_offset,
+                           member_type) in self.__typc_members__.items()]
+
+    def __typc_child__(self, key: Any) -> Optional[Tuple[int, TypcType]]:
+        return self.__typc_members__.get(key)
+
+    def to_numpy_dtype(self) -> Any:
+        return members_dtype(self.__typc_members__, self.__typc_size__)
+
+    def view(self, buffer: Any, offset: int = 0) -> UnionView:
+        check_buffer(buffer, offset, self.__typc_size__)
+        return UnionView(self, buffer, offset)
+
+    def cursor(self, buffer: Any) -> RecordCursor[Any]:
+        return RecordCursor(self, buffer)
+
+    def __typc_load__(self, buffer: Any, offset: int) -> UnionView:
+        return UnionView(self, buffer, offset)
+
+    def __typc_store__(self, buffer: Any, offset: int, value: Any) -> None:
+        size = self.__typc_size__
+        if value in (None, 0):
+            value = bytes(size)
+        elif isinstance(value, (UnionValue, UnionView)):
+            value = bytes(value)
+        elif not isinstance(value, bytes):
+            raise TypeError
+        if len(value) != size:
+            raise ValueError
+        buffer[offset:offset + size] = value
+
     def __eq__(self, obj: object) -> bool:
         if obj is self:
             return True
         return (isinstance(obj, UnionType)
+                and obj.__typc_hash__ == self.__typc_hash__
                 and obj.__typc_members__ == self.__typc_members__)
 
+    def __hash__(self) -> int:
+        return self.__typc_hash__
+
     def __getattr__(self, name: str) -> TypcType:
         if name in self.__typc_members__:
             return self.__typc_members__[name][1]
@@ -93,7 +135,7 @@ class UnionType(TypcType):
         return name in self.__typc_members__
 
     def __instancecheck__(self, instance: Any) -> bool:
-        if isinstance(instance, UnionValue):
+        if isinstance(instance, (UnionValue, UnionView)):
             return instance.__typc_type__ == self
         return false_isinstance(instance)
 
@@ -113,31 +155,30 @@ class UnionValue(TypcValue):
     __slots__ = ('__typc_value__', '__typc_raw__')
 
     __typc_type__: UnionType
-    __typc_value__: Dict[str, Optional[TypcValue]]
-    __typc_raw__: bytes
+    __typc_value__: Dict[str, TypcValue]
+    __typc_raw__: bytearray
 
     def __init__(
         self,
         union_type: UnionType,
         values: Optional[TypingUnion[bytes, UnionValue, Literal[None],
                                      Literal[0]]],
-        child_data: Optional[Tuple[TypcValue, int]] = None,
+        child_data: Optional[Tuple[TypcParent, int]] = None,
     ) -> None:
         self.__typc_type__ = union_type
         self.__typc_child_data__ = child_data
         if values in (None, 0):
             value_raw = bytes(union_type.__typc_size__)
         elif isinstance(values, bytes):
+            if len(values) != union_type.__typc_size__:
+                raise ValueError
             value_raw = values
         elif isinstance(values, UnionValue):
             value_raw = bytes(values)
         else:
             raise TypeError
-        self.__typc_raw__ = value_raw
-        self.__typc_value__ = {
-            member_name: None
-            for member_name in union_type.__typc_members__.keys()
-        }
+        self.__typc_raw__ = bytearray(value_raw)
+        self.__typc_value__ = {}
 
     def __typc_set__(self, value: Any) -> None:
         self_type = self.__typc_type__
@@ -150,13 +191,13 @@ class UnionValue(TypcValue):
             new_value = bytes(value)
         else:
             raise TypeError
-        self.__typc_raw__ = new_value
-        values_dict = self.__typc_value__
-        for ((member_offset, member_type),
-             prev_val) in zip(self_type.__typc_members__.values(),
-                              tuple(values_dict.values())):
-            if prev_val is None:
-                continue
+        raw = self.__typc_raw__
+        if len(new_value) != len(raw):
+            raise ValueError
+        raw[:] = new_value
+        members = self_type.__typc_members__
+        for name, prev_val in self.__typc_value__.items():
+            member_offset, member_type = members[name]
             member_raw = new_value[member_offset:member_offset +
                                    member_type.__typc_size__]
             prev_val.__typc_set__(member_raw)
@@ -170,18 +211,14 @@ class UnionValue(TypcValue):
 
     def _set_part_impl(self, data: bytes, offset: int,
                        exclude: Optional[TypcValue]) -> None:
-        prev_raw = self.__typc_raw__
-        self.__typc_raw__ = (prev_raw[:offset] + data +
-                             prev_raw[offset + len(data):])
-        for name, (member_offset, member_type) in (
-                self.__typc_type__.__typc_members__.items()):
+        self.__typc_raw__[offset:offset + len(data)] = data
+        members = self.__typc_type__.__typc_members__
+        for name, member_value in self.__typc_value__.items():
+            member_offset, member_type = members[name]
             member_size = member_type.__typc_size__
             offset_diff = member_offset - offset
             if (offset_diff >= len(data)) or (member_size + offset_diff <= 0):
                 continue
-            member_value = self.__typc_value__[name]
-            if member_value is None:
-                continue
             if member_value is not exclude:
                 if member_offset <= offset:
                     member_value.__typc_set_part__(
@@ -194,16 +231,15 @@ class UnionValue(TypcValue):
             parent.__typc_changed__(self, data, self_offset + offset)
 
     def __getattr__(self, name: str) -> TypcValue:
-        if name not in self.__typc_value__:
-            raise AttributeError
-        value = self.__typc_value__[name]
+        value = self.__typc_value__.get(name)
         if value is None:
-            member_offset, member_type = (
-                self.__typc_type__.__typc_members__[name])
+            members = self.__typc_type__.__typc_members__
+            if name not in members:
+                raise AttributeError
+            member_offset, member_type = members[name]
             value = member_type(
-                self.__typc_raw__[member_offset:member_offset +
-                                  member_type.__typc_size__],
-                (self, member_offset))
+                buffer_bytes(self.__typc_raw__, member_offset,
+                             member_type.__typc_size__), (self, member_offset))
             self.__typc_value__[name] = value
         return value
 
@@ -211,11 +247,12 @@ class UnionValue(TypcValue):
         if name in UNION_VALUE_ATTRS:
             _object_setattr(self, name, value)
             return
-        values_dict = self.__typc_value__
-        if name not in values_dict:
+        members = self.__typc_type__.__typc_members__
+        if name not in members:
             raise AttributeError
-        member_value = values_dict[name]
-        member_offset, member_type = self.__typc_type__.__typc_members__[name]
+        values_dict = self.__typc_value__
+        member_value = values_dict.get(name)
+        member_offset, member_type = members[name]
         if member_value is None:
             new_value = member_type(value, (self, member_offset))
             values_dict[name] = new_value
@@ -246,8 +283,110 @@ class UnionValue(TypcValue):
         return name in self.__typc_type__.__typc_members__
 
     def __bytes__(self) -> bytes:
+        return bytes(self.__typc_raw__)
+
+    def __typc_buffer_source__(self) -> Any:
         return self.__typc_raw__
 
+    def __typc_fill_buffer__(self) -> Any:
+        return self.__typc_raw__
+
+    def __typc_filled__(self, received: int) -> None:
+        raw = self.__typc_raw__
+        members = self.__typc_type__.__typc_members__
+        for name, member_value in self.__typc_value__.items():
+            member_offset, member_type = members[name]
+            member_value.__typc_set__(
+                buffer_bytes(raw, member_offset, member_type.__typc_size__))
+
+
+UNION_VIEW_ATTRS = ('__typc_type__', '__typc_child_data__', '__typc_buffer__',
+                    '__typc_offset__')
+
+
+class UnionView(TypcValue):
+    __slots__ = ('__typc_buffer__', '__typc_offset__')
+
+    __typc_type__: UnionType
+    __typc_buffer__: Any
+    __typc_offset__: int
+
+    def __init__(self, union_type: UnionType, buffer: Any,
+                 offset: int) -> None:
+        self.__typc_type__ = union_type
+        self.__typc_child_data__ = None
+        self.__typc_buffer__ = buffer
+        self.__typc_offset__ = offset
+
+    def __typc_set__(self, value: Any) -> None:
+        self.__typc_type__.__typc_store__(self.__typc_buffer__,
+                                          self.__typc_offset__, value)
+
+    def __typc_set_part__(self, data: bytes, offset: int) -> None:
+        start = self.__typc_offset__ + offset
+        self.__typc_buffer__[start:start + len(data)] = data
+
+    def __typc_changed__(self, source: TypcValue, data: bytes,
+                         offset: int) -> None:
+        raise NotImplementedError
+
+    def __getattr__(self, name: str) -> Any:
+        members = self.__typc_type__.__typc_members__
+        if name in members:
+            member_offset, member_type = members[name]
+            return member_type.__typc_load__(
+                self.__typc_buffer__, self.__typc_offset__ + member_offset)
+        raise AttributeError
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in UNION_VIEW_ATTRS:
+            _object_setattr(self, name, value)
+            return
+        members = self.__typc_type__.__typc_members__
+        if name in members:
+            member_offset, member_type = members[name]
+            member_type.__typc_store__(self.__typc_buffer__,
+                                       self.__typc_offset__ + member_offset,
+                                       value)
+        else:
+            raise AttributeError
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError from None
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        try:
+            return setattr(self, name, value)
+        except AttributeError:
+            raise KeyError from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__typc_type__.__typc_members__)
+
+    def __len__(self) -> int:
+        return len(self.__typc_type__.__typc_members__)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__typc_type__.__typc_members__
+
+    def __bytes__(self) -> bytes:
+        return buffer_bytes(self.__typc_buffer__, self.__typc_offset__,
+                            self.__typc_type__.__typc_size__)
+
+    def __typc_buffer_source__(self) -> Any:
+        return buffer_slice(self.__typc_buffer__, self.__typc_offset__,
+                            self.__typc_type__.__typc_size__)
+
+    def __typc_fill_buffer__(self) -> Any:
+        return buffer_slice(self.__typc_buffer__, self.__typc_offset__,
+                            self.__typc_type__.__typc_size__)
+
+    def __typc_location__(self) -> Tuple[Any, int]:
+        return self.__typc_buffer__, self.__typc_offset__
+
 
 class UnionMeta(type):
     # pylint: disable=bad-mcs-method-argument
@@ -276,7 +415,7 @@ class UnionMeta(type):
 
     def __instancecheck__(self, instance: Any) -> bool:
         # pylint: disable=unidiomatic-typecheck
-        if type(instance) is UnionValue:
+        if type(instance) is UnionValue or type(instance) is UnionView:
             return True
         return false_isinstance(instance)
 
@@ -302,6 +441,36 @@ class Union(ContainerBase, metaclass=UnionMeta):
         # pylint: disable=super-init-not-called
         raise NotImplementedError
 
+    @classmethod
+    def view(cls: Type[SELF], buffer: BUFFER, offset: int = 0) -> SELF:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def cursor(cls: Type[SELF], buffer: BUFFER) -> RecordCursor[SELF]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def from_buffer(cls: Type[SELF], buffer: BUFFER, offset: int = 0) -> SELF:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def read(cls: Type[SELF], fileobj: BinaryIO) -> SELF:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def to_numpy_dtype(cls) -> Any:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    @classmethod
+    def decode_numpy(cls, buffer: BUFFER) -> Any:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
     @overload
     def __set__(self, inst: ContainerBase, value: Literal[0]) -> None:
         ...
@@ -393,6 +562,32 @@ class UntypedUnionType(_UntypedUnion):
         ...  # mark as non-abstract for pylint
         raise NotImplementedError
 
+    def view(self, buffer: BUFFER, offset: int = 0) -> UntypedUnionValue:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def cursor(self, buffer: BUFFER) -> RecordCursor[UntypedUnionValue]:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def from_buffer(self,
+                    buffer: BUFFER,
+                    offset: int = 0) -> UntypedUnionValue:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def read(self, fileobj: BinaryIO) -> UntypedUnionValue:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def to_numpy_dtype(self) -> Any:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
+    def decode_numpy(self, buffer: BUFFER) -> Any:
+        ...  # mark as non-abstract for pylint
+        raise NotImplementedError
+
     @overload
     def __call__(self, values: Literal[None] = None) -> UntypedUnionValue:
         ...
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Type, TypeVar, Union, cast, overload
+from contextlib import contextmanager
+from typing import (Any, Iterator, Optional, Type, TypeVar, Union, cast,
+                    overload)
 
 from ._base import BaseType
-from ._impl import TypcType, TypcValue
-from .structure import (Struct, StructType, StructValue, UntypedStructType,
-                        UntypedStructValue)
+from ._impl import TypcType, TypcValue, is_interned, resolve_path
+from .structure import (Struct, StructType, StructValue, StructView,
+                        UntypedStructType, UntypedStructValue)
 from .union import Union as UnionT
-from .union import UnionType, UnionValue, UntypedUnionType, UntypedUnionValue
+from .union import (UnionType, UnionValue, UnionView, UntypedUnionType,
+                    UntypedUnionValue)
 
 TYPE = TypeVar('TYPE', bound=BaseType)
 
@@ -19,13 +22,19 @@ def typeof(obj: TYPE) -> Type[TYPE]:
     raise TypeError(f'{obj!r} is not typc value')
 
 
-def sizeof(obj: Union[BaseType, Type[BaseType]]) -> int:
+def sizeof(obj: Union[BaseType, Type[BaseType]],
+           field: Optional[str] = None) -> int:
     obj_: Any = obj
-    if isinstance(obj_, TypcType):
-        return obj_.__typc_size__
     if isinstance(obj_, TypcValue):
-        return obj_.__typc_type__.__typc_size__
-    raise TypeError(f'{obj!r} is not typc type/value')
+        obj_ = obj_.__typc_type__
+    elif not isinstance(obj_, TypcType):
+        raise TypeError(f'{obj!r} is not typc type/value')
+    if field is None:
+        return obj_.__typc_size__
+    member = obj_.__typc_child__(field)
+    if member is None:
+        member = resolve_path(obj_, field)
+    return member[1].__typc_size__
 
 
 def offsetof(
@@ -34,11 +43,21 @@ def offsetof(
     field: str,
 ) -> int:
     obj_: Any = obj
-    if isinstance(obj_, (StructValue, UnionValue)):
-        return obj_.__typc_type__.__typc_members__[field][0]
-    if isinstance(obj_, (StructType, UnionType)):
-        return obj_.__typc_members__[field][0]
-    raise TypeError(f'{obj!r} is not struct/union type/value')
+    if isinstance(obj_, (StructValue, StructView, UnionValue, UnionView)):
+        obj_ = obj_.__typc_type__
+    elif not isinstance(obj_, (StructType, UnionType)):
+        raise TypeError(f'{obj!r} is not struct/union type/value')
+    member = obj_.__typc_members__.get(field)
+    if member is not None:
+        return member[0]
+    return resolve_path(obj_, field)[0]
+
+
+def as_buffer(obj: BaseType) -> memoryview:
+    obj_: Any = obj
+    if isinstance(obj_, TypcValue):
+        return obj_.__buffer__(0)
+    raise TypeError(f'{obj!r} is not typc value')
 
 
 def type_name(obj: Union[BaseType, Type[BaseType]]) -> str:
@@ -85,11 +104,71 @@ def clone_type(orig: Any, *, name: str = INHERITED) -> Any:
     return new_type
 
 
-def rename(type_: Union[Type[TYPE], UntypedStructType, UntypedUnionType],
-           name: str) -> None:
+@overload
+def rename(type_: UntypedStructType, name: str) -> UntypedStructType:
+    ...
+
+
+@overload
+def rename(type_: UntypedUnionType, name: str) -> UntypedUnionType:
+    ...
+
+
+@overload
+def rename(type_: Type[TYPE], name: str) -> Type[TYPE]:
+    ...
+
+
+def rename(type_: Any, name: str) -> Any:
     name_: Any = name
     if not isinstance(type_, TypcType):
         raise TypeError(f'{type_!r} is not typc type')
     if not isinstance(name_, str):
         raise TypeError(f'Type name must be str, not {name_!r}')
+    if is_interned(type_):
+        type_ = type_.__typc_clone__()
     type_.__typc_name__ = name
+    return type_
+
+
+class _BatchCollector:
+    __slots__ = ('__typc_start__', '__typc_end__')
+
+    __typc_start__: Optional[int]
+    __typc_end__: int
+
+    def __init__(self) -> None:
+        self.__typc_start__ = None
+        self.__typc_end__ = 0
+
+    def __typc_changed__(self, source: TypcValue, data: bytes,
+                         offset: int) -> None:
+        end = offset + len(data)
+        start = self.__typc_start__
+        if start is None or offset < start:
+            self.__typc_start__ = offset
+        if end > self.__typc_end__:
+            self.__typc_end__ = end
+
+
+@contextmanager
+def batch(value: TYPE) -> Iterator[TYPE]:
+    value_: Any = value
+    if not isinstance(value_, TypcValue):
+        raise TypeError(f'{value!r} is not typc value')
+    child_data = value_.__typc_child_data__
+    if child_data is None:
+        yield value
+        return
+    parent, self_offset = child_data
+    collector = _BatchCollector()
+    value_.__typc_child_data__ = (collector, self_offset)
+    try:
+        yield value
+    finally:
+        value_.__typc_child_data__ = child_data
+        start = collector.__typc_start__
+        if start is not None:
+            data = bytes(value_)[start - self_offset:collector.__typc_end__ -
+                                 self_offset]
+            parent.__typc_changed__(value_, data, start)